@@ -0,0 +1,59 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Compares the best-five-of-seven table path with scoring all 21 five-card
+subsets. Run from the Poker directory: python benchmarks/BenchSevenCard.py
+'''
+
+import os
+import random
+import sys
+import time
+from itertools import combinations
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from poker import Deck
+from poker import Evaluator
+
+
+def naive(codes):
+    """Build a reference-scored Hand for each of the 21 subsets."""
+    best = None
+    for five in combinations(codes, 5):
+        hand = Deck.Hand([Deck.Card.by_code[code].name for code in five])
+        hand.evaluator = Evaluator.reference
+        if best is None or hand.strength() > best:
+            best = hand.strength()
+    return best
+
+
+def subsets(codes):
+    """Look up each of the 21 subsets in the five-card tables."""
+    return max(Evaluator.lookup.lookup_codes(five) for five in combinations(codes, 5))
+
+
+def seven(codes):
+    return Evaluator.lookup.lookup_best_codes(codes)
+
+
+def timed(function, hands):
+    start = time.perf_counter()
+    results = [function(hand) for hand in hands]
+    return time.perf_counter() - start, results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    deal = random.Random(2016)
+    hands = [deal.sample(range(52), 7) for _ in range(count)]
+    Evaluator.lookup.build_best()
+    baseline, expected = timed(naive, hands)
+    print("{:<24}{:>12}{:>10}".format("path", "hands/s", "speedup"))
+    for name, function in (("21 Hand objects", naive), ("21 table lookups", subsets),
+                           ("best of seven", seven)):
+        seconds, results = timed(function, hands)
+        assert results == expected, name
+        print("{:<24}{:>12.0f}{:>9.0f}x".format(name, count / seconds, baseline / seconds))
@@ -0,0 +1,263 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Times the hand-evaluation hot paths on fixed-seed workloads and compares
+them with a stored baseline. Run from the Poker directory:
+
+    python benchmarks/Benchmarks.py --save benchmarks/baseline.json
+    python benchmarks/Benchmarks.py --baseline benchmarks/baseline.json
+
+The second form exits with status 1 if any benchmark is slower than the
+baseline by more than --threshold.
+'''
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from poker import Canonical
+from poker import Deck
+from poker import Equity
+from poker import Evaluator
+from poker.Poker import OneDeckTwoPlayerGame
+
+RANKS = Deck.Card.ranks
+SUITS = Deck.Card.suits
+
+
+def uniform(deal, count):
+    """Hands of five cards drawn from a full deck."""
+    deck = Deck.Deck(seed=deal.getrandbits(64))
+    codes = deck.deals(count, 5)
+    return [[Deck.Card.by_code[code].name for code in codes[i * 5:(i + 1) * 5]]
+            for i in range(count)]
+
+
+def pairs(deal, count):
+    """Hands holding exactly one pair."""
+    hands = []
+    for _ in range(count):
+        pair, *kickers = deal.sample(RANKS, 4)
+        hand = [pair + suit for suit in deal.sample(SUITS, 2)]
+        hand += [rank + deal.choice(SUITS) for rank in kickers]
+        hands.append(hand)
+    return hands
+
+
+def flushes(deal, count):
+    """Hands of five cards of one suit."""
+    return [[rank + suit for rank in deal.sample(RANKS, 5)]
+            for suit in (deal.choice(SUITS) for _ in range(count))]
+
+
+def ties(deal, count):
+    """Pairs of hands with the same ranks in rotated suits, so every game is a draw."""
+    games = []
+    for hand in uniform(deal, count):
+        rotated = [card[0] + SUITS[(SUITS.index(card[1]) + 1) % 4] for card in hand]
+        games.append((hand, rotated))
+    return games
+
+
+def matchups(deal, count):
+    """Two independent uniform hands per game."""
+    hands = uniform(deal, 2 * count)
+    return list(zip(hands[::2], hands[1::2]))
+
+
+def repeats(deal, count):
+    """Uniform hands drawn from a pool of count // 20, so most of them come up again."""
+    pool = uniform(deal, max(1, count // 20))
+    return [deal.choice(pool) for _ in range(count)]
+
+
+def spots():
+    """Exact-equity spots whose free suits the enumeration can fold together."""
+    return [Equity.Spot([["AS", "KS"], ["QS", "JS"]], board=["TS", "9S"], hole_size=2, board_size=5),
+            Equity.Spot([["AS", "AH"], ["KS", "KH"]], board=["2C", "7D", "9C"],
+                        hole_size=2, board_size=5)]
+
+
+def bench_construct(hands):
+    for hand in hands:
+        Deck.Hand(hand)
+
+
+def bench_win_pattern(hands):
+    for hand in hands:
+        hand.win_pattern()
+
+
+def bench_score(hands):
+    for hand in hands:
+        hand.score()
+
+
+def bench_strength(hands):
+    for hand in hands:
+        hand.strength()
+
+
+def bench_exact(enumerations):
+    for enumeration in enumerations:
+        Equity.enumerate_range((enumeration, 0, enumeration.outer))
+
+
+def bench_lookup(codes):
+    lookup = Evaluator.lookup.lookup_codes
+    for hand in codes:
+        lookup(hand)
+
+
+def bench_beats(games):
+    for hand_1, hand_2 in games:
+        hand_1.beats(hand_2)
+
+
+def bench_game(games):
+    for hand_1, hand_2 in games:
+        OneDeckTwoPlayerGame(hand_1, hand_2).player_one_wins()
+
+
+def as_hands(workload):
+    return [Deck.Hand(hand) for hand in workload]
+
+
+def as_games(workload):
+    return [(Deck.Hand(hand_1), Deck.Hand(hand_2)) for hand_1, hand_2 in workload]
+
+
+def as_reference_hands(workload, cache=None):
+    hands = as_hands(workload)
+    for hand in hands:
+        hand.evaluator = Evaluator.reference
+        hand.cache = cache
+    return hands
+
+
+def as_cached_hands(workload):
+    """Reference-scored hands sharing a new Canonical.StrengthCache."""
+    return as_reference_hands(workload, Canonical.StrengthCache())
+
+
+def as_enumerations(workload, symmetric=True):
+    enumerations = [Equity.Enumeration(spot) for spot in workload]
+    if not symmetric:
+        for enumeration in enumerations:
+            enumeration.free = []
+    return enumerations
+
+
+def as_unreduced_enumerations(workload):
+    """Enumerations that score every deal, one per suit renaming included."""
+    return as_enumerations(workload, symmetric=False)
+
+
+def as_codes(workload):
+    return [[Deck.Card(card).code for card in hand] for hand in workload]
+
+
+def benchmarks(count, seed):
+    """(name, function, prepare, workload) for every benchmark.
+
+    prepare runs before each timed repeat and outside the timing, so cached
+    strengths on Hand objects never carry over between repeats.
+    """
+    deal = random.Random(seed)
+    workloads = {"uniform": uniform(deal, count), "pairs": pairs(deal, count),
+                 "flushes": flushes(deal, count)}
+    games = {"matchups": matchups(deal, count), "ties": ties(deal, count)}
+    repeated = repeats(deal, count)
+    suite = []
+    for name, workload in workloads.items():
+        suite.append(("Hand/" + name, bench_construct, list, workload))
+        suite.append(("win_pattern/" + name, bench_win_pattern, as_hands, workload))
+        suite.append(("score/" + name, bench_score, as_hands, workload))
+        suite.append(("lookup_codes/" + name, bench_lookup, as_codes, workload))
+    for name, workload in games.items():
+        suite.append(("beats/" + name, bench_beats, as_games, workload))
+        suite.append(("player_one_wins/" + name, bench_game, as_games, workload))
+    suite.append(("reference/repeats", bench_strength, as_reference_hands, repeated))
+    suite.append(("reference+cache/repeats", bench_strength, as_cached_hands, repeated))
+    suite.append(("Equity.exact/spots", bench_exact, as_enumerations, spots()))
+    suite.append(("Equity.exact/unreduced", bench_exact, as_unreduced_enumerations, spots()))
+    try:
+        from poker import Batch
+    except ImportError:
+        pass
+    else:
+        for name, workload in workloads.items():
+            suite.append(("Batch.evaluate/" + name, Batch.evaluate, Batch.encode, workload))
+    return suite
+
+
+def run(count, seed, repeats, only=None):
+    Evaluator.lookup.build()
+    results = {}
+    for name, function, prepare, workload in benchmarks(count, seed):
+        if only and only not in name:
+            continue
+        best = None
+        for _ in range(repeats):
+            data = prepare(workload)
+            start = time.perf_counter()
+            function(data)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        results[name] = {"seconds": best, "per_second": len(workload) / best}
+    return {"python": platform.python_version(), "machine": platform.machine(),
+            "count": count, "seed": seed, "repeats": repeats, "results": results}
+
+
+def regressions(report, baseline, threshold):
+    """Benchmarks whose throughput dropped by more than threshold (a fraction)."""
+    slower = []
+    for name, result in report["results"].items():
+        before = baseline["results"].get(name)
+        if before and result["per_second"] < before["per_second"] * (1 - threshold):
+            slower.append((name, before["per_second"], result["per_second"]))
+    return slower
+
+
+def parser():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--count", type=int, default=20000, help="hands or games per workload")
+    parser.add_argument("--seed", type=int, default=2016)
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs; the fastest counts")
+    parser.add_argument("--only", help="run benchmarks whose name contains this")
+    parser.add_argument("--save", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown against the baseline, as a fraction")
+    return parser
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    report = run(args.count, args.seed, args.repeats, args.only)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.save:
+        with open(args.save, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        slower = regressions(report, baseline, args.threshold)
+        for name, before, after in slower:
+            print("REGRESSION {}: {:.0f}/s -> {:.0f}/s".format(name, before, after), file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import numpy
+
+from poker import Deck
+from poker import WinPatterns
+
+
+def encode(rows):
+    """Turn rows of card strings (or space-separated lines) into an (N, k) code array.
+
+    Codes are Deck.Card.code: rank value (0 for '2' .. 12 for 'A') times four
+    plus the index of the suit in Deck.Card.suits.
+    """
+    codes = [[Deck.Card(card).code for card in (row.split() if isinstance(row, str) else row)]
+             for row in rows]
+    return numpy.array(codes, dtype=numpy.uint8).reshape(len(codes), -1)
+
+
+def evaluate(cards, chunk_size=1 << 16):
+    """Score an (N, 5) array of card codes, or a list of card-string rows.
+
+    Returns two arrays of length N: the WinPatterns.order index of each hand
+    and its strength key, identical to Hand.score() and Hand.strength().
+    """
+    if not isinstance(cards, numpy.ndarray):
+        cards = encode(cards)
+    if cards.ndim != 2 or cards.shape[1] != 5:
+        raise ValueError("expected an (N, 5) array of card codes, got shape {}".format(cards.shape))
+    scores = numpy.empty(len(cards), dtype=numpy.int8)
+    strengths = numpy.empty(len(cards), dtype=numpy.int32)
+    for start in range(0, len(cards), chunk_size):
+        stop = start + chunk_size
+        scores[start:stop], strengths[start:stop] = _evaluate_chunk(cards[start:stop])
+    return scores, strengths
+
+
+def _evaluate_chunk(cards):
+    cards = cards.astype(numpy.int32)
+    ranks = cards >> 2
+    suits = cards & 3
+    # How many cards in the hand share each card's rank.
+    counts = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2)
+
+    paired_cards = (counts == 2).sum(axis=1)
+    pair = paired_cards == 2
+    two_pair = paired_cards == 4
+    trips = (counts == 3).any(axis=1)
+    quads = (counts == 4).any(axis=1)
+    top = ranks.max(axis=1)
+    straight = (counts == 1).all(axis=1) & (top - ranks.min(axis=1) == 4)
+    flush = (suits == suits[:, :1]).all(axis=1)
+
+    order = WinPatterns.order
+    conditions = [straight & flush & (top == 12), straight & flush, quads, pair & trips,
+                  flush, straight, trips, two_pair, pair]
+    patterns = [WinPatterns.RoyalFlush, WinPatterns.StraightFlush, WinPatterns.FourOfAKind,
+                WinPatterns.FullHouse, WinPatterns.Flush, WinPatterns.Straight,
+                WinPatterns.ThreeOfAKind, WinPatterns.TwoPair, WinPatterns.Pair]
+    scores = numpy.select(conditions, [order.index(pattern) for pattern in patterns],
+                          default=order.index(WinPatterns.HighCard))
+
+    # Order cards by multiplicity, then rank, to lay out the kicker nibbles.
+    grouped = -numpy.sort(-(counts * 16 + ranks), axis=1)
+    strengths = len(order) - 1 - scores
+    for i in range(5):
+        strengths = strengths << 4 | ((grouped[:, i] & 15) + 1)
+    return scores, strengths
+
+
+def deal(deck, count, size, chunk_size=1 << 16):
+    """count random hands of size cards from a Deck.Deck, as a (count, size) code array.
+
+    Each hand is drawn from the whole deck without replacement; the deck's
+    own random stream seeds the generator, so a seeded deck deals the same
+    batch every time.
+    """
+    generator = numpy.random.default_rng(deck.random.getrandbits(64))
+    codes = numpy.array(deck.codes, dtype=numpy.uint8)
+    if not 0 < size <= len(codes):
+        raise ValueError("cannot deal {} of {} cards".format(size, len(codes)))
+    dealt = numpy.empty((count, size), dtype=numpy.uint8)
+    for start in range(0, count, chunk_size):
+        rows = min(chunk_size, count - start)
+        taken = numpy.empty((rows, 0), dtype=numpy.int64)
+        for i in range(size):
+            # Pick among the len(codes) - i untaken positions, then step over
+            # the taken ones, smallest first, to find the real position.
+            position = generator.integers(0, len(codes) - i, rows)
+            for column in range(i):
+                position += position >= taken[:, column]
+            dealt[start:start + rows, i] = codes[position]
+            taken = numpy.sort(numpy.column_stack([taken, position]), axis=1)
+    return dealt
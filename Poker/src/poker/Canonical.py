@@ -0,0 +1,84 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+from collections import OrderedDict
+
+from poker import Evaluator
+
+
+def canonical_codes(hands):
+    """Suit-isomorphic canonical form of one or more hands of Card codes.
+
+    Each suit is described by the ranks it holds in every hand, and suits
+    are relabelled in order of that description. Hands that differ only by
+    a renaming of suits get the same form. Returns one sorted tuple of codes
+    per hand.
+    """
+    signatures = [[[] for _ in hands] for _ in range(4)]
+    for position, hand in enumerate(hands):
+        for code in sorted(hand, reverse=True):
+            signatures[code & 3][position].append(code >> 2)
+    relabel = [0] * 4
+    for label, suit in enumerate(sorted(range(4), key=signatures.__getitem__, reverse=True)):
+        relabel[suit] = label
+    return tuple(tuple(sorted(code - (code & 3) + relabel[code & 3] for code in hand))
+                 for hand in hands)
+
+
+def canonical_form(*hands):
+    """canonical_codes of Deck.Hand objects, for a single hand or a matchup."""
+    return canonical_codes([[card.code for card in hand.cards] for hand in hands])
+
+
+class StrengthCache:
+    """A size-limited least-recently-used cache.
+
+    Set Deck.Hand.cache to an instance to put it in front of the reference
+    evaluator, keyed on the evaluator and the hand's canonical form, so
+    hands that are suit permutations of each other share an entry; table
+    evaluators answer faster than the key can be built, so their strengths
+    are computed directly. get() caches anything else under any key, such
+    as Equity.exact results under the canonical form of their spot.
+    """
+    def __init__(self, maxsize=1 << 16):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, compute):
+        """The value cached for key, calling compute() to fill it on a miss."""
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self.entries[key] = compute()
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def strength(self, hand, evaluator=None):
+        evaluator = evaluator or Evaluator.lookup
+        if not isinstance(evaluator, Evaluator.ReferenceEvaluator):
+            return evaluator.strength(hand)
+        key = (evaluator, canonical_form(hand))
+        return self.get(key, lambda: evaluator.strength(hand))
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "size": len(self.entries), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,258 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import argparse
+import sys
+from itertools import islice
+
+from poker import Deck
+from poker import Evaluator
+from poker import HandFile
+from poker import WinPatterns
+
+CODES = {name: card.code for name, card in Deck.Card.interned.items()}
+OUTCOMES = {1: '1', -1: '2', 0: 'D'}
+JOKER = Deck.Card.joker.code  # the lowest code a hand file record cannot hold
+
+
+def codes_of(names):
+    """Card codes of card strings."""
+    try:
+        return [CODES[name] for name in names]
+    except KeyError as error:
+        raise ValueError("not a card: {!r}".format(error.args[0])) from None
+
+
+def strength_of(names):
+    """Strength key of a hand given as card strings, without building a Hand."""
+    return Evaluator.lookup.strength_of_codes(codes_of(names))
+
+
+def parse(line):
+    """Card codes of both hands in a ten-card line, or None for a blank line."""
+    names = line.split()
+    if not names:
+        return None
+    if len(names) != 10:
+        raise ValueError("expected 10 cards, got {}".format(len(names)))
+    codes = codes_of(names)
+    return codes[:5], codes[5:]
+
+
+def play(line):
+    """Strength keys of both hands in a ten-card line, or None for a blank line."""
+    game = parse(line)
+    if game is None:
+        return None
+    strength_of_codes = Evaluator.lookup.strength_of_codes
+    return strength_of_codes(game[0]), strength_of_codes(game[1])
+
+
+def outcome(strength_1, strength_2):
+    """1 if player one wins, -1 if player two wins, 0 for a draw."""
+    return (strength_1 > strength_2) - (strength_1 < strength_2)
+
+
+class Summary:
+    """Running totals over played games.
+
+    categories counts both hands of every game by WinPatterns.order index;
+    margins counts decided games by how many categories separate the winner
+    from the loser, 0 meaning the same category decided on ranks. Summaries
+    of shards merge into the summary of the whole.
+    """
+    def __init__(self):
+        self.games = 0
+        self.outcomes = {1: 0, -1: 0, 0: 0}
+        self.categories = [0] * len(WinPatterns.order)
+        self.margins = [0] * len(WinPatterns.order)
+
+    def add(self, strength_1, strength_2):
+        self.games += 1
+        result = outcome(strength_1, strength_2)
+        self.outcomes[result] += 1
+        score_1, score_2 = Evaluator.score_of(strength_1), Evaluator.score_of(strength_2)
+        self.categories[score_1] += 1
+        self.categories[score_2] += 1
+        if result:
+            self.margins[abs(score_1 - score_2)] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        for result, count in other.outcomes.items():
+            self.outcomes[result] += count
+        self.categories = [a + b for a, b in zip(self.categories, other.categories)]
+        self.margins = [a + b for a, b in zip(self.margins, other.margins)]
+        return self
+
+    def __add__(self, other):
+        return Summary().merge(self).merge(other)
+
+    def win_rate(self):
+        """Player one's share of the games won."""
+        return self.outcomes[1] / self.games if self.games else 0.0
+
+    def draw_rate(self):
+        return self.outcomes[0] / self.games if self.games else 0.0
+
+    def to_dict(self):
+        return {"games": self.games, "player_1_wins": self.outcomes[1],
+                "player_2_wins": self.outcomes[-1], "draws": self.outcomes[0],
+                "categories": {pattern.__name__: count
+                               for pattern, count in zip(WinPatterns.order, self.categories)},
+                "margins": dict(enumerate(self.margins))}
+
+    def lines(self):
+        yield "games {}".format(self.games)
+        yield "player_1_wins {}".format(self.outcomes[1])
+        yield "player_2_wins {}".format(self.outcomes[-1])
+        yield "draws {}".format(self.outcomes[0])
+        for pattern, count in zip(WinPatterns.order, self.categories):
+            yield "{} {}".format(pattern.__name__, count)
+        for margin, count in enumerate(self.margins):
+            yield "margin_{} {}".format(margin, count)
+
+
+def chunks(lines, size):
+    """Yield lists of at most size lines, so only one chunk is held at a time."""
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_lines(lines, first=1):
+    """Card codes of both hands for each game in text lines, numbered from first in errors."""
+    for number, line in enumerate(lines, first):
+        try:
+            game = parse(line)
+        except ValueError as error:
+            raise ValueError("line {}: {}".format(number, error)) from None
+        if game is not None:
+            yield game
+
+
+def parse_records(records, first=1):
+    """Card codes of both hands for each ten-code record of a HandFile,
+    numbered from first in errors."""
+    for number, record in enumerate(records, first):
+        codes = record.tolist()
+        if max(codes) >= JOKER:
+            raise ValueError("record {}: not a card code: {}".format(number, max(codes)))
+        yield codes[:5], codes[5:]
+
+
+def evaluate(games, evaluator=None):
+    """Strength keys of both hands for each pair of card code lists, under
+    evaluator (Evaluator.lookup by default)."""
+    strength_of_codes = (evaluator or Evaluator.lookup).strength_of_codes
+    for codes_1, codes_2 in games:
+        yield strength_of_codes(codes_1), strength_of_codes(codes_2)
+
+
+def games_in_lines(lines, first=1):
+    """Strength keys of both hands for each game in text lines, numbered from first in errors."""
+    return evaluate(parse_lines(lines, first))
+
+
+def games_in_records(records, first=1):
+    """Strength keys of both hands for each ten-code record of a HandFile,
+    numbered from first in errors."""
+    return evaluate(parse_records(records, first))
+
+
+def tally(games, totals, out=None, chunk_size=1 << 14):
+    """Add games to totals, writing one outcome per game to out if given."""
+    for chunk in chunks(games, chunk_size):
+        for game in chunk:
+            totals.add(*game)
+        if out is not None and chunk:
+            out.write('\n'.join(OUTCOMES[outcome(*game)] for game in chunk) + '\n')
+    return totals
+
+
+def play_lines(lines, totals, out=None, chunk_size=1 << 14, first=1):
+    return tally(games_in_lines(lines, first), totals, out, chunk_size)
+
+
+def report(games, out, summary=False, chunk_size=1 << 14):
+    """Play games, writing one outcome per game or a summary."""
+    totals = tally(games, Summary(), None if summary else out, chunk_size)
+    if summary:
+        out.write('\n'.join(totals.lines()) + '\n')
+    return totals
+
+
+def run(lines, out, summary=False, chunk_size=1 << 14):
+    """Play every game in text lines, writing one outcome per game or a summary."""
+    return report(games_in_lines(lines), out, summary, chunk_size)
+
+
+def parser():
+    parser = argparse.ArgumentParser(
+        prog="poker", description="Play two-player games, one per line of ten cards.")
+    parser.add_argument("file", nargs="?", default="-",
+                        help="text or binary hand file, or - for standard input (default)")
+    parser.add_argument("--summary", action="store_true",
+                        help="print only win and category counts")
+    parser.add_argument("--chunk-size", type=int, default=1 << 14,
+                        help="lines read and written per batch")
+    parser.add_argument("--buffer-size", type=int, default=1 << 20,
+                        help="bytes of input buffering")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to shard a file across, 0 for one per core")
+    parser.add_argument("--shard-size", type=int, default=1 << 23,
+                        help="bytes of input per shard when using several workers")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write sharded outcomes as shards finish instead of in input order")
+    parser.add_argument("--shared-tables", action="store_true",
+                        help="give workers one copy of the lookup tables in shared memory")
+    return parser
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    binary = False
+    if args.file != "-":
+        try:
+            binary = HandFile.is_hand_file(args.file)
+        except OSError as error:
+            sys.exit("poker: {}".format(error))
+    if args.workers != 1 and args.file != "-":
+        from poker import Parallel
+        try:
+            Parallel.run(args.file, sys.stdout, args.summary, args.workers or None,
+                         args.shard_size, not args.unordered, args.shared_tables)
+        except ValueError as error:
+            sys.exit("poker: {}".format(error))
+        return
+    if binary:
+        with HandFile.HandFile(args.file) as hand_file:
+            if hand_file.cards_per_record != 10:
+                sys.exit("poker: expected 10 cards per record, got {}".format(
+                    hand_file.cards_per_record))
+            try:
+                report(games_in_records(hand_file), sys.stdout, args.summary, args.chunk_size)
+            except ValueError as error:
+                sys.exit("poker: {}".format(error))
+        return
+    if args.file == "-":
+        source = sys.stdin
+    else:
+        source = open(args.file, 'r', buffering=args.buffer_size)
+    try:
+        run(source, sys.stdout, args.summary, args.chunk_size)
+    except ValueError as error:
+        sys.exit("poker: {}".format(error))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,185 @@
-'''
-Created on Jun 4, 2016
-
-@author: Daniel
-'''
-
-from poker import WinPatterns
-
-class Card:
-    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
-    
-    """A playing card that has rank and suit."""
-    def __init__(self, string):
-        self.rank = string[0]
-        self.suit = string[1]
-    
-    def __lt__(self, other):
-        return Card.ranks.index(self.rank) < Card.ranks.index(other.rank)
-    
-    def __eq__(self, other):
-        return self.rank == other.rank
-    
-    def __str__(self):
-        return self.rank + self.suit
-        
-
-class Hand:
-    """An ordered collection of cards."""   
-    def __init__(self, card_strings):
-        self.cards = sorted([Card(string) for string in card_strings], reverse=True)
-      
-    def win_pattern(self):
-        for pattern in WinPatterns.order:
-            if pattern(self).criterion():
-                return pattern(self)
-            
-    def score(self):
-        return WinPatterns.order.index(self.win_pattern().__class__)
-    
-    def beats(self, other):
-        return self.win_pattern().trumps(other.win_pattern())
-    
-    def __str__(self):
-        hand = ' '.join(str(card) for card in self.cards)
-        return "{}: {}".format(hand, self.win_pattern()) 
-    
-
-if __name__ == "__main__":
-    import unittest
-    import sys
-    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
-    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
+'''
+Created on Jun 4, 2016
+
+@author: Daniel
+'''
+
+import random
+from array import array
+
+from poker import WinPatterns
+from poker import Evaluator
+from poker import RankIndex
+
+class Card:
+    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A']
+    suits = ['C', 'D', 'H', 'S']
+    
+    """A playing card that has rank and suit.
+    
+    There is one shared, immutable instance per card: value is the rank's
+    index in ranks, suit_value the suit's index in suits, and code packs
+    both as value * 4 + suit_value. Cards order by rank only, but are
+    equal and hash alike only when they are the same card.
+    
+    Card.joker ("XX") is the one card outside the 52: it has code 52 and
+    ranks above an ace, and only a WildEvaluator can score it.
+    """
+    __slots__ = ('rank', 'suit', 'value', 'suit_value', 'code', 'name')
+    interned = {}
+    
+    def __new__(cls, string):
+        if isinstance(string, Card):
+            return string
+        try:
+            return Card.interned[string]
+        except KeyError:
+            if string == "XX":
+                return Card.joker
+            raise ValueError("not a card: {!r}".format(string)) from None
+    
+    @classmethod
+    def _intern(cls, value, suit_value):
+        card = object.__new__(cls)
+        fields = {'rank': cls.ranks[value], 'suit': cls.suits[suit_value],
+                  'value': value, 'suit_value': suit_value,
+                  'code': value * 4 + suit_value}
+        fields['name'] = fields['rank'] + fields['suit']
+        for field, field_value in fields.items():
+            object.__setattr__(card, field, field_value)
+        cls.interned[card.name] = card
+        return card
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("cards are immutable")
+    
+    def __reduce__(self):
+        return (Card, (self.name,))
+    
+    def __lt__(self, other):
+        return self.value < other.value
+    
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.code == other.code
+    
+    def __hash__(self):
+        return self.code
+    
+    def __str__(self):
+        return self.name
+    
+    def __repr__(self):
+        return "Card({!r})".format(self.name)
+
+Card.by_code = [Card._intern(value, suit_value)
+                for value in range(len(Card.ranks))
+                for suit_value in range(len(Card.suits))]
+Card.joker = object.__new__(Card)
+for field, field_value in (('rank', 'X'), ('suit', 'X'), ('value', len(Card.ranks)),
+                           ('suit_value', len(Card.suits)), ('code', 52), ('name', 'XX')):
+    object.__setattr__(Card.joker, field, field_value)
+Card.by_code.append(Card.joker)
+        
+
+class Hand:
+    """An ordered collection of cards."""   
+    evaluator = None # Evaluator.lookup unless set
+    cache = None # e.g. a Canonical.StrengthCache shared by all hands
+    
+    def __init__(self, card_strings):
+        self.cards = sorted([Card(string) for string in card_strings], reverse=True)
+        self._strength = None
+      
+    def win_pattern(self):
+        return (self.evaluator or Evaluator.lookup).pattern_of(self.strength())(self)
+            
+    def score(self):
+        return (self.evaluator or Evaluator.lookup).score_of(self.strength())
+    
+    def strength(self):
+        """An integer key; the better of two hands has the larger key."""
+        if self._strength is None:
+            evaluator = self.evaluator or Evaluator.lookup
+            if self.cache is None:
+                self._strength = evaluator.strength(self)
+            else:
+                self._strength = self.cache.strength(self, evaluator)
+        return self._strength
+    
+    def beats(self, other):
+        return self.strength() > other.strength()
+
+    def rank(self):
+        """1 for the best class of five-card hand, up to 7462 for the worst."""
+        return RankIndex.of(self.evaluator).rank(self.strength())
+
+    def percentile(self):
+        """Share of the five-card hands that this hand beats."""
+        return RankIndex.of(self.evaluator).percentile(self.strength())
+    
+    def __str__(self):
+        hand = ' '.join(str(card) for card in self.cards)
+        return "{}: {}".format(hand, self.win_pattern()) 
+    
+
+class Deck:
+    """A pack of cards held as an array of Card codes, dealt from the end.
+    
+    Dealing hands out codes rather than Card objects; Card.by_code turns a
+    code back into its card when one is needed.
+    """
+    def __init__(self, dead=(), seed=None, jokers=0):
+        dead = set(Card(card).code for card in dead)
+        self.codes = array('B', (code for code in range(52) if code not in dead))
+        self.codes.extend([Card.joker.code] * jokers)
+        self.random = random.Random(seed)
+    
+    def __len__(self):
+        return len(self.codes)
+    
+    def remove(self, cards):
+        """Take dead cards out of the deck."""
+        dead = set(Card(card).code for card in cards)
+        self.codes = array('B', (code for code in self.codes if code not in dead))
+    
+    def shuffle(self):
+        self.random.shuffle(self.codes)
+    
+    def deal(self, count):
+        """Remove and return count codes from the end of the deck."""
+        if count > len(self.codes):
+            raise ValueError("cannot deal {} of {} cards".format(count, len(self.codes)))
+        dealt = self.codes[len(self.codes) - count:]
+        del self.codes[len(self.codes) - count:]
+        return dealt
+    
+    def deal_hands(self, players, size):
+        """Deal size cards to each player from the top of the deck, as one flat array."""
+        return self.deal(players * size)
+    
+    def deals(self, count, size):
+        """count independent random hands of size cards, as one flat array.
+        
+        Each hand is drawn from the whole deck, which is left as it was.
+        Row i is codes[i * size:(i + 1) * size]. Dealt in bulk by Batch.deal
+        when numpy is installed, one hand at a time otherwise.
+        """
+        try:
+            from poker import Batch
+        except ImportError:
+            sample = self.random.sample
+            codes = self.codes
+            dealt = array('B')
+            for _ in range(count):
+                dealt.extend(sample(codes, size))
+            return dealt
+        return array('B', Batch.deal(self, count, size).tobytes())
+    
+
+if __name__ == "__main__":
+    import unittest
+    import sys
+    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
+    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
@@ -0,0 +1,208 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import math
+from itertools import combinations, combinations_with_replacement
+from multiprocessing import Pool
+
+import numpy
+
+from poker import Canonical
+from poker import Deck
+from poker import Evaluator
+from poker import WinPatterns
+
+
+class Paytable:
+    """Payout per unit bet for each WinPatterns class.
+
+    With minimum_pair (a rank such as 'J'), pairs below that rank pay
+    nothing; patterns missing from pays pay nothing.
+    """
+    def __init__(self, name, pays, minimum_pair=None):
+        self.name = name
+        self.pays = dict(pays)
+        self.minimum_pair = None if minimum_pair is None else Deck.Card.ranks.index(minimum_pair)
+
+    def pay(self, strength, evaluator):
+        pattern = evaluator.pattern_of(strength)
+        if pattern is WinPatterns.Pair and self.minimum_pair is not None:
+            # The pair's rank is the first nibble below the category.
+            if (strength >> (Evaluator.CATEGORY_SHIFT - 4) & 0xF) - 1 < self.minimum_pair:
+                return 0
+        return self.pays.get(pattern, 0)
+
+    def __repr__(self):
+        return "Paytable({!r})".format(self.name)
+
+
+JACKS_OR_BETTER = Paytable("9/6 jacks or better", {
+    WinPatterns.RoyalFlush: 800, WinPatterns.StraightFlush: 50, WinPatterns.FourOfAKind: 25,
+    WinPatterns.FullHouse: 9, WinPatterns.Flush: 6, WinPatterns.Straight: 4,
+    WinPatterns.ThreeOfAKind: 3, WinPatterns.TwoPair: 2, WinPatterns.Pair: 1}, minimum_pair='J')
+
+# C(available, wanted) for up to four cards of a rank left in the deck.
+CHOOSE = numpy.array([[math.comb(available, wanted) for wanted in range(6)]
+                      for available in range(5)], dtype=numpy.int64)
+
+
+class Draws:
+    """Every multiset of k ranks a draw can bring, k = 0..5, as parallel arrays.
+
+    counts[k] has a row of 13 per-rank counts for each multiset; products[k]
+    is its product of rank primes, masks[k] its rank mask and distinct[k]
+    whether its ranks are all different (the only draws that can complete
+    a flush).
+    """
+    def __init__(self):
+        self.counts, self.products, self.masks, self.distinct = [], [], [], []
+        for size in range(6):
+            rows = [values for values in combinations_with_replacement(range(13), size)
+                    if all(values.count(value) <= 4 for value in values)]
+            counts = numpy.zeros((len(rows), 13), dtype=numpy.int64)
+            for row, values in enumerate(rows):
+                for value in values:
+                    counts[row, value] += 1
+            self.counts.append(counts)
+            self.products.append(numpy.prod(numpy.array(Evaluator.PRIMES) ** counts, axis=1))
+            self.masks.append((counts > 0) @ (1 << numpy.arange(13)))
+            self.distinct.append(counts.max(axis=1, initial=0) <= 1)
+
+
+class Solver:
+    """Expected value of every hold in five-card draw under a paytable.
+
+    A hold keeps some of the five cards and draws the rest from the 47
+    left, or fewer given dead cards. Draws are counted by rank multiset rather than dealt: the number
+    of draws with given ranks is a product of binomials over the deck's
+    per-rank counts, computed once per hand and shared by every hold that
+    draws as many cards, and only suited holds look for flushes. Payouts
+    of every five-card rank multiset (and every flush rank mask) are
+    tabulated once per solver.
+    """
+    def __init__(self, paytable=JACKS_OR_BETTER, evaluator=None):
+        self.paytable = paytable
+        self.evaluator = evaluator or Evaluator.lookup
+        self.draws = None
+        self.products = None
+        self.pays = None
+        self.flush_pays = None
+
+    def build(self):
+        evaluator = self.evaluator
+        if evaluator.products is None:
+            evaluator.build()
+        self.draws = Draws()
+        products = self.draws.products[5]
+        order = numpy.argsort(products)
+        self.products = products[order]
+        self.pays = numpy.array([self.paytable.pay(evaluator.lookup_values(values), evaluator)
+                                 for values in combinations_with_replacement(range(13), 5)
+                                 if all(values.count(value) <= 4 for value in values)],
+                                dtype=numpy.float64)[order]
+        self.flush_pays = numpy.zeros(1 << 13)
+        for values in combinations(range(13), 5):
+            mask = sum(1 << value for value in values)
+            self.flush_pays[mask] = self.paytable.pay(evaluator.flushes[mask], evaluator)
+
+    def evs(self, codes, dead=()):
+        """Expected payout of each of the 32 holds of five card codes.
+
+        Draws come from the rest of the deck less any dead card codes, such
+        as cards seen elsewhere. Returns a list indexed by hold mask: bit i
+        set keeps codes[i].
+        """
+        if self.draws is None:
+            self.build()
+        if len(codes) != 5 or len(set(codes)) != 5:
+            raise ValueError("need five different cards")
+        gone = set(codes) | set(dead)
+        if len(gone) != 5 + len(dead) or 52 - len(gone) < 5:
+            raise ValueError("dead cards must be different, outside the hand and leave five to draw")
+        draws = self.draws
+        left = numpy.full(13, 4, dtype=numpy.int64)
+        suited = numpy.ones((4, 13), dtype=numpy.int64)
+        for code in gone:
+            left[code >> 2] -= 1
+            suited[code & 3, code >> 2] = 0
+        ways = [numpy.prod(CHOOSE[left, counts], axis=1) for counts in draws.counts]
+        # flushable[k][suit]: draws of k distinct ranks all still there in that suit.
+        flushable = [[draws.distinct[size] & (draws.counts[size] <= suited[suit]).all(axis=1)
+                      for suit in range(4)] for size in range(6)]
+        evs = []
+        for hold in range(32):
+            kept = [code for position, code in enumerate(codes) if hold >> position & 1]
+            size = 5 - len(kept)
+            product = 1
+            mask = 0
+            for code in kept:
+                product *= Evaluator.PRIMES[code >> 2]
+                mask |= 1 << (code >> 2)
+            index = numpy.searchsorted(self.products, draws.products[size] * product)
+            pays = self.pays[numpy.minimum(index, len(self.pays) - 1)]
+            total = float(ways[size] @ pays)
+            suits = set(code & 3 for code in kept)
+            if len(suits) <= 1:
+                for suit in suits or range(4):
+                    flush = flushable[size][suit]
+                    total += float((self.flush_pays[draws.masks[size][flush] | mask]
+                                    - pays[flush]).sum())
+            evs.append(total / math.comb(52 - len(gone), size))
+        return evs
+
+    def solve(self, cards):
+        """The best hold of five cards (Card objects or names) and its expected payout."""
+        codes = [Deck.Card(card).code for card in cards]
+        evs = self.evs(codes)
+        hold = max(range(32), key=evs.__getitem__)
+        kept = [Deck.Card.by_code[code] for position, code in enumerate(codes) if hold >> position & 1]
+        return kept, evs[hold]
+
+
+def canonical_hands():
+    """Each suit-isomorphic class of five-card hands with the number of hands in it."""
+    classes = {}
+    for codes in combinations(range(52), 5):
+        key = Canonical.canonical_codes([codes])[0]
+        classes[key] = classes.get(key, 0) + 1
+    return classes
+
+
+def solve_chunk(job):
+    solver, hands = job
+    results = []
+    for codes in hands:
+        evs = solver.evs(list(codes))
+        hold = max(range(32), key=evs.__getitem__)
+        results.append((codes, hold, evs[hold]))
+    return results
+
+
+def strategy(solver=None, workers=1, chunk_size=512, hands=None):
+    """Best hold and its expected payout for every canonical starting hand.
+
+    Returns a dict from canonical codes to (hold mask, ev) and the average
+    return over all 2,598,960 deals, weighting each class by its size.
+    hands (a dict like canonical_hands() returns) restricts the work to
+    some classes.
+    """
+    solver = solver or Solver()
+    if solver.draws is None:
+        solver.build()
+    hands = canonical_hands() if hands is None else hands
+    keys = list(hands)
+    jobs = [(solver, keys[start:start + chunk_size]) for start in range(0, len(keys), chunk_size)]
+    table = {}
+    if workers == 1:
+        results = map(solve_chunk, jobs)
+        for chunk in results:
+            table.update((codes, (hold, ev)) for codes, hold, ev in chunk)
+    else:
+        with Pool(workers) as pool:
+            for chunk in pool.imap_unordered(solve_chunk, jobs):
+                table.update((codes, (hold, ev)) for codes, hold, ev in chunk)
+    total = sum(hands.values())
+    return table, sum(table[codes][1] * count for codes, count in hands.items()) / total
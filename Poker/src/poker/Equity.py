@@ -0,0 +1,307 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import math
+import random
+import time
+from fractions import Fraction
+from itertools import combinations
+from multiprocessing import Pool
+
+from poker import Canonical
+from poker import Deck
+from poker import Evaluator
+
+
+class Spot:
+    """Known cards for each player, a shared board and dead cards.
+
+    Every player ends up with hole_size private cards plus board_size shared
+    ones and is scored on the best five of them; unknown cards are dealt
+    from what is left of the deck.
+    """
+    def __init__(self, hands, board=(), dead=(), hole_size=5, board_size=0):
+        self.hands = [[Deck.Card(card).code for card in hand] for hand in hands]
+        self.board = [Deck.Card(card).code for card in board]
+        self.dead = [Deck.Card(card).code for card in dead]
+        self.hole_size = hole_size
+        self.board_size = board_size
+        known = [code for hand in self.hands for code in hand] + self.board + self.dead
+        if len(set(known)) != len(known):
+            raise ValueError("a card is dealt more than once")
+        if len(self.hands) < 2:
+            raise ValueError("need at least two players")
+        if any(len(hand) > hole_size for hand in self.hands) or len(self.board) > board_size:
+            raise ValueError("more cards known than a player or the board holds")
+        if hole_size + board_size < 5:
+            raise ValueError("players need at least five cards")
+        self.remaining = [code for code in range(52) if code not in set(known)]
+        self.missing = [hole_size - len(hand) for hand in self.hands]
+        self.missing_board = board_size - len(self.board)
+        self.unknown = sum(self.missing) + self.missing_board
+        if self.unknown > len(self.remaining):
+            raise ValueError("not enough cards left to deal")
+
+    def winners(self, dealt):
+        """Indices of the winning players once dealt fills the unknown cards in order."""
+        board = self.board + list(dealt[:self.missing_board])
+        position = self.missing_board
+        strengths = []
+        for hand, missing in zip(self.hands, self.missing):
+            cards = hand + list(dealt[position:position + missing]) + board
+            position += missing
+            strengths.append(Evaluator.lookup.strength_of_codes(cards))
+        best = max(strengths)
+        return [player for player, strength in enumerate(strengths) if strength == best]
+
+    def canonical(self):
+        """A key shared by every spot that differs from this one only by a renaming of suits."""
+        return (Canonical.canonical_codes(self.hands + [self.board, self.dead]),
+                self.hole_size, self.board_size)
+
+
+class EquityResult:
+    """Win, tie and pot-share tallies per player over a number of deals.
+
+    An exact result keeps its tallies as integers and Fractions, and reports
+    rates as Fractions.
+    """
+    def __init__(self, players, exact=False):
+        self.exact = exact
+        self.deals = 0
+        self.wins = [0] * players
+        self.ties = [0] * players
+        self.shares = [Fraction(0) if exact else 0.0] * players
+        self.squares = [Fraction(0) if exact else 0.0] * players
+
+    def ratio(self, part):
+        return Fraction(part, self.deals) if self.exact else part / self.deals
+
+    def add(self, winners, weight=1):
+        self.deals += weight
+        share = Fraction(1, len(winners)) if self.exact else 1 / len(winners)
+        tally = self.wins if len(winners) == 1 else self.ties
+        for player in winners:
+            tally[player] += weight
+            self.shares[player] += share * weight
+            self.squares[player] += share * share * weight
+
+    def merge(self, other):
+        self.deals += other.deals
+        for tallies, others in ((self.wins, other.wins), (self.ties, other.ties),
+                                (self.shares, other.shares), (self.squares, other.squares)):
+            for player, value in enumerate(others):
+                tallies[player] += value
+
+    def win(self, player):
+        return self.ratio(self.wins[player])
+
+    def tie(self, player):
+        return self.ratio(self.ties[player])
+
+    def loss(self, player):
+        return 1 - self.win(player) - self.tie(player)
+
+    def equity(self, player):
+        """Expected share of the pot, counting a k-way split as 1/k."""
+        return self.ratio(self.shares[player])
+
+    def confidence_interval(self, player, z=1.96):
+        """Normal-approximation interval around equity(player); z=1.96 is 95%."""
+        mean = self.equity(player)
+        if self.exact:
+            return mean, mean
+        variance = max(self.squares[player] / self.deals - mean * mean, 0.0)
+        margin = z * math.sqrt(variance / self.deals)
+        return mean - margin, mean + margin
+
+    def __str__(self):
+        return '\n'.join("Player {}: {:.2%} win, {:.2%} tie, {:.2%} loss, equity {:.2%} ({:.2%}-{:.2%})".format(
+            player + 1, self.win(player), self.tie(player), self.loss(player),
+            self.equity(player), *self.confidence_interval(player))
+            for player in range(len(self.wins)))
+
+
+def simulate(job):
+    """Deal random completions of a spot until the sample or time budget runs out."""
+    spot, samples, seconds, seed = job
+    deal = random.Random(seed)
+    result = EquityResult(len(spot.hands))
+    deadline = None if seconds is None else time.monotonic() + seconds
+    remaining, unknown = spot.remaining, spot.unknown
+    while samples is None or result.deals < samples:
+        # Check the clock every so often rather than on every deal.
+        batch = 256 if samples is None else min(256, samples - result.deals)
+        for _ in range(batch):
+            result.add(spot.winners(deal.sample(remaining, unknown)))
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    return result
+
+
+def monte_carlo(spot, samples=10000, seconds=None, seed=None, workers=1):
+    """Estimate each player's equity in a spot from random deals.
+
+    Stops after samples deals or seconds of wall-clock time, whichever comes
+    first (either may be None, not both). With a seed, results are
+    reproducible for a given number of workers; each worker draws from its
+    own stream derived from the seed.
+    """
+    if samples is None and seconds is None:
+        raise ValueError("need a sample budget or a time budget")
+    streams = random.Random(seed)
+    jobs = []
+    for worker in range(workers):
+        share = None if samples is None else samples // workers + (worker < samples % workers)
+        jobs.append((spot, share, seconds, streams.getrandbits(64)))
+    if workers == 1:
+        return simulate(jobs[0])
+    result = EquityResult(len(spot.hands))
+    with Pool(workers) as pool:
+        for partial in pool.map(simulate, jobs):
+            result.merge(partial)
+    return result
+
+
+def unrank(index, n, k):
+    """The index-th k-combination of range(n), in lexicographic order."""
+    combination = []
+    element = 0
+    for left in range(k, 0, -1):
+        while math.comb(n - element - 1, left - 1) <= index:
+            index -= math.comb(n - element - 1, left - 1)
+            element += 1
+        combination.append(element)
+        element += 1
+    return combination
+
+
+class Enumeration:
+    """Every completion of a spot, numbered so ranges can be split across workers.
+
+    The unknown slots (the board, then each player) are dealt in that order.
+    An outer deal number is read as mixed-radix digits: one combination index
+    per slot before the last one dealt to, each unranked over the cards still
+    undealt, then the position of that last slot's lowest card. The rest of
+    the last slot is walked under each outer deal.
+
+    Suits that no known card uses are interchangeable. Only one deal of each
+    orbit under renaming them is scored, the one whose free suits hold
+    non-increasing signatures (the ranks a suit holds in each slot), weighted
+    by the size of the orbit; outer deals that cannot lead to one are skipped
+    whole. Signatures compare as tuples of rank masks, one per slot.
+    """
+    def __init__(self, spot):
+        self.spot = spot
+        self.slots = [spot.missing_board] + spot.missing
+        self.sizes = []
+        undealt = len(spot.remaining)
+        for slot in self.slots:
+            self.sizes.append(math.comb(undealt, slot))
+            undealt -= slot
+        self.total = math.prod(self.sizes)
+        self.last = max([i for i, slot in enumerate(self.slots) if slot], default=0)
+        slot = self.slots[self.last]
+        lowest = len(spot.remaining) - sum(self.slots[:self.last]) - slot + 1 if slot else 1
+        self.outer = math.prod(self.sizes[:self.last]) * lowest
+        known = set(code for code in range(52) if code not in spot.remaining)
+        self.free = [suit for suit in range(4) if all(code & 3 != suit for code in known)]
+
+    def deals(self, number):
+        """(codes, weight) for each deal scored under outer deal number.
+
+        codes fill the unknown cards in slot order, as Spot.winners takes them.
+        """
+        undealt = list(self.spot.remaining)
+        parts = []
+        for slot, size in zip(self.slots[:self.last], self.sizes):
+            number, index = divmod(number, size)
+            positions = unrank(index, len(undealt), slot)
+            parts.append(tuple(undealt[position] for position in positions))
+            for position in reversed(positions):
+                del undealt[position]
+        dealt = [code for part in parts for code in part]
+        slot = self.slots[self.last]
+        symmetric = len(self.free) > 1
+        if symmetric:
+            signatures = self.signatures(parts)
+            if not orbit(signatures):
+                return
+        if not slot:
+            yield dealt, orbit(signatures) if symmetric else 1
+            return
+        lowest = undealt[number]
+        for rest in combinations(undealt[number + 1:], slot - 1):
+            last = (lowest,) + rest
+            weight = 1
+            if symmetric:
+                masks = [0] * 4
+                for code in last:
+                    masks[code & 3] |= 1 << (code >> 2)
+                weight = orbit([signature + (masks[suit],)
+                                for signature, suit in zip(signatures, self.free)])
+            if weight:
+                yield dealt + list(last), weight
+
+    def signatures(self, parts):
+        """For each free suit in order, the mask of the ranks it holds in each part."""
+        signatures = []
+        for suit in self.free:
+            signatures.append(tuple(sum(1 << (code >> 2) for code in part if code & 3 == suit)
+                                    for part in parts))
+        return signatures
+
+
+def orbit(signatures):
+    """Size of the orbit of a deal whose free suits hold these signatures,
+    or 0 if they are out of order and the deal is not its representative.
+
+    Renaming free suits with equal signatures leaves the deal as it is, so
+    k free suits give k! / (m1! m2! ...) distinct deals for runs of m1, m2,
+    ... equal signatures. Signatures of only the first slots tell whether
+    any completion can be in order.
+    """
+    size = math.factorial(len(signatures))
+    run = 1
+    for before, after in zip(signatures, signatures[1:]):
+        if before < after:
+            return 0
+        run = run + 1 if before == after else 1
+        size //= run
+    return size
+
+
+def enumerate_range(job):
+    """Score outer deals start..stop of an enumeration exactly."""
+    enumeration, start, stop = job
+    spot = enumeration.spot
+    result = EquityResult(len(spot.hands), exact=True)
+    for number in range(start, stop):
+        for dealt, weight in enumeration.deals(number):
+            result.add(spot.winners(dealt), weight)
+    return result
+
+
+def exact(spot, workers=1, chunks_per_worker=4, cache=None):
+    """Each player's exact equity in a spot, enumerating every completion.
+
+    With a cache (such as a Canonical.StrengthCache), spots that differ only
+    by a renaming of suits are enumerated once.
+    """
+    if cache is not None:
+        return cache.get(('exact', spot.canonical()),
+                         lambda: exact(spot, workers, chunks_per_worker))
+    enumeration = Enumeration(spot)
+    if workers == 1:
+        return enumerate_range((enumeration, 0, enumeration.outer))
+    pieces = workers * chunks_per_worker
+    bounds = [enumeration.outer * piece // pieces for piece in range(pieces + 1)]
+    jobs = [(enumeration, start, stop) for start, stop in zip(bounds, bounds[1:])]
+    result = EquityResult(len(spot.hands), exact=True)
+    with Pool(workers) as pool:
+        for partial in pool.imap(enumerate_range, jobs):
+            result.merge(partial)
+    return result
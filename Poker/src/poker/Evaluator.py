@@ -0,0 +1,480 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+from itertools import combinations, combinations_with_replacement
+
+from poker import Deck
+from poker import TableCache
+from poker import WinPatterns
+
+ACE = 12
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+CATEGORY_SHIFT = 20
+
+
+class Rules:
+    """A ranking variant, classifying five rank values from one histogram.
+
+    lowest is the value of the deck's lowest rank (4, a six, for a short
+    deck); with ace_low the ace also plays below it in straights. order
+    lists the WinPatterns classes from best to worst. Under lowball
+    (ace-to-five) aces are low, straights and flushes do not count and
+    lower cards are better. With five_of_a_kind, WinPatterns.FiveOfAKind
+    (which only wild cards make) ranks above every other hand, or below
+    them under lowball. Strength keys have the same layout for every
+    variant: the category (a position in order, counted from the worst)
+    above CATEGORY_SHIFT and five rank nibbles below it, so a larger key
+    is always the better hand.
+    """
+    def __init__(self, name, lowest=0, ace_low=False, order=None, lowball=False,
+                 five_of_a_kind=False):
+        self.name = name
+        self.lowest = lowest
+        self.ace_low = ace_low
+        self.lowball = lowball
+        self.order = list(order or WinPatterns.order)
+        self.five_of_a_kind = five_of_a_kind
+        if five_of_a_kind:
+            self.order.insert(len(self.order) if lowball else 0, WinPatterns.FiveOfAKind)
+        self.categories = {pattern: len(self.order) - 1 - position
+                           for position, pattern in enumerate(self.order)}
+        self.patterns = self.order[::-1]
+        # FiveOfAKind has no place in WinPatterns.order and scores -1.
+        self.scores = [WinPatterns.order.index(pattern) if pattern in WinPatterns.order else -1
+                       for pattern in self.patterns]
+        self.codes = [code for code in range(52) if code >> 2 >= lowest]
+        # Rank mask of each straight, and the nibbles it is ranked by.
+        self.straights = {}
+        for high in range(lowest + 4, ACE + 1):
+            values = range(high, high - 5, -1)
+            self.straights[sum(1 << value for value in values)] = [value + 1 for value in values]
+        if ace_low:
+            values = range(lowest + 3, lowest - 1, -1)
+            self.straights[sum(1 << value for value in values) | 1 << ACE] = \
+                [value + 1 for value in values] + [0]
+
+    def classify(self, values, flush):
+        """The WinPatterns class of five rank values and the nibbles that rank it."""
+        counts = [0] * 13
+        mask = 0
+        for value in values:
+            counts[value] += 1
+            mask |= 1 << value
+        if self.lowball:
+            groups = sorted(((counts[value], (value + 1) % 13) for value in range(13) if counts[value]),
+                            reverse=True)
+            nibbles = [13 - low for count, low in groups for _ in range(count)]
+        else:
+            groups = sorted(((counts[value], value) for value in range(13) if counts[value]),
+                            reverse=True)
+            nibbles = [value + 1 for count, value in groups for _ in range(count)]
+        first = groups[0][0]
+        second = groups[1][0] if len(groups) > 1 else 0
+        if first == 5:
+            return WinPatterns.FiveOfAKind, nibbles
+        if first == 4:
+            return WinPatterns.FourOfAKind, nibbles
+        if first == 3:
+            return (WinPatterns.FullHouse if second == 2 else WinPatterns.ThreeOfAKind), nibbles
+        if first == 2:
+            return (WinPatterns.TwoPair if second == 2 else WinPatterns.Pair), nibbles
+        if self.lowball:
+            return WinPatterns.HighCard, nibbles
+        straight = self.straights.get(mask)
+        if straight is not None and flush:
+            ace_high = straight[0] == ACE + 1
+            return (WinPatterns.RoyalFlush if ace_high else WinPatterns.StraightFlush), straight
+        if flush:
+            return WinPatterns.Flush, nibbles
+        if straight is not None:
+            return WinPatterns.Straight, straight
+        return WinPatterns.HighCard, nibbles
+
+    def strength(self, values, flush):
+        """Strength key of five rank values under these rules.
+
+        Fewer values (the cards a stud hand shows so far) are keyed the same
+        way, with a zero nibble for each missing card.
+        """
+        pattern, nibbles = self.classify(values, flush)
+        key = self.categories[pattern]
+        for nibble in nibbles + [0] * (5 - len(nibbles)):
+            key = key << 4 | nibble
+        return key
+
+    def score_of(self, strength):
+        """The WinPatterns.order index of a strength key under these rules."""
+        return self.scores[strength >> CATEGORY_SHIFT]
+
+    def pattern_of(self, strength):
+        """The WinPatterns class of a strength key under these rules."""
+        return self.patterns[strength >> CATEGORY_SHIFT]
+
+    def key(self):
+        """Everything that decides the tables these rules build, as a string."""
+        return "{} lowest={} ace_low={} lowball={} order={}".format(
+            self.name, self.lowest, self.ace_low, self.lowball,
+            ','.join(pattern.__name__ for pattern in self.order))
+
+    def __repr__(self):
+        return "Rules({!r})".format(self.name)
+
+
+STANDARD = Rules("standard")
+ACE_LOW = Rules("ace-low", ace_low=True)
+SHORT_DECK = Rules("short deck", lowest=4, ace_low=True,
+                   order=[WinPatterns.RoyalFlush, WinPatterns.StraightFlush,
+                          WinPatterns.FourOfAKind, WinPatterns.Flush, WinPatterns.FullHouse,
+                          WinPatterns.Straight, WinPatterns.ThreeOfAKind, WinPatterns.TwoPair,
+                          WinPatterns.Pair, WinPatterns.HighCard])
+ACE_TO_FIVE = Rules("ace-to-five", lowball=True,
+                    order=[WinPatterns.HighCard, WinPatterns.Pair, WinPatterns.TwoPair,
+                           WinPatterns.ThreeOfAKind, WinPatterns.FullHouse,
+                           WinPatterns.FourOfAKind])
+FIVE_OF_A_KIND = Rules("five of a kind", five_of_a_kind=True)
+
+
+def pack(score, values):
+    """Pack a WinPatterns.order index and rank values into a strength key.
+
+    The category sits above CATEGORY_SHIFT and below it one nibble per card,
+    grouped by multiplicity and then by rank, so a larger key is a better hand.
+    """
+    groups = sorted(((values.count(value), value) for value in set(values)), reverse=True)
+    ranks = [value + 1 for count, value in groups for _ in range(count)][:5]
+    ranks += [0] * (5 - len(ranks))
+    key = len(WinPatterns.order) - 1 - score
+    for rank in ranks:
+        key = key << 4 | rank
+    return key
+
+
+def score_of(strength):
+    """Return the WinPatterns.order index of a strength key."""
+    return len(WinPatterns.order) - 1 - (strength >> CATEGORY_SHIFT)
+
+
+class ReferenceEvaluator:
+    """Classifies a hand by trying each WinPattern in order."""
+    def win_pattern(self, hand):
+        for pattern in WinPatterns.order:
+            if pattern(hand).criterion():
+                return pattern(hand)
+
+    def score(self, hand):
+        return WinPatterns.order.index(self.win_pattern(hand).__class__)
+
+    def score_of(self, strength):
+        return score_of(strength)
+
+    def pattern_of(self, strength):
+        return WinPatterns.order[score_of(strength)]
+
+    def strength(self, hand):
+        values = [card.value for card in hand.cards]
+        return pack(self.score(hand), values)
+
+
+class LookupEvaluator:
+    """Ranks five-card hands with tables covering every rank multiset.
+
+    Flushes and hands of five distinct ranks are indexed by a 13-bit rank
+    mask; everything else by the product of one prime per rank. Hands the
+    tables do not cover (fewer than five or more than seven cards, repeated
+    cards) fall back to the reference evaluator. Six- and seven-card hands
+    have tables of their own, holding the best five-card entry, built on
+    first use by build_best(), and score as their best five cards.
+
+    The tables are filled in by a Rules variant, so every variant is looked
+    up exactly as fast as the standard one; hands a variant's tables do not
+    cover are classified by the rules directly. Built tables are kept in
+    the TableCache. Once cached, the six- and seven-card ones are looked up
+    in place in the cache file, whose pages every process shares.
+    """
+    FIVE_CARD_TABLES = ('flushes', 'unique_fives', 'products')
+    BEST_TABLES = ('best_flushes', 'best_products')
+
+    def __init__(self, rules=STANDARD):
+        self.rules = rules
+        self.flushes = None
+        self.unique_fives = None
+        self.products = None
+        self.best_flushes = None
+        self.best_products = None
+
+    def build(self):
+        """Fill in the five-card tables, from the table cache if it has them."""
+        tables = TableCache.load(self.table_key(), self.FIVE_CARD_TABLES)
+        if tables is not None:
+            for name, table in tables.items():
+                setattr(self, name, table)
+            return
+        self.build_five()
+        TableCache.store(self.table_key(), {name: getattr(self, name)
+                                            for name in self.FIVE_CARD_TABLES})
+
+    def build_five(self):
+        flushes = [None] * (1 << 13)
+        unique_fives = [None] * (1 << 13)
+        products = {}
+        rules = self.rules
+        for values in combinations_with_replacement(range(rules.lowest, 13), 5):
+            if any(values.count(value) > 4 for value in values):
+                continue
+            if len(set(values)) == 5:
+                mask = sum(1 << value for value in values)
+                flushes[mask] = rules.strength(values, True)
+                unique_fives[mask] = rules.strength(values, False)
+            else:
+                product = 1
+                for value in values:
+                    product *= PRIMES[value]
+                products[product] = rules.strength(values, False)
+        self.flushes = flushes
+        self.unique_fives = unique_fives
+        self.products = products
+
+    def build_best(self):
+        """Tables of the best five of six or seven cards, built from the five-card ones."""
+        if self.products is None:
+            self.build()
+        if self.best_products is not None:
+            return
+        tables = TableCache.mapped(self.table_key(), self.BEST_TABLES)
+        if tables is not None:
+            for name, table in tables.items():
+                setattr(self, name, table)
+            return
+        best_flushes = [None] * (1 << 13)
+        best_products = {}
+        for size in (5, 6, 7):
+            for values in combinations_with_replacement(range(self.rules.lowest, 13), size):
+                if any(values.count(value) > 4 for value in values):
+                    continue
+                if len(set(values)) == size:
+                    mask = sum(1 << value for value in values)
+                    best_flushes[mask] = max(self.flushes[sum(1 << value for value in five)]
+                                             for five in combinations(values, 5))
+                if size == 5:
+                    continue
+                product = 1
+                for value in values:
+                    product *= PRIMES[value]
+                best_products[product] = max(self.lookup_values(five)
+                                             for five in set(combinations(values, 5)))
+        self.best_flushes = best_flushes
+        self.best_products = best_products
+        TableCache.store(self.table_key(), {name: getattr(self, name) for name in
+                                            self.FIVE_CARD_TABLES + self.BEST_TABLES})
+
+    def table_key(self):
+        return "LookupEvaluator {}".format(self.rules.key())
+
+    def lookup_values(self, values):
+        """Non-flush table entry for five rank values."""
+        mask = 0
+        product = 1
+        for value in values:
+            mask |= 1 << value
+            product *= PRIMES[value]
+        strength = self.unique_fives[mask]
+        return self.products[product] if strength is None else strength
+
+    def lookup(self, cards):
+        """Return the table entry for five cards, or None if not covered."""
+        return self.lookup_codes([card.code for card in cards])
+
+    def lookup_codes(self, codes):
+        """Return the table entry for five Deck.Card codes, or None if not covered."""
+        if self.products is None:
+            self.build()
+        a, b, c, d, e = codes
+        mask = 1 << (a >> 2) | 1 << (b >> 2) | 1 << (c >> 2) | 1 << (d >> 2) | 1 << (e >> 2)
+        if (a & 3) == (b & 3) == (c & 3) == (d & 3) == (e & 3):
+            return self.flushes[mask]
+        strength = self.unique_fives[mask]
+        if strength is None:
+            strength = self.products.get(PRIMES[a >> 2] * PRIMES[b >> 2] * PRIMES[c >> 2]
+                                         * PRIMES[d >> 2] * PRIMES[e >> 2])
+        return strength
+
+    def lookup_best_codes(self, codes):
+        """Best five-card strength among six or seven codes, or None if not covered.
+
+        Non-flush hands are looked up by rank product; a suit holding five or
+        more of the cards is looked up by its rank mask, and the better wins.
+        """
+        if self.best_products is None:
+            self.build_best()
+        if len(set(codes)) != len(codes):
+            return None
+        product = 1
+        masks = [0, 0, 0, 0]
+        for code in codes:
+            product *= PRIMES[code >> 2]
+            masks[code & 3] |= 1 << (code >> 2)
+        strength = self.best_products.get(product)
+        if strength is None:
+            return None
+        for mask in masks:
+            flush = self.best_flushes[mask]
+            if flush is not None and flush > strength:
+                strength = flush
+        return strength
+
+    def strength(self, hand):
+        if hand.cards and hand.cards[0] is Deck.Card.joker:
+            raise ValueError("a joker needs a WildEvaluator: {}".format(
+                ' '.join(card.name for card in hand.cards)))
+        if len(hand.cards) == 5:
+            strength = self.lookup(hand.cards)
+            if strength is not None:
+                return strength
+        elif len(hand.cards) in (6, 7):
+            return self.strength_of_codes([card.code for card in hand.cards])
+        if self.rules is STANDARD:
+            return reference.strength(hand)
+        if len(hand.cards) != 5 or any(card.value < self.rules.lowest for card in hand.cards):
+            raise ValueError("not a five-card hand from a {} deck: {}".format(
+                self.rules.name, ' '.join(card.name for card in hand.cards)))
+        return self.rules.strength([card.value for card in hand.cards],
+                                   len(set(card.suit for card in hand.cards)) == 1)
+
+    def score(self, hand):
+        return self.score_of(self.strength(hand))
+
+    def score_of(self, strength):
+        return self.rules.score_of(strength)
+
+    def pattern_of(self, strength):
+        return self.rules.pattern_of(strength)
+
+    def strength_of_codes(self, codes):
+        """Strength of the best five-card hand among five or more card codes."""
+        strength = None
+        if len(codes) == 5:
+            strength = self.lookup_codes(codes)
+        elif len(codes) in (6, 7):
+            strength = self.lookup_best_codes(codes)
+        if strength is None and len(codes) > 5:
+            return max(self.strength_of_codes(five) for five in combinations(codes, 5))
+        if strength is None:
+            hand = Deck.Hand([Deck.Card.by_code[code].name for code in codes])
+            strength = hand.strength() if self.rules is STANDARD else self.strength(hand)
+        return strength
+
+
+class WildEvaluator:
+    """Ranks five-card hands with jokers or wild ranks from precomputed tables.
+
+    A wild card stands for whichever card makes the best hand. The tables
+    are keyed by the natural cards alone: the product of their rank primes
+    gives the best hand without a flush, and, when the naturals share a
+    suit, their rank mask gives the best flush or straight flush. Both are
+    filled in by build(), which tries every rank for each wild once, so a
+    hand with wilds is looked up as cheaply as a natural one. Jokers are
+    always wild; wild lists further ranks, e.g. ('2',) for deuces wild.
+    Built tables are kept in the TableCache.
+    """
+    TABLES = ('products', 'flushes')
+
+    def __init__(self, rules=FIVE_OF_A_KIND, wild=()):
+        self.rules = rules
+        self.wild_ranks = tuple(wild)
+        self.primes = None
+        self.rank_bits = None
+        self.suit_bits = None
+        self.products = None
+        self.flushes = None
+
+    def build(self):
+        rules = self.rules
+        wild_values = [Deck.Card.ranks.index(rank) for rank in self.wild_ranks]
+        wild = [code == Deck.Card.joker.code or code >> 2 in wild_values
+                for code in range(Deck.Card.joker.code + 1)]
+        # Per-code rank prime, rank bit and suit bit; a wild contributes nothing.
+        self.primes = [1 if wild[code] else PRIMES[code >> 2] for code in range(len(wild))]
+        self.rank_bits = [0 if wild[code] else 1 << (code >> 2) for code in range(len(wild))]
+        self.suit_bits = [0 if wild[code] else 1 << (code & 3) for code in range(len(wild))]
+        tables = TableCache.load(self.table_key(), self.TABLES)
+        if tables is not None:
+            self.products, self.flushes = tables['products'], tables['flushes']
+            return
+        most = 5 if rules.five_of_a_kind else 4
+        ranks = range(rules.lowest, 13)
+        naturals = [value for value in ranks if value not in wild_values]
+        products = {}
+        flushes = [None] * (1 << 13)
+        for size in range(6):
+            fills = list(combinations_with_replacement(ranks, 5 - size))
+            for values in combinations_with_replacement(naturals, size):
+                if any(values.count(value) > 4 for value in values):
+                    continue
+                best = None
+                for fill in fills:
+                    hand = values + fill
+                    if any(hand.count(value) > most for value in fill):
+                        continue
+                    strength = rules.strength(hand, False)
+                    if best is None or strength > best:
+                        best = strength
+                product = 1
+                for value in values:
+                    product *= PRIMES[value]
+                products[product] = best
+            for values in combinations(naturals, size):
+                rest = [value for value in ranks if value not in values]
+                flushes[sum(1 << value for value in values)] = max(
+                    rules.strength(values + fill, True) for fill in combinations(rest, 5 - size))
+        self.products = products
+        self.flushes = flushes
+        TableCache.store(self.table_key(), {'products': products, 'flushes': flushes})
+
+    def table_key(self):
+        return "WildEvaluator {} wild={}".format(self.rules.key(), ','.join(self.wild_ranks))
+
+    def lookup_codes(self, codes):
+        """Best strength for five Deck.Card codes, or None if not covered."""
+        if self.products is None:
+            self.build()
+        a, b, c, d, e = codes
+        primes, rank_bits, suit_bits = self.primes, self.rank_bits, self.suit_bits
+        strength = self.products.get(primes[a] * primes[b] * primes[c] * primes[d] * primes[e])
+        suits = suit_bits[a] | suit_bits[b] | suit_bits[c] | suit_bits[d] | suit_bits[e]
+        if strength is not None and not suits & (suits - 1):
+            flush = self.flushes[rank_bits[a] | rank_bits[b] | rank_bits[c] | rank_bits[d]
+                                 | rank_bits[e]]
+            if flush is not None and flush > strength:
+                strength = flush
+        return strength
+
+    def strength_of_codes(self, codes):
+        """Strength of the best five-card hand among five or more card codes."""
+        if len(codes) > 5:
+            return max(self.strength_of_codes(five) for five in combinations(codes, 5))
+        strength = self.lookup_codes(codes) if len(codes) == 5 else None
+        if strength is None:
+            raise ValueError("not a five-card hand from a {} deck: {}".format(
+                self.rules.name, ' '.join(Deck.Card.by_code[code].name for code in codes)))
+        return strength
+
+    def strength(self, hand):
+        return self.strength_of_codes([card.code for card in hand.cards])
+
+    def score(self, hand):
+        return self.score_of(self.strength(hand))
+
+    def score_of(self, strength):
+        return self.rules.score_of(strength)
+
+    def pattern_of(self, strength):
+        return self.rules.pattern_of(strength)
+
+
+reference = ReferenceEvaluator()
+lookup = LookupEvaluator()
+joker_poker = WildEvaluator()
+deuces_wild = WildEvaluator(wild=('2',))
@@ -0,0 +1,124 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import argparse
+import mmap
+import struct
+
+from poker import Deck
+
+MAGIC = b'PKRH'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQ')  # magic, version, cards per record, record count
+
+
+def convert(lines, path, cards_per_record=10):
+    """Write text lines of card strings to a binary hand file; returns the record count.
+
+    Every card becomes one byte holding its Deck.Card code, after a
+    HEADER-sized header. Blank lines are skipped; jokers are refused.
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, cards_per_record, 0))
+        for number, line in enumerate(lines, 1):
+            names = line.split()
+            if not names:
+                continue
+            if len(names) != cards_per_record:
+                raise ValueError("line {}: expected {} cards, got {}".format(
+                    number, cards_per_record, len(names)))
+            try:
+                codes = bytes(Deck.Card(name).code for name in names)
+            except ValueError as error:
+                raise ValueError("line {}: {}".format(number, error)) from None
+            if Deck.Card.joker.code in codes:
+                raise ValueError("line {}: a hand file cannot hold a joker".format(number))
+            f.write(codes)
+            count += 1
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, cards_per_record, count))
+    return count
+
+
+def is_hand_file(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class HandFile:
+    """A memory-mapped binary hand file whose records are read without copying.
+
+    Records and array() views stay readable after close(); the file is
+    unmapped once the last of them is gone.
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError("{}: not a hand file".format(path))
+            magic, version, self.cards_per_record, self.count = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError("{}: not a hand file".format(path))
+            if version != VERSION:
+                raise ValueError("{}: unsupported hand file version {}".format(path, version))
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        end = HEADER.size + self.count * self.cards_per_record
+        if len(self.map) < end:
+            raise ValueError("{}: truncated hand file".format(path))
+        self.codes = memoryview(self.map)[HEADER.size:end]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start = index * self.cards_per_record
+        return self.codes[start:start + self.cards_per_record]
+
+    def __iter__(self):
+        size = self.cards_per_record
+        codes = self.codes
+        for start in range(0, len(codes), size):
+            yield codes[start:start + size]
+
+    def array(self):
+        """All records as a (count, cards per record) NumPy view of the mapping."""
+        import numpy
+        return numpy.frombuffer(self.codes, dtype=numpy.uint8).reshape(
+            self.count, self.cards_per_record)
+
+    def close(self):
+        try:
+            self.codes.release()
+            self.map.close()
+        except BufferError:
+            # Records or an array() view still point into the mapping, which
+            # is unmapped when they and this object are collected.
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m poker.HandFile", description="Convert a text hand file to binary.")
+    parser.add_argument("text", help="text file with one record of card strings per line")
+    parser.add_argument("binary", help="binary hand file to write")
+    parser.add_argument("--cards", type=int, default=10, help="cards per record")
+    args = parser.parse_args(argv)
+    with open(args.text) as f:
+        count = convert(f, args.binary, args.cards)
+    print("{} records".format(count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+from itertools import combinations_with_replacement
+
+from poker import Deck
+from poker import Evaluator
+
+# Strengths of one to four cards by rank product, per Rules.
+partials = {}
+
+
+def partial_table(rules):
+    """Strength of every one- to four-card rank multiset, keyed by its rank product."""
+    table = partials.get(rules)
+    if table is None:
+        table = {}
+        for size in range(1, 5):
+            for values in combinations_with_replacement(range(rules.lowest, 13), size):
+                product = 1
+                for value in values:
+                    product *= Evaluator.PRIMES[value]
+                table[product] = rules.strength(values, False)
+        partials[rules] = table
+    return table
+
+
+class HandState:
+    """A hand that cards are added to and removed from one at a time.
+
+    Each change updates the rank histogram, per-suit counts and rank masks
+    and the product of rank primes in constant time, so strength() is a
+    table lookup at any point: up to four cards are keyed like the cards a
+    stud hand shows, five to seven by the best five of them. The tables
+    are those of evaluator (Evaluator.lookup by default), so its rules
+    apply.
+    """
+    def __init__(self, cards=(), evaluator=None):
+        self.evaluator = evaluator or Evaluator.lookup
+        if self.evaluator.best_products is None:
+            self.evaluator.build_best()
+        self.partials = partial_table(self.evaluator.rules)
+        self.held = 0  # bit per card code
+        self.size = 0
+        self.counts = [0] * 13
+        self.suit_counts = [0] * 4
+        self.suit_masks = [0] * 4
+        self.mask = 0
+        self.product = 1
+        for card in cards:
+            self.add(card)
+
+    def add(self, card):
+        self.add_code(Deck.Card(card).code)
+
+    def remove(self, card):
+        self.remove_code(Deck.Card(card).code)
+
+    def add_code(self, code):
+        if not 0 <= code < 52:
+            raise ValueError("not a natural card code: {}".format(code))
+        bit = 1 << code
+        if self.held & bit:
+            raise ValueError("{} is already in the hand".format(Deck.Card.by_code[code].name))
+        if self.size == 7:
+            raise ValueError("a hand holds at most seven cards")
+        self.held |= bit
+        self.size += 1
+        value, suit = code >> 2, code & 3
+        self.counts[value] += 1
+        self.mask |= 1 << value
+        self.product *= Evaluator.PRIMES[value]
+        self.suit_counts[suit] += 1
+        self.suit_masks[suit] |= 1 << value
+
+    def remove_code(self, code):
+        bit = 1 << code
+        if not self.held & bit:
+            raise ValueError("{} is not in the hand".format(Deck.Card.by_code[code].name))
+        self.held &= ~bit
+        self.size -= 1
+        value, suit = code >> 2, code & 3
+        self.counts[value] -= 1
+        if not self.counts[value]:
+            self.mask &= ~(1 << value)
+        self.product //= Evaluator.PRIMES[value]
+        self.suit_counts[suit] -= 1
+        self.suit_masks[suit] &= ~(1 << value)
+
+    def codes(self):
+        return [code for code in range(52) if self.held >> code & 1]
+
+    def strength(self):
+        """Strength key of the best hand the cards make so far, or None with no cards."""
+        size = self.size
+        evaluator = self.evaluator
+        if size < 5:
+            return self.partials.get(self.product)
+        if size == 5:
+            strength = evaluator.unique_fives[self.mask]
+            if strength is None:
+                strength = evaluator.products.get(self.product)
+            best_flushes = evaluator.flushes
+        else:
+            strength = evaluator.best_products.get(self.product)
+            best_flushes = evaluator.best_flushes
+        if strength is None:
+            raise ValueError("not a hand from a {} deck".format(evaluator.rules.name))
+        for suit in range(4):
+            if self.suit_counts[suit] >= 5:
+                flush = best_flushes[self.suit_masks[suit]]
+                if flush is not None and flush > strength:
+                    strength = flush
+        return strength
+
+    def score(self):
+        return self.evaluator.score_of(self.strength())
+
+    def pattern(self):
+        """The WinPatterns class of the best hand so far."""
+        return self.evaluator.pattern_of(self.strength())
+
+    def copy(self):
+        state = object.__new__(HandState)
+        state.__dict__.update(self.__dict__)
+        state.counts = list(self.counts)
+        state.suit_counts = list(self.suit_counts)
+        state.suit_masks = list(self.suit_masks)
+        return state
+
+    def __len__(self):
+        return self.size
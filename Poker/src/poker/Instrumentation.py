@@ -0,0 +1,135 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from poker import Deck
+from poker import Evaluator
+from poker import WinPatterns
+
+# Every category a hand can fall in, FiveOfAKind only under rules with wild cards.
+PATTERNS = [WinPatterns.FiveOfAKind] + WinPatterns.order
+
+
+# Evaluator methods every Hand.strength and Cli game goes through.
+EVALUATIONS = [(evaluator, method)
+               for evaluator in (Evaluator.ReferenceEvaluator, Evaluator.LookupEvaluator,
+                                 Evaluator.WildEvaluator)
+               for method in ("strength", "strength_of_codes") if method in vars(evaluator)]
+
+
+class Stats:
+    """Counters collected while instrumentation is enabled.
+
+    evaluations times the evaluator methods that score hands, whichever
+    evaluator is in use; criterion times the WinPatterns checks, which
+    only the reference evaluator makes. Times are inclusive: a
+    strength() that calls strength_of_codes() counts towards both, as
+    does StraightFlush.criterion() towards the Straight and Flush checks
+    it makes.
+    """
+    def __init__(self):
+        self.evaluations = {"{}.{}".format(evaluator.__name__, method): [0, 0.0]
+                            for evaluator, method in EVALUATIONS}
+        self.criterion = {pattern.__name__: [0, 0.0] for pattern in PATTERNS}
+        self.categories = {pattern.__name__: 0 for pattern in PATTERNS}
+
+    def to_dict(self):
+        return {
+            "evaluations": {name: {"calls": calls, "seconds": seconds}
+                            for name, (calls, seconds) in self.evaluations.items()},
+            "criterion": {name: {"checks": checks, "seconds": seconds}
+                          for name, (checks, seconds) in self.criterion.items()},
+            "categories": dict(self.categories),
+        }
+
+    def dump(self, f):
+        json.dump(self.to_dict(), f, indent=2)
+
+    def __str__(self):
+        lines = ["{:<36}{:>10}{:>12}".format("evaluation", "calls", "seconds")]
+        for name, (calls, seconds) in self.evaluations.items():
+            lines.append("{:<36}{:>10}{:>12.6f}".format(name, calls, seconds))
+        lines.append("")
+        lines.append("{:<14}{:>10}{:>12}{:>10}".format("pattern", "checks", "seconds", "hands"))
+        for pattern in PATTERNS:
+            name = pattern.__name__
+            lines.append("{:<14}{:>10}{:>12.6f}{:>10}".format(
+                name, self.criterion[name][0], self.criterion[name][1], self.categories[name]))
+        return '\n'.join(lines)
+
+
+def _timed(function, counter):
+    @wraps(function)
+    def timed(*args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            counter[0] += 1
+            counter[1] += time.perf_counter() - start
+    return timed
+
+
+def _counting(strength, categories):
+    @wraps(strength)
+    def counted(hand):
+        if hand._strength is None:
+            pattern = (hand.evaluator or Evaluator.lookup).pattern_of(strength(hand))
+            categories[pattern.__name__] += 1
+        return strength(hand)
+    return counted
+
+
+_originals = []
+_stats = None
+
+
+def enable():
+    """Start counting into a fresh Stats and return it.
+
+    Methods are wrapped only while enabled and the originals put back by
+    disable(), so nothing is paid when instrumentation is off.
+    """
+    global _stats
+    disable()
+    _stats = Stats()
+    for evaluator, method in EVALUATIONS:
+        function = vars(evaluator)[method]
+        _originals.append((evaluator, method, function))
+        setattr(evaluator, method, _timed(
+            function, _stats.evaluations["{}.{}".format(evaluator.__name__, method)]))
+    for pattern in PATTERNS:
+        if "criterion" in vars(pattern):
+            function = vars(pattern)["criterion"]
+            _originals.append((pattern, "criterion", function))
+            setattr(pattern, "criterion", _timed(function, _stats.criterion[pattern.__name__]))
+    _originals.append((Deck.Hand, "strength", Deck.Hand.strength))
+    Deck.Hand.strength = _counting(Deck.Hand.strength, _stats.categories)
+    return _stats
+
+
+def disable():
+    """Stop counting and return the Stats collected, or None if not enabled."""
+    global _stats
+    while _originals:
+        owner, method, function = _originals.pop()
+        setattr(owner, method, function)
+    stats, _stats = _stats, None
+    return stats
+
+
+@contextmanager
+def recording():
+    """Instrument the hot paths for the duration of a with block."""
+    stats = enable()
+    try:
+        yield stats
+    finally:
+        disable()
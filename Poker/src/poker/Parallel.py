@@ -0,0 +1,97 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+import io
+import os
+from multiprocessing import Pool
+
+from poker import Cli
+from poker import HandFile
+from poker import Shared
+
+
+def shards(path, shard_size):
+    """Split a file into (start, stop) byte ranges that end on line boundaries."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        while bounds[-1] < size:
+            f.seek(bounds[-1] + shard_size)
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    return list(zip(bounds, bounds[1:]))
+
+
+def first_lines(path, bounds):
+    """The number of the first line of each (start, stop) byte range of a file, from 1."""
+    numbers = []
+    line = 1
+    with open(path, 'rb') as f:
+        for start, stop in bounds:
+            numbers.append(line)
+            f.seek(start)
+            line += f.read(stop - start).count(b'\n')
+    return numbers
+
+
+def record_shards(hand_file, shard_size):
+    """Split a binary hand file into (start, stop) record ranges of about shard_size bytes."""
+    step = max(1, shard_size // hand_file.cards_per_record)
+    return [(start, min(start + step, len(hand_file))) for start in range(0, len(hand_file), step)]
+
+
+def play_shard(job):
+    """Play the games in one shard; returns their outcome text and a Summary.
+
+    first numbers the shard's first line or record, so errors name the same
+    line or record as the serial path would.
+    """
+    path, start, stop, first, summary, binary = job
+    out = None if summary else io.StringIO()
+    if binary:
+        with HandFile.HandFile(path) as hand_file:
+            records = (hand_file[index] for index in range(start, stop))
+            totals = Cli.tally(Cli.games_in_records(records, first), Cli.Summary(), out,
+                               stop - start)
+    else:
+        with open(path, 'rb') as f:
+            f.seek(start)
+            lines = f.read(stop - start).decode('ascii').splitlines()
+        totals = Cli.play_lines(lines, Cli.Summary(), out, len(lines) + 1, first)
+    return ('' if summary else out.getvalue()), totals
+
+
+def run(path, out, summary=False, workers=None, shard_size=1 << 23, ordered=True,
+        shared=False):
+    """Play every game in a text or binary hand file across a process pool.
+
+    Shards are dispatched in file order and, when ordered, their outcomes
+    are written back in the same order, so the output is byte-identical to
+    the serial path over the whole file. With shared, the workers look
+    hands up in one copy of the tables in shared memory. With out None,
+    nothing is written and only the Summary is returned.
+    """
+    totals = Cli.Summary()
+    binary = HandFile.is_hand_file(path)
+    if binary:
+        with HandFile.HandFile(path) as hand_file:
+            bounds = record_shards(hand_file, shard_size)
+        firsts = [start + 1 for start, _ in bounds]
+    else:
+        bounds = shards(path, shard_size)
+        firsts = first_lines(path, bounds)
+    summary = summary or out is None
+    jobs = [(path, start, stop, first, summary, binary)
+            for (start, stop), first in zip(bounds, firsts)]
+    with (Shared.pool(workers) if shared else Pool(workers)) as pool:
+        mapper = pool.imap if ordered else pool.imap_unordered
+        for text, shard_totals in mapper(play_shard, jobs):
+            if out is not None:
+                out.write(text)
+            totals.merge(shard_totals)
+    if out is not None and summary:
+        out.write('\n'.join(totals.lines()) + '\n')
+    return totals
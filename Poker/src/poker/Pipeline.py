@@ -0,0 +1,105 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Streaming statistics over hand files. Each stage is a generator that
+pulls from the one before it, so only one game is held at a time:
+
+    aggregate(evaluate(parse(read(path), binary)))
+
+read yields text lines or binary records, parse turns them into the card
+codes of both hands, evaluate scores those and aggregate counts the
+results into a Cli.Summary. The poker command is built from the same
+parse and evaluate stages (see Cli.games_in_lines), so either can be
+swapped, e.g. evaluate(..., evaluator) under other rules. Summaries merge,
+so shards of a file can be aggregated in separate processes (see
+Parallel) and combined.
+'''
+
+import argparse
+
+from poker import Cli
+from poker import HandFile
+from poker import Parallel
+
+
+def read(path, start=0, stop=None):
+    """Yield the games in a text or binary hand file, one at a time.
+
+    Text files yield lines from byte start up to byte stop; binary hand
+    files yield the code records start..stop.
+    """
+    if HandFile.is_hand_file(path):
+        with HandFile.HandFile(path) as hand_file:
+            stop = len(hand_file) if stop is None else stop
+            for index in range(start, stop):
+                yield hand_file[index]
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            if stop is not None and position >= stop:
+                break
+            position += len(line)
+            yield line.decode('ascii')
+
+
+def parse(games, binary=False, first=1):
+    """Card codes of both hands for each game read() yields.
+
+    first numbers the first line or record in errors.
+    """
+    return Cli.parse_records(games, first) if binary else Cli.parse_lines(games, first)
+
+
+# Scoring is the poker command's own stage.
+evaluate = Cli.evaluate
+
+
+def games(path, start=0, stop=None, first=1):
+    """Strength keys of both hands for each game read(path, start, stop) yields."""
+    binary = HandFile.is_hand_file(path)
+    return evaluate(parse(read(path, start, stop), binary, first))
+
+
+def aggregate(games, totals=None):
+    """Add every (strength_1, strength_2) to totals, a new Cli.Summary by default."""
+    totals = Cli.Summary() if totals is None else totals
+    for strength_1, strength_2 in games:
+        totals.add(strength_1, strength_2)
+    return totals
+
+
+def run(path, workers=1, shard_size=1 << 23, shared=False):
+    """A Cli.Summary of a whole text or binary hand file, sharded across workers.
+
+    With shared, the workers look hands up in one copy of the tables in
+    shared memory.
+    """
+    if workers == 1:
+        return aggregate(games(path))
+    return Parallel.run(path, None, workers=workers, shard_size=shard_size, ordered=False,
+                        shared=shared)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m poker.Pipeline", description="Statistics over a hand file.")
+    parser.add_argument("file", help="text or binary hand file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes to shard the file across, 0 for one per core")
+    parser.add_argument("--shard-size", type=int, default=1 << 23,
+                        help="bytes of input per shard")
+    parser.add_argument("--shared-tables", action="store_true",
+                        help="give workers one copy of the lookup tables in shared memory")
+    args = parser.parse_args(argv)
+    totals = run(args.file, args.workers or None, args.shard_size, args.shared_tables)
+    print('\n'.join(totals.lines()))
+    print("player_1_win_rate {:.6f}".format(totals.win_rate()))
+    print("draw_rate {:.6f}".format(totals.draw_rate()))
+
+
+if __name__ == "__main__":
+    main()
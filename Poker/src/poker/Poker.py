@@ -1,48 +1,74 @@
-'''
-Created on Jun 2, 2016
-
-@author: Daniel
-'''
-
-
-class OneDeckTwoPlayerGame:
-    """A set of two hands, one of which is a winner."""
-    def __init__(self, hand_1, hand_2):
-        self.hand_1 = hand_1
-        self.hand_2 = hand_2
-    
-    def player_one_has_a_better_win_pattern(self):
-        return self.hand_1.score() < self.hand_2.score()
-
-    def break_tie(self):
-        return self.hand_1.score() == self.hand_2.score()
-
-    def player_one_wins(self):
-        if self.break_tie():
-            return self.hand_1.beats(self.hand_2)
-        return self.player_one_has_a_better_win_pattern()
-
-    def player_two_wins(self):
-        return not self.player_one_wins()
-
-      
-if __name__ == "__main__":
-    import unittest
-    import sys
-    from poker.Deck import Hand
-    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
-    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
-    with open("../../TestResources/10_hands.txt", 'r') as f:
-        for i in range(10):
-            cards = f.readline().split()
-            hand_1 = Hand(cards[:5])
-            hand_2 = Hand(cards[5:])
-            game = OneDeckTwoPlayerGame(hand_1, hand_2)
-         
-            print("Game " + str(i+1))
-            
-            print(" 1. " + str(hand_1))
-            print(" 2. " + str(hand_2))
-            print(" Player 1 " + ("wins" if game.player_one_wins() else "loses"))
-            print()
+'''
+Created on Jun 2, 2016
+
+@author: Daniel
+'''
+
+
+class OneDeckTwoPlayerGame:
+    """A set of two hands, one of which is a winner."""
+    def __init__(self, hand_1, hand_2):
+        self.hand_1 = hand_1
+        self.hand_2 = hand_2
+    
+    def player_one_has_a_better_win_pattern(self):
+        return self.hand_1.score() < self.hand_2.score()
+
+    def break_tie(self):
+        return self.hand_1.score() == self.hand_2.score()
+
+    def player_one_wins(self):
+        return self.hand_1.strength() > self.hand_2.strength()
+
+    def player_two_wins(self):
+        return self.hand_2.strength() > self.hand_1.strength()
+
+    def is_draw(self):
+        return self.hand_1.strength() == self.hand_2.strength()
+
+
+class Showdown:
+    """Any number of hands, each scored once, ranked against each other."""
+    def __init__(self, hands):
+        self.hands = hands
+        self.strengths = [hand.strength() for hand in hands]
+    
+    def winners(self):
+        """Indices of the best hands; more than one means a split pot."""
+        best = max(self.strengths)
+        return [i for i, strength in enumerate(self.strengths) if strength == best]
+    
+    def is_split(self):
+        return len(self.winners()) > 1
+    
+    def ranking(self):
+        """Indices grouped by finishing place, best first, ties sharing a group."""
+        places = {}
+        for i, strength in enumerate(self.strengths):
+            places.setdefault(strength, []).append(i)
+        return [places[strength] for strength in sorted(places, reverse=True)]
+
+      
+if __name__ == "__main__":
+    import unittest
+    import sys
+    from poker.Deck import Hand
+    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
+    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
+    with open("../../TestResources/10_hands.txt", 'r') as f:
+        for i in range(10):
+            cards = f.readline().split()
+            hand_1 = Hand(cards[:5])
+            hand_2 = Hand(cards[5:])
+            game = OneDeckTwoPlayerGame(hand_1, hand_2)
+         
+            print("Game " + str(i+1))
+            
+            print(" 1. " + str(hand_1))
+            print(" 2. " + str(hand_2))
+            if game.is_draw():
+                print(" Player 1 draws")
+            else:
+                print(" Player 1 " + ("wins" if game.player_one_wins() else "loses"))
+            print()
             
\ No newline at end of file
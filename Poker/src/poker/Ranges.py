@@ -0,0 +1,400 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Two-card holdings, ranges of them in the usual notation, and equity
+matrices between two ranges on a shared five-card board:
+
+    AA, AKs, KQo, JT        pairs, suited, offsuit, either
+    22+, ATs+, K9o+         a pair and every higher one; a kicker and every
+                            higher one below the top card
+    99-66, A5s-A2s          everything between two of the same shape
+    AsKh                    one exact combo
+'''
+
+import hashlib
+import math
+import os
+import random
+import re
+from itertools import combinations, islice
+from multiprocessing import Pool
+
+import numpy
+
+from poker import Deck
+from poker import Evaluator
+
+VERSION = 1
+BLOCK = 1 << 10  # boards whose strengths tally holds at once
+RANKS = ''.join(Deck.Card.ranks)
+
+SHAPE = re.compile(r'([2-9TJQKA])([2-9TJQKA])([so]?)$', re.IGNORECASE)
+COMBO = re.compile(r'([2-9TJQKA][CDHS])([2-9TJQKA][CDHS])$', re.IGNORECASE)
+
+
+def label(high, low, shape=''):
+    """Class label for two rank values, e.g. label(12, 11, 's') == 'AKs'."""
+    high, low = max(high, low), min(high, low)
+    return RANKS[high] + RANKS[low] + ('' if high == low else shape)
+
+
+# The 13x13 grid read row by row: pairs on the diagonal, suited hands above it.
+STARTING_HANDS = [label(row, column, 's' if row > column else 'o')
+                  for row in range(12, -1, -1) for column in range(12, -1, -1)]
+
+
+def combos(name):
+    """Every combo of a class label (or one combo's name) as a (high, low) code pair."""
+    match = COMBO.match(name)
+    if match:
+        codes = sorted((Deck.Card(card.upper()).code for card in match.groups()), reverse=True)
+        if codes[0] == codes[1]:
+            raise ValueError("not a combo: {!r}".format(name))
+        return [tuple(codes)]
+    high, low, shape = _shape(name)
+    if high == low:
+        return [(high * 4 + first, low * 4 + second)
+                for first, second in combinations(range(3, -1, -1), 2)]
+    return [(high * 4 + first, low * 4 + second) for first in range(3, -1, -1)
+            for second in range(3, -1, -1)
+            if shape == '' or (first == second) == (shape == 's')]
+
+
+def _shape(name):
+    match = SHAPE.match(name)
+    if not match:
+        raise ValueError("not a hand class: {!r}".format(name))
+    first, second, shape = match.groups()
+    high, low = RANKS.index(first.upper()), RANKS.index(second.upper())
+    if high < low:
+        high, low = low, high
+    if high == low and shape:
+        raise ValueError("a pair is neither suited nor offsuit: {!r}".format(name))
+    return high, low, shape.lower()
+
+
+def expand(token):
+    """The class labels (or single combo name) a range token stands for."""
+    token = token.strip()
+    if COMBO.match(token):
+        return [token[0].upper() + token[1].upper() + token[2].upper() + token[3].upper()]
+    if token.endswith('+'):
+        high, low, shape = _shape(token[:-1])
+        if high == low:
+            return [label(value, value) for value in range(high, 13)]
+        return [label(high, value, shape) for value in range(low, high)]
+    if '-' in token:
+        first, last = (_shape(part) for part in token.split('-', 1))
+        if first[2] != last[2] or (first[0] == first[1]) != (last[0] == last[1]) \
+                or (first[0] != first[1] and first[0] != last[0]):
+            raise ValueError("ends of {!r} have different shapes".format(token))
+        if first[0] == first[1]:
+            bottom, top = sorted((first[0], last[0]))
+            return [label(value, value) for value in range(top, bottom - 1, -1)]
+        bottom, top = sorted((first[1], last[1]))
+        return [label(first[0], value, first[2]) for value in range(top, bottom - 1, -1)]
+    high, low, shape = _shape(token)
+    return [label(high, low, shape)]
+
+
+class Range:
+    """A set of two-card combos grouped by the class (or exact combo) they came from.
+
+    Combos using any of the dead cards are left out, as are classes that
+    have none left.
+    """
+    def __init__(self, text, dead=()):
+        dead = set(Deck.Card(card).code for card in dead)
+        self.labels = []
+        self.combos = {}
+        for token in re.split(r'[,\s]+', text.strip()):
+            if not token:
+                continue
+            for name in expand(token):
+                if name in self.combos:
+                    continue
+                kept = [combo for combo in combos(name) if dead.isdisjoint(combo)]
+                if kept:
+                    self.labels.append(name)
+                    self.combos[name] = kept
+
+    @classmethod
+    def all(cls, dead=()):
+        """All 169 starting hands, in STARTING_HANDS order."""
+        return cls(','.join(STARTING_HANDS), dead)
+
+    def without(self, dead):
+        """This range with combos using any of the dead cards removed."""
+        dead = set(Deck.Card(card).code for card in dead)
+        kept = Range('')
+        for name in self.labels:
+            combos = [combo for combo in self.combos[name] if dead.isdisjoint(combo)]
+            if combos:
+                kept.labels.append(name)
+                kept.combos[name] = combos
+        return kept
+
+    def __len__(self):
+        return sum(len(kept) for kept in self.combos.values())
+
+    def __iter__(self):
+        """(label, combo) for every combo."""
+        for name in self.labels:
+            for combo in self.combos[name]:
+                yield name, combo
+
+    def __str__(self):
+        return ', '.join(self.labels)
+
+
+class EquityMatrix:
+    """Equity of each row class against each column class.
+
+    wins, ties and deals are tallied over every (board, row combo, column
+    combo) with no card in common; pairs counts the combo pairs of a cell
+    that do not conflict. A cell's equity weighs its combo pairs equally.
+    """
+    def __init__(self, rows, columns, wins, ties, deals, pairs, boards, exact):
+        self.rows = list(rows)
+        self.columns = list(columns)
+        self.wins = wins
+        self.ties = ties
+        self.deals = deals
+        self.pairs = pairs
+        self.boards = boards
+        self.exact = exact
+
+    def _rate(self, tally):
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            return numpy.where(self.deals > 0, tally / self.deals, numpy.nan)
+
+    def win(self):
+        return self._rate(self.wins)
+
+    def tie(self):
+        return self._rate(self.ties)
+
+    def equity(self):
+        """Expected pot share of the row class, NaN where every combo pair conflicts."""
+        return self._rate(self.wins + self.ties / 2)
+
+    def __getitem__(self, key):
+        row, column = key
+        return float(self.equity()[self.rows.index(row), self.columns.index(column)])
+
+    def save(self, path):
+        """Write the matrix to path atomically, as a NumPy .npz archive."""
+        partial = path + '.partial'
+        with open(partial, 'wb') as f:
+            numpy.savez(f, version=VERSION, rows=self.rows, columns=self.columns,
+                        wins=self.wins, ties=self.ties, deals=self.deals, pairs=self.pairs,
+                        boards=self.boards, exact=self.exact)
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path):
+        with numpy.load(path) as archive:
+            if int(archive['version']) != VERSION:
+                raise ValueError("{}: unsupported matrix version".format(path))
+            return cls(archive['rows'].tolist(), archive['columns'].tolist(), archive['wins'],
+                       archive['ties'], archive['deals'], archive['pairs'],
+                       int(archive['boards']), bool(archive['exact']))
+
+
+def _groups(rng):
+    """Combos of a range, and an indicator matrix with a row per label and a column per combo."""
+    names, held = zip(*rng)
+    indicator = numpy.zeros((len(rng.labels), len(held)))
+    index = {name: row for row, name in enumerate(rng.labels)}
+    indicator[[index[name] for name in names], numpy.arange(len(held))] = 1
+    return list(held), indicator
+
+
+def _apart(rows, columns):
+    """1 where a row combo and a column combo have no card in common, else 0."""
+    rows, columns = numpy.array(rows)[:, :, None, None], numpy.array(columns).T[None, None]
+    return (rows != columns).all(axis=(1, 2)).astype(numpy.float64)
+
+
+class Completions:
+    """Boards start..stop of every way to deal missing of the remaining
+    cards, in combinations order, dealt as they are iterated.
+
+    Slices are Completions too, so a share of the boards can be sent to a
+    worker without listing them.
+    """
+    def __init__(self, remaining, missing, start=0, stop=None):
+        self.remaining = list(remaining)
+        self.missing = missing
+        self.start = start
+        self.stop = math.comb(len(remaining), missing) if stop is None else stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, part):
+        start, stop, _ = part.indices(len(self))
+        return Completions(self.remaining, self.missing, self.start + start, self.start + stop)
+
+    def __iter__(self):
+        return islice(combinations(self.remaining, self.missing), self.start, self.stop)
+
+
+# Per evaluator, the best_products table last converted and its arrays.
+_arrays = {}
+
+
+def _best_tables(evaluator):
+    """The evaluator's seven-card tables as arrays: sorted rank products with
+    their entries, and entries by rank mask with -1 for no flush."""
+    if evaluator.best_products is None:
+        evaluator.build_best()
+    converted, arrays = _arrays.get(evaluator, (None, None))
+    if converted is evaluator.best_products:
+        return arrays
+    products, entries = zip(*evaluator.best_products.items())
+    products = numpy.array(products, dtype=numpy.int64)
+    order = numpy.argsort(products)
+    flushes = numpy.array([-1 if entry is None else entry for entry in evaluator.best_flushes],
+                          dtype=numpy.int64)
+    arrays = products[order], numpy.array(entries, dtype=numpy.int64)[order], flushes
+    _arrays[evaluator] = evaluator.best_products, arrays
+    return arrays
+
+
+def _strengths(board, dealt, combos, tables):
+    """Seven-card strength of each combo on each of a block of boards, -1
+    where a combo uses a board card."""
+    products, entries, flushes = tables
+    first, second = combos[:, 0], combos[:, 1]
+    cards = numpy.hstack([numpy.broadcast_to(numpy.array(board, dtype=numpy.intp),
+                                             (len(dealt), len(board))), dealt])
+    primes = numpy.array(Evaluator.PRIMES, dtype=numpy.int64)
+    product = primes[cards >> 2].prod(axis=1)
+    pair_product = primes[first >> 2] * primes[second >> 2]
+    index = numpy.searchsorted(products, product[:, None] * pair_product[None, :])
+    strengths = entries[numpy.minimum(index, len(entries) - 1)]
+    for suit in range(4):
+        # Ranks within a suit are distinct, so their bits add up to the mask.
+        mask = (((cards & 3) == suit) * (1 << (cards >> 2))).sum(axis=1)
+        mask = (mask[:, None] | numpy.where((first & 3) == suit, 1 << (first >> 2), 0)[None, :]
+                | numpy.where((second & 3) == suit, 1 << (second >> 2), 0)[None, :])
+        numpy.maximum(strengths, flushes[mask], out=strengths)
+    taken = numpy.zeros((len(dealt), 52), dtype=bool)
+    taken[numpy.arange(len(dealt))[:, None], cards] = True
+    strengths[taken[:, first] | taken[:, second]] = -1
+    return strengths
+
+
+def tally(job):
+    """Group-level wins, ties and deals of row combos against column combos on some boards.
+
+    Boards (any iterable of the cards that complete board) are taken
+    BLOCK at a time, so memory stays bounded however many there are. Each
+    combo's seven-card strength is looked up once per board and shared by
+    every cell it appears in. A combo that uses a board card counts as -1
+    for its rows and as a strength above any hand (or -2, when looking for
+    ties) for its columns, so it neither wins nor ties.
+    """
+    rows, row_groups, columns, column_groups, board, boards = job
+    tables = _best_tables(Evaluator.lookup)
+    distinct = list(dict.fromkeys(rows + columns))
+    position = {combo: index for index, combo in enumerate(distinct)}
+    row_index = numpy.array([position[combo] for combo in rows], dtype=numpy.intp)
+    column_index = numpy.array([position[combo] for combo in columns], dtype=numpy.intp)
+    combos = numpy.array(distinct, dtype=numpy.intp)
+
+    wins = numpy.zeros((len(rows), len(columns)), dtype=numpy.int32)
+    ties = numpy.zeros((len(rows), len(columns)), dtype=numpy.int32)
+    deals = numpy.zeros((len(rows), len(columns)))
+    boards = iter(boards)
+    missing = 5 - len(board)
+    while True:
+        block = list(islice(boards, BLOCK))
+        if not block:
+            break
+        dealt = numpy.array(block, dtype=numpy.intp).reshape(len(block), missing)
+        strengths = _strengths(board, dealt, combos, tables)
+        beaten = strengths[:, column_index]
+        level = beaten.copy()
+        beaten[beaten < 0] = 1 << 62
+        level[level < 0] = -2
+        for number in range(len(block)):
+            holding = strengths[number, row_index]
+            wins += holding[:, None] > beaten[number][None, :]
+            ties += holding[:, None] == level[number][None, :]
+        valid = (strengths >= 0).astype(numpy.float64)
+        deals += valid[:, row_index].T @ valid[:, column_index]
+
+    apart = _apart(rows, columns)
+    return [row_groups @ (tallied * apart) @ column_groups.T for tallied in (wins, ties, deals)]
+
+
+def _key(rows, columns, board, dead, samples, seed, exact):
+    described = repr((VERSION, [(name, rows.combos[name]) for name in rows.labels],
+                      [(name, columns.combos[name]) for name in columns.labels],
+                      board, sorted(dead), None if exact else (samples, seed)))
+    return hashlib.sha256(described.encode()).hexdigest()
+
+
+def matrix(rows, columns, board=(), dead=(), samples=1000, seed=None, workers=1,
+           chunks_per_worker=4, cache=None):
+    """Equity matrix of one range (text or Range) against another.
+
+    Every completion of the board is enumerated when there are no more
+    than samples of them (or samples is None); otherwise samples random
+    completions, drawn from seed, are shared by every cell. Boards are
+    drawn before being split across workers, so results do not depend on
+    the number of workers. With a cache directory, results are stored
+    there keyed by a hash of the combos, cards, samples and seed, and
+    read back on the next identical call.
+    """
+    board = [Deck.Card(card).code for card in board]
+    dead = [Deck.Card(card).code for card in dead]
+    known = board + dead
+    if len(set(known)) != len(known):
+        raise ValueError("a card is dealt more than once")
+    if len(board) > 5:
+        raise ValueError("a board has five cards")
+    names = [Deck.Card.by_code[code].name for code in known]
+    rows = Range(rows, names) if isinstance(rows, str) else rows.without(names)
+    columns = Range(columns, names) if isinstance(columns, str) else columns.without(names)
+    if not len(rows) or not len(columns):
+        raise ValueError("no combos left in a range")
+    remaining = [code for code in range(52) if code not in set(known)]
+    missing = 5 - len(board)
+    exact = samples is None or math.comb(len(remaining), missing) <= samples
+
+    path = None
+    if cache is not None:
+        path = os.path.join(cache, "matrix-{}.npz".format(
+            _key(rows, columns, board, dead, samples, seed, exact)))
+        if os.path.exists(path):
+            return EquityMatrix.load(path)
+
+    if exact:
+        boards = Completions(remaining, missing)
+    else:
+        deal = random.Random(seed)
+        boards = [tuple(deal.sample(remaining, missing)) for _ in range(samples)]
+    row_combos, row_groups = _groups(rows)
+    column_combos, column_groups = _groups(columns)
+    if workers == 1:
+        wins, ties, deals = tally((row_combos, row_groups, column_combos, column_groups, board, boards))
+    else:
+        pieces = min(len(boards), workers * chunks_per_worker)
+        bounds = [len(boards) * piece // pieces for piece in range(pieces + 1)]
+        jobs = [(row_combos, row_groups, column_combos, column_groups, board, boards[start:stop])
+                for start, stop in zip(bounds, bounds[1:])]
+        wins = ties = deals = 0
+        with Pool(workers) as pool:
+            for partial_wins, partial_ties, partial_deals in pool.imap_unordered(tally, jobs):
+                wins, ties, deals = wins + partial_wins, ties + partial_ties, deals + partial_deals
+    pairs = row_groups @ _apart(row_combos, column_combos) @ column_groups.T
+    result = EquityMatrix(rows.labels, columns.labels, wins, ties, deals, pairs, len(boards), exact)
+    if path is not None:
+        os.makedirs(cache, exist_ok=True)
+        result.save(path)
+    return result
@@ -0,0 +1,124 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+from math import comb
+
+from poker import Deck
+from poker import Evaluator
+
+# RankIndex per LookupEvaluator, built on first use.
+indexes = {}
+
+
+def of(evaluator=None):
+    """The RankIndex of evaluator, Evaluator.lookup by default."""
+    evaluator = evaluator or Evaluator.lookup
+    if not isinstance(evaluator, Evaluator.LookupEvaluator):
+        raise ValueError("hand classes are indexed for a LookupEvaluator, not {!r}".format(
+            evaluator))
+    index = indexes.get(evaluator)
+    if index is None:
+        index = indexes[evaluator] = RankIndex(evaluator)
+    return index
+
+
+class RankIndex:
+    """Every distinct five-card hand class of a LookupEvaluator, best first.
+
+    Rank 1 is the best class and len(index) the worst; 7462 of them under
+    the standard rules. Each class keeps its strength key, how many of the
+    five-card hands of the deck fall in it and a representative hand, and
+    a running total of the hands above it, so ranks, percentiles and counts
+    over a range of ranks are all a dict lookup or a subtraction away. Six-
+    and seven-card strengths rank as their best five cards.
+    """
+    def __init__(self, evaluator=None):
+        self.evaluator = evaluator = evaluator or Evaluator.lookup
+        if evaluator.products is None:
+            evaluator.build()
+        lowest = evaluator.rules.lowest
+        counts = {}
+        representatives = {}
+
+        def add(strength, count, codes):
+            counts[strength] = counts.get(strength, 0) + count
+            representatives.setdefault(strength, codes)
+
+        for mask, strength in enumerate(evaluator.unique_fives):
+            if strength is None:
+                continue
+            values = [value for value in range(13) if mask >> value & 1]
+            add(evaluator.flushes[mask], 4, [value * 4 + 3 for value in values])
+            # Every suiting but the four flushes, e.g. the lowest card off-suit.
+            add(strength, 4 ** 5 - 4, [value * 4 + 3 for value in values[1:]] + [values[0] * 4])
+        for product, strength in evaluator.products.items():
+            codes, ways = [], 1
+            for value in range(lowest, 13):
+                count = 0
+                while product % Evaluator.PRIMES[value] == 0:
+                    product //= Evaluator.PRIMES[value]
+                    count += 1
+                codes += [value * 4 + suit for suit in range(count)]
+                ways *= comb(4, count)
+            add(strength, ways, codes)
+
+        self.strengths = sorted(counts, reverse=True)
+        self.ranks = {strength: rank for rank, strength in enumerate(self.strengths, 1)}
+        self.counts = [counts[strength] for strength in self.strengths]
+        self.representatives = [representatives[strength] for strength in self.strengths]
+        # above[r - 1]: hands in the classes ranked better than r.
+        self.above = [0]
+        for count in self.counts:
+            self.above.append(self.above[-1] + count)
+        self.total = self.above[-1]
+
+    def __len__(self):
+        return len(self.strengths)
+
+    def rank(self, strength):
+        """Rank of a strength key, 1 for the best class."""
+        try:
+            return self.ranks[strength]
+        except KeyError:
+            raise ValueError("not the strength of a five-card hand: {}".format(strength)) from None
+
+    def rank_of(self, cards):
+        """Rank of the best five of some cards (Card objects or names)."""
+        codes = [Deck.Card(card).code for card in cards]
+        return self.rank(self.evaluator.strength_of_codes(codes))
+
+    def strength(self, rank):
+        return self.strengths[self._index(rank)]
+
+    def hand(self, rank):
+        """A Deck.Hand in the class of rank."""
+        return Deck.Hand([Deck.Card.by_code[code].name
+                          for code in self.representatives[self._index(rank)]])
+
+    def count(self, rank):
+        """Five-card hands in the class of rank."""
+        return self.counts[self._index(rank)]
+
+    def better(self, strength):
+        """Five-card hands that beat a hand of this strength."""
+        return self.above[self.rank(strength) - 1]
+
+    def worse(self, strength):
+        """Five-card hands that a hand of this strength beats."""
+        return self.total - self.above[self.rank(strength)]
+
+    def percentile(self, strength):
+        """Share of the five-card hands that a hand of this strength beats."""
+        return self.worse(strength) / self.total
+
+    def between(self, best, worst):
+        """Five-card hands ranked from best to worst, both included."""
+        return self.above[self._index(worst) + 1] - self.above[self._index(best)]
+
+    def _index(self, rank):
+        if not 1 <= rank <= len(self.strengths):
+            raise ValueError("rank must be 1 to {}, got {}".format(len(self.strengths), rank))
+        return rank - 1
@@ -0,0 +1,276 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+A showdown service: frames are a 4-byte big-endian length followed by a
+UTF-8 JSON object. Requests look like
+
+    {"id": 7, "op": "showdown", "games": [[["AS", "KS", ...], ["2C", ...]], ...]}
+    {"id": 8, "op": "evaluate", "hands": [["AS", "KS", "QS", "JS", "TS"], ...]}
+    {"id": 9, "op": "stats"}
+
+and each gets {"id": ..., "result": ...} or {"id": ..., "error": "..."}
+back on the same connection, in whatever order they finish.
+'''
+
+import asyncio
+import itertools
+import json
+import struct
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from poker import Cli
+from poker import Evaluator
+
+LENGTH = struct.Struct('>I')
+MAX_FRAME = 1 << 26
+
+
+def strength_of(hand):
+    """Cli.strength_of a hand from a request, once it is checked to be 5 to 7 card strings."""
+    if not isinstance(hand, list) or not 5 <= len(hand) <= 7:
+        raise ValueError("expected a list of 5 to 7 cards, got {!r}".format(hand))
+    for name in hand:
+        if not isinstance(name, str) or name not in Cli.CODES:
+            raise ValueError("not a card: {!r}".format(name))
+    return Cli.strength_of(hand)
+
+
+def evaluate(hands):
+    """[strength, WinPatterns.order index] for each hand of card strings."""
+    results = []
+    for hand in hands:
+        strength = strength_of(hand)
+        results.append([strength, Evaluator.score_of(strength)])
+    return results
+
+
+def showdown(games):
+    """Indices of the winning hands in each game; several means a split pot."""
+    results = []
+    for hands in games:
+        strengths = [strength_of(hand) for hand in hands]
+        best = max(strengths)
+        results.append([i for i, strength in enumerate(strengths) if strength == best])
+    return results
+
+
+OPERATIONS = {"evaluate": ("hands", evaluate), "showdown": ("games", showdown)}
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    """Nearest-rank percentiles of samples, keyed like "p50"."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"p{}".format(point): None for point in points}
+    return {"p{}".format(point): ordered[min(len(ordered) - 1, len(ordered) * point // 100)]
+            for point in points}
+
+
+async def read_frame(reader):
+    """The next decoded message, or None when the peer closes the connection."""
+    try:
+        header = await reader.readexactly(LENGTH.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = LENGTH.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError("frame of {} bytes is too large".format(length))
+    return json.loads(await reader.readexactly(length))
+
+
+def frame(message):
+    body = json.dumps(message, separators=(',', ':')).encode()
+    return LENGTH.pack(len(body)) + body
+
+
+class Server:
+    """Serves requests over TCP or a Unix socket, scoring hands in a process pool.
+
+    Latencies (seconds from a request being read to its reply being queued)
+    of the most recent requests are kept for the "stats" operation.
+    """
+    def __init__(self, workers=None, history=10000):
+        self.workers = workers
+        self.executor = None
+        self.server = None
+        self.latencies = deque(maxlen=history)
+        self.requests = 0
+        self.connections = 0
+        self.handlers = {}
+
+    async def start(self, host='127.0.0.1', port=0, path=None, backlog=4096):
+        self.executor = ProcessPoolExecutor(self.workers)
+        if path is None:
+            self.server = await asyncio.start_server(self.serve, host, port, backlog=backlog)
+        else:
+            self.server = await asyncio.start_unix_server(self.serve, path, backlog=backlog)
+        return self
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        """Stop accepting, hang up on every client and wait for their handlers."""
+        self.server.close()
+        await self.server.wait_closed()
+        for writer in list(self.handlers.values()):
+            writer.close()
+        if self.handlers:
+            await asyncio.wait(list(self.handlers))
+        self.executor.shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def stats(self):
+        stats = percentiles(self.latencies)
+        stats.update(requests=self.requests, connections=self.connections)
+        return stats
+
+    async def serve(self, reader, writer):
+        handler = asyncio.current_task()
+        self.handlers[handler] = writer
+        self.connections += 1
+        pending = set()
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except (ValueError, ConnectionError):
+                    break
+                if request is None:
+                    break
+                task = asyncio.ensure_future(self.answer(request, writer))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+        finally:
+            self.connections -= 1
+            del self.handlers[handler]
+            writer.close()
+
+    async def answer(self, request, writer):
+        start = time.perf_counter()
+        reply = {"id": request.get("id") if isinstance(request, dict) else None}
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object, got {}".format(type(request).__name__))
+            op = request.get("op")
+            if op == "stats":
+                reply["result"] = self.stats()
+            elif op in OPERATIONS:
+                field, function = OPERATIONS[op]
+                loop = asyncio.get_running_loop()
+                reply["result"] = await loop.run_in_executor(self.executor, function, request[field])
+            else:
+                raise ValueError("unknown op {!r}".format(op))
+        except Exception as error:
+            # Anything a request can raise becomes its error reply, so every
+            # request gets an answer and the connection stays up.
+            reply["error"] = "{}: {}".format(type(error).__name__, error)
+        self.requests += 1
+        self.latencies.append(time.perf_counter() - start)
+        writer.write(frame(reply))
+        await writer.drain()
+
+
+class Connection:
+    """One pipelined client connection; replies are matched to requests by id."""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.listener = asyncio.ensure_future(self.listen())
+
+    async def listen(self):
+        try:
+            while True:
+                reply = await read_frame(self.reader)
+                if reply is None:
+                    break
+                future = self.waiting.pop(reply.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(reply)
+        finally:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection closed"))
+            self.waiting.clear()
+
+    async def send(self, request):
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[request["id"]] = future
+        self.writer.write(frame(request))
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.listener
+
+
+class Client:
+    """A pool of pipelined connections to a Server, used round-robin.
+
+    Any number of requests may be in flight on each connection; latencies
+    of completed requests are kept for percentiles().
+    """
+    def __init__(self, host='127.0.0.1', port=None, path=None, size=4, history=10000):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.size = size
+        self.connections = []
+        self.turn = itertools.cycle(range(size))
+        self.ids = itertools.count()
+        self.latencies = deque(maxlen=history)
+
+    async def connect(self):
+        for _ in range(self.size):
+            if self.path is None:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+            else:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            self.connections.append(Connection(reader, writer))
+        return self
+
+    async def close(self):
+        for connection in self.connections:
+            await connection.close()
+        self.connections = []
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, op, **fields):
+        message = dict(fields, id=next(self.ids), op=op)
+        start = time.perf_counter()
+        reply = await self.connections[next(self.turn)].send(message)
+        self.latencies.append(time.perf_counter() - start)
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        return reply["result"]
+
+    async def evaluate(self, hands):
+        return await self.request("evaluate", hands=hands)
+
+    async def showdown(self, games):
+        return await self.request("showdown", games=games)
+
+    async def stats(self):
+        return await self.request("stats")
+
+    def percentiles(self, points=(50, 90, 99)):
+        return percentiles(self.latencies, points)
@@ -0,0 +1,196 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Evaluator tables and a strength cache in multiprocessing.shared_memory,
+so every worker of a pool reads one copy instead of holding its own. The
+parent creates the blocks and the workers attach to them by name:
+
+    with Shared.SharedTables() as tables, Shared.SharedStrengthCache() as cache:
+        with Pool(initializer=Shared.attach, initargs=(tables.name, cache.name)) as pool:
+            ...
+
+or, in short, with Shared.pool(cache=True) as pool.
+
+Only the process that created a block unlinks it, when it leaves the with
+block or calls unlink(); workers just close their handles. Workers should
+be children of the creator, which share its resource tracker; another
+program attaching by name may have the block unlinked when it exits.
+'''
+
+from contextlib import ExitStack, contextmanager
+from math import comb
+from multiprocessing import Pool, shared_memory
+
+from poker import Deck
+from poker import Evaluator
+from poker import TableCache
+
+
+class SharedBlock:
+    """A named block of shared memory: created when name is None, attached otherwise."""
+    def __init__(self, name=None, size=0):
+        self.memory = shared_memory.SharedMemory(name, create=name is None, size=size)
+        self.owner = name is None
+
+    @property
+    def name(self):
+        return self.memory.name
+
+    def close(self):
+        """Detach this process; the block lives on until unlinked."""
+        self.memory.close()
+
+    def unlink(self):
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+class SharedTables(SharedBlock):
+    """A LookupEvaluator's tables as a TableCache image in shared memory.
+
+    Without a name, builds (or loads) the tables of evaluator, Evaluator.lookup
+    by default, into a new block. install() points an evaluator at views of
+    the block, so it looks hands up in place instead of in tables of its own.
+    """
+    def __init__(self, name=None, evaluator=None):
+        image = None
+        if name is None:
+            evaluator = evaluator or Evaluator.lookup
+            if evaluator.best_products is None:
+                evaluator.build_best()
+            image = TableCache.pack(evaluator.table_key(), {
+                table: getattr(evaluator, table)
+                for table in evaluator.FIVE_CARD_TABLES + evaluator.BEST_TABLES})
+        super().__init__(name, 0 if image is None else len(image))
+        if image is not None:
+            self.memory.buf[:len(image)] = image
+        self.tables = TableCache.Tables(self.memory.buf, "shared memory {}".format(self.name))
+        self.installed = []
+
+    def install(self, evaluator=None):
+        """Make evaluator (Evaluator.lookup by default) use the shared tables.
+
+        Raises ValueError if they were built for other rules.
+        """
+        evaluator = evaluator or Evaluator.lookup
+        if evaluator.table_key() != self.tables.key:
+            raise ValueError("shared tables of {!r}, not {!r}".format(
+                self.tables.key, evaluator.table_key()))
+        views = {table: self.tables.view(table)
+                 for table in evaluator.FIVE_CARD_TABLES + evaluator.BEST_TABLES}
+        for table, view in views.items():
+            setattr(evaluator, table, view)
+        self.installed.append((evaluator, views))
+        return evaluator
+
+    def close(self):
+        """Detach, leaving installed evaluators to build or load tables of their own."""
+        for evaluator, views in self.installed:
+            for table, view in views.items():
+                if getattr(evaluator, table) is view:
+                    setattr(evaluator, table, None)
+                view.release()
+        self.installed = []
+        self.tables = None
+        super().close()
+
+
+# BINOMIALS[k][n] is C(n, k): the colex rank of a sorted five-card hand is
+# the sum of C(code, position + 1) over its codes.
+BINOMIALS = [[comb(n, k) for n in range(52)] for k in range(6)]
+HANDS = comb(52, 5)
+
+
+class SharedStrengthCache(SharedBlock):
+    """Strength keys of five-card hands, filled in by whichever process
+    meets a hand first and read by all of them.
+
+    One int32 slot per hand of the 52-card deck, indexed by its colex rank,
+    so there is nothing to evict or lock: a slot is either MISSING or holds
+    the final key. Like Canonical.StrengthCache it can be set as
+    Deck.Hand.cache; it must only ever see one evaluator's strengths.
+    Other hands (jokers, not five cards) are evaluated every time.
+    """
+    def __init__(self, name=None):
+        super().__init__(name, 4 * HANDS)
+        if self.owner:
+            self.memory.buf[:4 * HANDS] = b'\xff' * (4 * HANDS)
+        self.entries = self.memory.buf[:4 * HANDS].cast('i')
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, codes, compute):
+        """The strength cached for card codes, calling compute() to fill it on a miss."""
+        if len(codes) != 5 or Deck.Card.joker.code in codes or len(set(codes)) != 5:
+            return compute()
+        a, b, c, d, e = sorted(codes)
+        index = (BINOMIALS[1][a] + BINOMIALS[2][b] + BINOMIALS[3][c] + BINOMIALS[4][d]
+                 + BINOMIALS[5][e])
+        strength = self.entries[index]
+        if strength != TableCache.MISSING:
+            self.hits += 1
+            return strength
+        self.misses += 1
+        strength = self.entries[index] = compute()
+        return strength
+
+    def strength(self, hand, evaluator=None):
+        evaluator = evaluator or Evaluator.lookup
+        return self.get([card.code for card in hand.cards], lambda: evaluator.strength(hand))
+
+    def strength_of_codes(self, codes, evaluator=None):
+        evaluator = evaluator or Evaluator.lookup
+        return self.get(codes, lambda: evaluator.strength_of_codes(codes))
+
+    def info(self):
+        """This process's hits and misses."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        self.entries.release()
+        super().close()
+
+
+# Blocks a worker has attached to, kept open for the life of the process.
+attached = []
+
+
+def attach(tables=None, cache=None):
+    """Pool initializer: attach to SharedTables and a SharedStrengthCache by name.
+
+    The tables are installed into Evaluator.lookup and the cache becomes
+    Deck.Hand.cache; either name may be None.
+    """
+    if tables is not None:
+        shared = SharedTables(tables)
+        shared.install()
+        attached.append(shared)
+    if cache is not None:
+        shared = SharedStrengthCache(cache)
+        Deck.Hand.cache = shared
+        attached.append(shared)
+
+
+def names():
+    """Names of the blocks this process has attached to."""
+    return [block.name for block in attached]
+
+
+@contextmanager
+def pool(workers=None, tables=True, cache=False):
+    """A Pool whose workers attach to new SharedTables and, with cache, a
+    SharedStrengthCache; both are unlinked when the pool is done."""
+    with ExitStack() as blocks:
+        shared = (blocks.enter_context(SharedTables()).name if tables else None,
+                  blocks.enter_context(SharedStrengthCache()).name if cache else None)
+        with Pool(workers, initializer=attach, initargs=shared) as workers_pool:
+            yield workers_pool
@@ -0,0 +1,299 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+
+Evaluator tables cached on disk, so they are built once per machine rather
+than once per process. A cache file holds named sections after a header
+and a key naming the evaluator and rules that built them:
+
+    masks     8192 int32 entries indexed by rank mask, MISSING for None
+    products  an open-addressed hash table: a prime number of uint64 rank
+              products (0 for an empty slot), then their int32 entries
+
+The file is memory-mapped and checked against its checksum before
+anything is read from it. load() copies small sections into lists and
+dicts; mapped() serves large ones in place through memoryviews, so every
+process using them shares the file's pages. The same image can be placed
+anywhere else a buffer lives, such as shared memory (see Shared). Bump
+VERSION whenever the tables an evaluator builds change.
+'''
+
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+MAGIC = b'PKRT'
+VERSION = 2
+HEADER = struct.Struct('<4sHHIIQ')  # magic, version, section count, key length, checksum, size
+SECTION = struct.Struct('<16sII')  # name, kind, entry count
+MASKS, PRODUCTS = 0, 1
+MASK_ENTRIES = 1 << 13
+MISSING = -1
+
+
+def directory():
+    """Where cache files go: $POKER_TABLES, or None when that is set but empty.
+
+    Defaults to poker under $XDG_CACHE_HOME or ~/.cache.
+    """
+    path = os.environ.get('POKER_TABLES')
+    if path is not None:
+        return path or None
+    cache = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache, 'poker')
+
+
+def path_for(key, folder):
+    return os.path.join(folder, "tables-{:08x}.bin".format(zlib.crc32(key.encode())))
+
+
+def _padding(size):
+    return -size % 8
+
+
+def _slots(count):
+    """The smallest odd prime that leaves a products section at most half full."""
+    slots = 2 * count + 1
+    while any(slots % divisor == 0 for divisor in range(3, int(slots ** 0.5) + 1, 2)):
+        slots += 2
+    return slots
+
+
+def pack(key, tables):
+    """The image of a cache file holding tables, a dict from section name to
+    an 8192-entry list or a {product: entry} dict (or views of either)."""
+    key = key.encode()
+    sections, data = [], []
+    for name, table in tables.items():
+        if isinstance(table, (dict, ProductView)):
+            slots = _slots(len(table))
+            keys = array('Q', bytes(8 * slots))
+            entries = array('i', [MISSING]) * slots
+            for product, entry in table.items():
+                slot = product % slots
+                while keys[slot]:
+                    slot = (slot + 1) % slots
+                keys[slot] = product
+                entries[slot] = entry
+            sections.append(SECTION.pack(name.encode(), PRODUCTS, slots))
+            data.append(keys.tobytes())
+            data.append(entries.tobytes() + bytes(_padding(4 * slots)))
+        else:
+            if len(table) != MASK_ENTRIES:
+                raise ValueError("section {}: expected {} entries, got {}".format(
+                    name, MASK_ENTRIES, len(table)))
+            sections.append(SECTION.pack(name.encode(), MASKS, MASK_ENTRIES))
+            data.append(array('i', [MISSING if entry is None else entry
+                                    for entry in table]).tobytes())
+    head = key + b''.join(sections)
+    body = head + bytes(_padding(HEADER.size + len(head))) + b''.join(data)
+    return HEADER.pack(MAGIC, VERSION, len(tables), len(key), zlib.crc32(body),
+                       HEADER.size + len(body)) + body
+
+
+def write(path, key, tables):
+    """Write the pack() of tables to path, replacing it atomically."""
+    image = pack(key, tables)
+    folder = os.path.dirname(path) or '.'
+    os.makedirs(folder, exist_ok=True)
+    # Written beside path and renamed over it, so readers never see half a file.
+    temporary = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(temporary, 'wb') as f:
+            f.write(image)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+class MaskView:
+    """A masks section read in place, indexed like the list it was packed from."""
+    def __init__(self, entries):
+        self.entries = entries
+
+    def __getitem__(self, mask):
+        entry = self.entries[mask]
+        return None if entry == MISSING else entry
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return (None if entry == MISSING else entry for entry in self.entries)
+
+    def release(self):
+        self.entries.release()
+
+
+class ProductView:
+    """A products section read in place, looked up like the dict it was packed from."""
+    def __init__(self, keys, entries):
+        self.keys = keys
+        self.entries = entries
+        self.slots = len(keys)
+
+    def get(self, product, default=None):
+        keys = self.keys
+        slot = product % self.slots
+        key = keys[slot]
+        while key != product:
+            if not key:
+                return default
+            slot += 1
+            if slot == self.slots:
+                slot = 0
+            key = keys[slot]
+        return self.entries[slot]
+
+    def __getitem__(self, product):
+        entry = self.get(product)
+        if entry is None:
+            raise KeyError(product)
+        return entry
+
+    def __contains__(self, product):
+        return self.get(product) is not None
+
+    def __len__(self):
+        return self.slots - self.keys.tolist().count(0)
+
+    def items(self):
+        return ((key, entry) for key, entry in zip(self.keys, self.entries) if key)
+
+    def release(self):
+        self.keys.release()
+        self.entries.release()
+
+
+class Tables:
+    """Sections of a cache image in buffer, read without copying.
+
+    source names the buffer in errors. Raises ValueError if it is not a
+    cache image of this VERSION, is damaged, or (given key) was built for
+    something else. Views handed out by view() must be released before the
+    buffer is.
+    """
+    def __init__(self, buffer, source, key=None):
+        data = memoryview(buffer)
+        try:
+            self._read_header(data, source, key)
+        finally:
+            data.release()
+        self.buffer = buffer
+
+    def _read_header(self, data, source, key):
+        if len(data) < HEADER.size:
+            raise ValueError("{}: not a table cache".format(source))
+        magic, version, count, key_length, checksum, size = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("{}: not a table cache".format(source))
+        if version != VERSION:
+            raise ValueError("{}: unsupported table cache version {}".format(source, version))
+        if len(data) < size or zlib.crc32(data[HEADER.size:size]) != checksum:
+            raise ValueError("{}: checksum mismatch".format(source))
+        offset = HEADER.size
+        self.key = bytes(data[offset:offset + key_length]).decode()
+        if key is not None and self.key != key:
+            raise ValueError("{}: tables of {!r}, not {!r}".format(source, self.key, key))
+        offset += key_length
+        directory = []
+        for _ in range(count):
+            directory.append(SECTION.unpack_from(data, offset))
+            offset += SECTION.size
+        offset += _padding(offset)
+        self.sections = {}
+        for name, kind, entries in directory:
+            self.sections[name.rstrip(b'\0').decode()] = (kind, offset, entries)
+            offset += entries * 4 if kind == MASKS else entries * 8 + entries * 4
+            offset += _padding(offset)
+        if offset != size:
+            raise ValueError("{}: truncated table cache".format(source))
+
+    def view(self, name):
+        """A MaskView or ProductView of a section."""
+        kind, offset, entries = self.sections[name]
+        data = memoryview(self.buffer)
+        if kind == MASKS:
+            return MaskView(data[offset:offset + entries * 4].cast('i'))
+        middle = offset + entries * 8
+        return ProductView(data[offset:middle].cast('Q'),
+                           data[middle:middle + entries * 4].cast('i'))
+
+    def table(self, name):
+        """A section as the list or dict it was packed from."""
+        view = self.view(name)
+        try:
+            if isinstance(view, MaskView):
+                return [None if entry == MISSING else entry for entry in view.entries.tolist()]
+            table = dict(zip(view.keys.tolist(), view.entries.tolist()))
+            table.pop(0, None)
+            return table
+        finally:
+            view.release()
+
+
+class TableFile(Tables):
+    """A memory-mapped cache file."""
+    def __init__(self, path, key=None):
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            super().__init__(self.map, path, key)
+        except ValueError:
+            self.map.close()
+            raise
+
+    def close(self):
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load(key, names):
+    """The named tables cached for key, or None if the cache is off, missing or stale."""
+    folder = directory()
+    if folder is None:
+        return None
+    try:
+        with TableFile(path_for(key, folder), key) as tables:
+            return {name: tables.table(name) for name in names}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def mapped(key, names):
+    """Views of the named tables cached for key, read in place, or None if the
+    cache is off, missing or stale.
+
+    The file stays mapped for as long as any of the views is in use.
+    """
+    folder = directory()
+    if folder is None:
+        return None
+    try:
+        tables = TableFile(path_for(key, folder), key)
+    except (OSError, ValueError):
+        return None
+    if any(name not in tables.sections for name in names):
+        tables.close()
+        return None
+    return {name: tables.view(name) for name in names}
+
+
+def store(key, tables):
+    """Cache tables for key, if the cache is on and writable."""
+    folder = directory()
+    if folder is None:
+        return
+    try:
+        write(path_for(key, folder), key, tables)
+    except OSError:
+        pass
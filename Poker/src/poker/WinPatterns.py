@@ -1,252 +1,283 @@
-'''
-Created on Jun 3, 2016
-
-@author: Daniel
-'''
-
-from poker import Deck
-
-class WinPattern:
-    """"""
-    def __init__(self, hand):
-        self.cards = hand.cards
-        self.ranks = [card.rank for card in self.cards]
-        self.suits = [card.suit for card in self.cards]
-    
-    def criterion(self):
-        """Return true if hand matches this pattern."""
-        pass
-    
-    # TODO: Make property?
-    def values(self):
-        """A list ranks of the cards involved."""
-        pass
-    
-    # TODO Refactor to MatchingCards subclass?
-    def has_n(self, card, n):
-        return self.ranks.count(card.rank) == n
-    
-    def trumps(self, other):
-        raise NotImplementedError
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, self.values())
-    
-
-class HighCard(WinPattern):
-    """The highest-ranking card in a hand."""
-    def __init__(self, hand):
-        super().__init__(hand)
-            
-    def criterion(self):
-        return True
-    
-    def values(self):
-        return self.cards[0]
-    
-    def trumps(self, other):
-        for i, card in enumerate(self.cards):
-            if card != other.cards[i]:
-                return other.cards[i] < card
-        raise NotImplementedError # Draw
-   
-          
-class Pair(WinPattern):
-    """A hand has two cards of the same rank."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def criterion(self):
-        return len(set([card.rank for card in self.cards if self.has_n(card, 2)])) == 1 
-    
-    def values(self):
-        for card in self.cards:
-            if self.has_n(card, 2):
-                return card
-    
-    def trumps(self, that):
-        if self.values() != that.values():
-            return that.values() < self.values()
-        return HighCard.trumps(self, that)
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, self.values().rank)
-
-
-class TwoPair(WinPattern):
-    """A hand has two sets of two cards of the same rank."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def criterion(self):
-        return len(set([card.rank for card in self.cards if self.has_n(card, 2)])) == 2 
-    
-    def values(self):
-        return sorted(list(set([card.rank for card in self.cards if self.has_n(card, 2)])))
-    
-    def trumps(self, other):
-        pair_ranks = self.values()
-        other_pair_ranks = other.values()
-        for i, rank in enumerate(pair_ranks):
-            if Deck.Card.ranks.index(rank) != Deck.Card.ranks.index(other_pair_ranks[i]):
-                return Deck.Card.ranks.index(other_pair_ranks[i]) < Deck.Card.ranks.index(rank) 
-        return HighCard.trumps(self, other)
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, ','.join(self.values()))
-    
-        
-class ThreeOfAKind(WinPattern):
-    """A hand has three cards of the same rank."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def criterion(self):
-        return any([self.has_n(card, 3) for card in self.cards])
-    
-    def values(self):
-        for card in self.cards:
-            if self.has_n(card, 3):
-                return card
-
-    def trumps(self, that):
-        if self.values() != that.values():
-            return that.values() < self.values()
-        return HighCard.trumps(self, that)
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, self.values().rank) 
-
-
-class Straight(WinPattern):
-    """A hand has five cards with consecutive ranks."""
-    def __init__(self, hand):
-        super().__init__(hand)
-        
-    def values(self): 
-        return [min(self.cards).rank, max(self.cards).rank]
-    
-    def criterion(self):
-        start_index = Deck.Card.ranks.index(self.cards[0].rank)
-        for i in range(5):
-            if self.cards[i].rank != Deck.Card.ranks[start_index - i]:
-                return False
-        return True
-    
-    def trumps(self, other):
-        return HighCard.trumps(self, other)
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, '-'.join(self.values()))
-      
-
-class Flush(WinPattern):
-    """A hand has cards of only one suit."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def values(self):
-        return ''.join(set(self.suits))
-    
-    def criterion(self):
-        return len(set(self.suits)) == 1
-    
-    def trumps(self, other):
-        return HighCard.trumps(self, other)
-    
-
-class FullHouse(WinPattern):
-    """A hand has a pair and a three-of-a-kind of different ranks."""
-    def __init__(self, hand):
-        super().__init__(hand)
-        
-    def values(self):
-        return [ThreeOfAKind(self).values().rank, Pair(self).values().rank]
-        
-    def criterion(self):
-        return Pair(self).criterion() and ThreeOfAKind(self).criterion()
-    
-    def trumps(self, that):
-        this_triplet_card = ThreeOfAKind(self).values()
-        that_triplet_card = ThreeOfAKind(that).values()
-
-        if this_triplet_card != that_triplet_card:
-            return that_triplet_card < this_triplet_card 
-        else:
-            pair = Pair(self).values()
-            other_pair = Pair(self).values()
-            if pair != other_pair:
-                return other_pair < pair
-            raise NotImplementedError # Draw
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, ','.join(self.values()))
-
-
-class FourOfAKind(WinPattern):
-    """A hand has four cards of the same rank."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def criterion(self):
-        return any([self.has_n(card, 4) for card in self.cards])
-    
-    def values(self):
-        for card in self.cards:
-            if self.has_n(card, 4):
-                return card
-
-    def trumps(self, other):
-        if self.values() != other.values():
-            return other.values() < self.values()
-        return HighCard.trumps(self, other) 
-
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, self.values().rank) 
-
-
-class StraightFlush(WinPattern):
-    """A hand has consecutive cards of the same suit."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def values(self):
-        return Straight(self).values()
-    
-    def criterion(self):
-        return Straight(self).criterion() and Flush(self).criterion()
-    
-    def trumps(self, other):
-        return Straight(self).trumps(other)
-    
-    def __str__(self):
-        pattern = type(self).__name__
-        span = '-'.join(self.values())
-        suit = Flush(self).values()
-        return "{} ({}{})".format(pattern, span, suit)
-    
-
-class RoyalFlush(WinPattern):
-    """A hand has the highest consecutive cards of the same suit."""
-    def __init__(self, hand):
-        super().__init__(hand)
-    
-    def criterion(self):
-        return StraightFlush(self).criterion() and HighCard(self).values().rank == "A" 
-        
-    def trumps(self, other):
-        raise NotImplementedError # Draw
-    
-    def __str__(self):
-        return "{} ({})".format(type(self).__name__, Flush(self).values()) 
-
-
-order = [RoyalFlush, StraightFlush, FourOfAKind, FullHouse, Flush,
-         Straight, ThreeOfAKind, TwoPair, Pair, HighCard]
-
-
-if __name__ == "__main__":
-    import unittest
-    import sys
-    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
-    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
+'''
+Created on Jun 3, 2016
+
+@author: Daniel
+'''
+
+from collections import Counter
+
+class WinPattern:
+    """"""
+    def __init__(self, hand):
+        self.cards = hand.cards
+        self.ranks = [card.rank for card in self.cards]
+        self.suits = [card.suit for card in self.cards]
+        self._counts = None
+    
+    @property
+    def counts(self):
+        """Cards held of each rank, counted the first time they are needed."""
+        if self._counts is None:
+            self._counts = Counter(self.ranks)
+        return self._counts
+    
+    def criterion(self):
+        """Return true if hand matches this pattern."""
+        pass
+    
+    # TODO: Make property?
+    def values(self):
+        """A list ranks of the cards involved."""
+        pass
+    
+    # TODO Refactor to MatchingCards subclass?
+    def has_n(self, card, n):
+        return self.counts[card.rank] == n
+    
+    def trumps(self, other):
+        raise NotImplementedError
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, self.values())
+    
+
+class HighCard(WinPattern):
+    """The highest-ranking card in a hand."""
+    def __init__(self, hand):
+        super().__init__(hand)
+            
+    def criterion(self):
+        return True
+    
+    def values(self):
+        return self.cards[0]
+    
+    def trumps(self, other):
+        for i, card in enumerate(self.cards):
+            if card.value != other.cards[i].value:
+                return other.cards[i] < card
+        raise NotImplementedError # Draw
+   
+          
+class Pair(WinPattern):
+    """A hand has two cards of the same rank."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return len(set([card.rank for card in self.cards if self.has_n(card, 2)])) == 1 
+    
+    def values(self):
+        for card in self.cards:
+            if self.has_n(card, 2):
+                return card
+    
+    def trumps(self, that):
+        if self.values().value != that.values().value:
+            return that.values() < self.values()
+        return HighCard.trumps(self, that)
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, self.values().rank)
+
+
+class TwoPair(WinPattern):
+    """A hand has two sets of two cards of the same rank."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return len(set([card.rank for card in self.cards if self.has_n(card, 2)])) == 2 
+    
+    def values(self):
+        return sorted(list(set([card.rank for card in self.cards if self.has_n(card, 2)])))
+    
+    def pair_values(self):
+        return sorted(set(card.value for card in self.cards if self.has_n(card, 2)), reverse=True)
+    
+    def trumps(self, other):
+        for value, other_value in zip(self.pair_values(), other.pair_values()):
+            if value != other_value:
+                return other_value < value
+        return HighCard.trumps(self, other)
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, ','.join(self.values()))
+    
+        
+class ThreeOfAKind(WinPattern):
+    """A hand has three cards of the same rank."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return any([self.has_n(card, 3) for card in self.cards])
+    
+    def values(self):
+        for card in self.cards:
+            if self.has_n(card, 3):
+                return card
+
+    def trumps(self, that):
+        if self.values().value != that.values().value:
+            return that.values() < self.values()
+        return HighCard.trumps(self, that)
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, self.values().rank) 
+
+
+class Straight(WinPattern):
+    """A hand has five cards with consecutive ranks."""
+    def __init__(self, hand):
+        super().__init__(hand)
+        
+    def values(self): 
+        return [min(self.cards).rank, max(self.cards).rank]
+    
+    def criterion(self):
+        for i in range(5):
+            if self.cards[i].value != self.cards[0].value - i:
+                return False
+        return True
+    
+    def trumps(self, other):
+        return HighCard.trumps(self, other)
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, '-'.join(self.values()))
+      
+
+class Flush(WinPattern):
+    """A hand has cards of only one suit."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def values(self):
+        return ''.join(set(self.suits))
+    
+    def criterion(self):
+        return len(set(self.suits)) == 1
+    
+    def trumps(self, other):
+        return HighCard.trumps(self, other)
+    
+
+class FullHouse(WinPattern):
+    """A hand has a pair and a three-of-a-kind of different ranks."""
+    def __init__(self, hand):
+        super().__init__(hand)
+        
+    def values(self):
+        return [ThreeOfAKind(self).values().rank, Pair(self).values().rank]
+        
+    def criterion(self):
+        return Pair(self).criterion() and ThreeOfAKind(self).criterion()
+    
+    def trumps(self, that):
+        this_triplet_card = ThreeOfAKind(self).values()
+        that_triplet_card = ThreeOfAKind(that).values()
+
+        if this_triplet_card.value != that_triplet_card.value:
+            return that_triplet_card < this_triplet_card 
+        else:
+            pair = Pair(self).values()
+            other_pair = Pair(self).values()
+            if pair.value != other_pair.value:
+                return other_pair < pair
+            raise NotImplementedError # Draw
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, ','.join(self.values()))
+
+
+class FourOfAKind(WinPattern):
+    """A hand has four cards of the same rank."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return any([self.has_n(card, 4) for card in self.cards])
+    
+    def values(self):
+        for card in self.cards:
+            if self.has_n(card, 4):
+                return card
+
+    def trumps(self, other):
+        if self.values().value != other.values().value:
+            return other.values() < self.values()
+        return HighCard.trumps(self, other) 
+
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, self.values().rank) 
+
+
+class StraightFlush(WinPattern):
+    """A hand has consecutive cards of the same suit."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def values(self):
+        return Straight(self).values()
+    
+    def criterion(self):
+        return Straight(self).criterion() and Flush(self).criterion()
+    
+    def trumps(self, other):
+        return Straight(self).trumps(other)
+    
+    def __str__(self):
+        pattern = type(self).__name__
+        span = '-'.join(self.values())
+        suit = Flush(self).values()
+        return "{} ({}{})".format(pattern, span, suit)
+    
+
+class RoyalFlush(WinPattern):
+    """A hand has the highest consecutive cards of the same suit."""
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return StraightFlush(self).criterion() and HighCard(self).values().rank == "A" 
+        
+    def trumps(self, other):
+        raise NotImplementedError # Draw
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, Flush(self).values()) 
+
+
+class FiveOfAKind(WinPattern):
+    """A hand has five cards of the same rank, which takes a wild card.
+    
+    Not part of order: only rules that enable it rank it, above RoyalFlush.
+    """
+    def __init__(self, hand):
+        super().__init__(hand)
+    
+    def criterion(self):
+        return any([self.has_n(card, 5) for card in self.cards])
+    
+    def values(self):
+        return max(self.cards, key=lambda card: self.counts[card.rank])
+    
+    def trumps(self, other):
+        if self.values().value != other.values().value:
+            return other.values() < self.values()
+        raise NotImplementedError # Draw
+    
+    def __str__(self):
+        return "{} ({})".format(type(self).__name__, self.values().rank)
+
+
+order = [RoyalFlush, StraightFlush, FourOfAKind, FullHouse, Flush,
+         Straight, ThreeOfAKind, TwoPair, Pair, HighCard]
+
+
+if __name__ == "__main__":
+    import unittest
+    import sys
+    test_suite = unittest.TestLoader().discover("tests", top_level_dir="../..")
+    unittest.TextTestRunner(stream=sys.stdout).run(test_suite)
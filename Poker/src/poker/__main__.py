@@ -0,0 +1,9 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+
+from poker import Cli
+
+Cli.main()
@@ -0,0 +1,71 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import random
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from poker.Deck import Hand, Deck
+from poker import WinPatterns
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "CDHS"]
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        from poker import Batch
+        self.batch = Batch
+
+    def test_encode_rows_of_strings(self):
+        codes = self.batch.encode(["2C 2D AS", ["AH", "KS", "3D"]])
+        self.assertEqual([[0, 1, 51], [50, 47, 5]], codes.tolist())
+
+    def test_rejects_wrong_width(self):
+        with self.assertRaises(ValueError):
+            self.batch.evaluate(numpy.zeros((3, 4), dtype=numpy.uint8))
+
+    def test_categories(self):
+        scores, _ = self.batch.evaluate([["JH", "KH", "TH", "AH", "QH"],
+                                         ["5H", "5S", "7D", "7C", "7S"],
+                                         ["6C", "KD", "9H", "7S", "3D"]])
+        self.assertEqual([WinPatterns.order.index(WinPatterns.RoyalFlush),
+                          WinPatterns.order.index(WinPatterns.FullHouse),
+                          WinPatterns.order.index(WinPatterns.HighCard)], scores.tolist())
+
+    def test_matches_hands(self):
+        deal = random.Random(2018)
+        rows = [deal.sample(DECK, 5) for _ in range(3000)]
+        scores, strengths = self.batch.evaluate(rows, chunk_size=1000)
+        for row, score, strength in zip(rows, scores.tolist(), strengths.tolist()):
+            hand = Hand(row)
+            self.assertEqual(hand.score(), score, row)
+            self.assertEqual(hand.strength(), strength, row)
+
+    def test_matches_hands_with_repeated_cards(self):
+        rows = [["5H", "5H", "8H", "9H", "KH"], ["7S", "7S", "7S", "7S", "7S"],
+                ["3S", "6H", "6H", "8C", "8D"]]
+        scores, strengths = self.batch.evaluate(rows)
+        self.assertEqual([Hand(row).strength() for row in rows], strengths.tolist())
+
+    def test_deal_without_repeats(self):
+        dealt = self.batch.deal(Deck(dead=["AS", "KS"], seed=8), 5000, 7, chunk_size=1000)
+        self.assertEqual((5000, 7), dealt.shape)
+        ordered = numpy.sort(dealt, axis=1)
+        self.assertFalse((ordered[:, 1:] == ordered[:, :-1]).any())
+        self.assertFalse(numpy.isin(dealt, [51, 47]).any())
+
+    def test_seeded_deal_is_reproducible(self):
+        first = self.batch.deal(Deck(seed=9), 10, 5)
+        second = self.batch.deal(Deck(seed=9), 10, 5)
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_deal_feeds_evaluate(self):
+        scores, strengths = self.batch.evaluate(self.batch.deal(Deck(seed=10), 100, 5))
+        self.assertEqual(100, len(strengths))
@@ -0,0 +1,89 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import unittest
+
+from poker import Canonical
+from poker import Evaluator
+from poker.Deck import Card, Hand
+
+
+def codes(names):
+    return [Card(name).code for name in names]
+
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_suit_permutations_share_a_form(self):
+        hand_1 = Hand(["AS", "KS", "2H", "2D", "7C"])
+        hand_2 = Hand(["AH", "KH", "2C", "2S", "7D"])
+        self.assertEqual(Canonical.canonical_form(hand_1), Canonical.canonical_form(hand_2))
+
+    def test_different_suit_structure_differs(self):
+        flush = Hand(["AS", "KS", "QS", "JS", "9S"])
+        offsuit = Hand(["AS", "KS", "QS", "JS", "9H"])
+        self.assertNotEqual(Canonical.canonical_form(flush), Canonical.canonical_form(offsuit))
+
+    def test_matchups_keep_suits_consistent_across_hands(self):
+        same_suit = [codes(["AS", "KS"]), codes(["QS", "JS"])]
+        renamed = [codes(["AH", "KH"]), codes(["QH", "JH"])]
+        split = [codes(["AS", "KS"]), codes(["QH", "JH"])]
+        self.assertEqual(Canonical.canonical_codes(same_suit), Canonical.canonical_codes(renamed))
+        self.assertNotEqual(Canonical.canonical_codes(same_suit), Canonical.canonical_codes(split))
+
+
+class TestStrengthCache(unittest.TestCase):
+    def tearDown(self):
+        Hand.cache = None
+
+    def test_hits_on_suit_permutations(self):
+        cache = Canonical.StrengthCache()
+        first = cache.strength(Hand(["AS", "KS", "2H", "2D", "7C"]), Evaluator.reference)
+        second = cache.strength(Hand(["AH", "KH", "2C", "2S", "7D"]), Evaluator.reference)
+        self.assertEqual(first, second)
+        self.assertEqual((1, 1, 1), (cache.hits, cache.misses, len(cache)))
+
+    def test_hits_on_the_same_cards(self):
+        cache = Canonical.StrengthCache()
+        first = cache.strength(Hand(["AS", "KS", "2H", "2D", "7C"]), Evaluator.reference)
+        second = cache.strength(Hand(["7C", "2D", "2H", "KS", "AS"]), Evaluator.reference)
+        self.assertEqual(first, second)
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0, "size": 1, "maxsize": 1 << 16},
+                         cache.info())
+
+    def test_evicts_least_recently_used(self):
+        cache = Canonical.StrengthCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 1)
+        cache.get("c", lambda: 3)
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(["a", "c"], list(cache.entries))
+
+    def test_in_front_of_hand_strength(self):
+        Hand.cache = Canonical.StrengthCache()
+        hand = Hand(["5H", "5S", "7D", "7C", "7S"])
+        hand.evaluator = Evaluator.reference
+        same = Hand(["5H", "5S", "7D", "7C", "7S"])
+        same.evaluator = Evaluator.reference
+        self.assertEqual(hand.strength(), same.strength())
+        self.assertEqual(1, Hand.cache.hits)
+
+    def test_keyed_on_the_evaluator(self):
+        class Doubled(Evaluator.ReferenceEvaluator):
+            def strength(self, hand):
+                return 2 * super().strength(hand)
+
+        cache = Canonical.StrengthCache()
+        hand = Hand(["AS", "2H", "3D", "4C", "5S"])
+        single = cache.strength(hand, Evaluator.reference)
+        self.assertEqual(2 * single, cache.strength(hand, Doubled()))
+        self.assertEqual(single, cache.strength(hand, Evaluator.reference))
+        self.assertEqual(2, cache.misses)
+
+    def test_table_evaluators_bypass_the_cache(self):
+        cache = Canonical.StrengthCache()
+        hand = Hand(["AS", "KS", "2H", "2D", "7C"])
+        self.assertEqual(Evaluator.lookup.strength(hand), cache.strength(hand))
+        self.assertEqual(0, len(cache))
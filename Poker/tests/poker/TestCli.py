@@ -0,0 +1,44 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import io
+import unittest
+
+from poker import Cli
+
+GAMES = ["5H 5C 6S 7S KD 2C 3S 8S 8D TD\n",
+         "5D 8C 9S JS AC 2C 5C 7D 8S QH\n",
+         "\n",
+         "2S 3C 4D 5H 6S 2H 3D 4C 5S 6D\n"]
+
+
+class TestRun(unittest.TestCase):
+    def test_one_outcome_per_game(self):
+        out = io.StringIO()
+        Cli.run(GAMES, out, chunk_size=2)
+        self.assertEqual("2\n1\nD\n", out.getvalue())
+
+    def test_summary(self):
+        out = io.StringIO()
+        Cli.run(GAMES, out, summary=True)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(["games 3", "player_1_wins 1", "player_2_wins 1", "draws 1"], lines[:4])
+        self.assertIn("Straight 2", lines)
+        self.assertIn("Pair 2", lines)
+
+    def test_bad_line_reports_line_number(self):
+        with self.assertRaisesRegex(ValueError, "line 2: expected 10 cards"):
+            Cli.run(GAMES[:1] + ["5D 8C\n"], io.StringIO())
+
+    def test_bad_card(self):
+        with self.assertRaisesRegex(ValueError, "not a card"):
+            Cli.play("5D 8C 9S JS AC 2C 5C 7D 8S ZZ")
+
+
+class TestStrengthOf(unittest.TestCase):
+    def test_matches_hand(self):
+        from poker.Deck import Hand
+        for names in (["5H", "5C", "6S", "7S", "KD"], ["5H", "5H", "8H", "9H", "KH"]):
+            self.assertEqual(Hand(names).strength(), Cli.strength_of(names))
@@ -1,78 +1,165 @@
-'''
-Created on Jun 4, 2016
-
-@author: Daniel
-'''
-import unittest
-
-from poker.Deck import Card, Hand
-from poker import WinPatterns
-from poker.WinPatterns import HighCard, Pair, TwoPair, ThreeOfAKind, Straight, Flush, FullHouse, FourOfAKind, StraightFlush, RoyalFlush
-
-class TestCard(unittest.TestCase):
-    def test_card(self):
-        card = Card("AS")
-        self.assertEqual("A", card.rank)
-        self.assertEqual("S", card.suit)
-    
-    def test_ace_high(self):
-        low_card = Card("2S")
-        high_card = Card("AS")
-        self.assertLess(low_card, high_card)
-        
-    def test_draw(self):
-        ace_1 = Card("AS")
-        ace_2 = Card("AH")
-        self.assertEqual(ace_1, ace_2)
-        
-    def test_ace_beats_queen(self):
-        queen = Card("QH")
-        ace = Card("AH")
-        self.assertLess(queen, ace)
-        
-    def test_ten_beats_nine(self):
-        ten = Card("TH")
-        nine = Card("9H")
-        self.assertLess(nine, ten)
-
-        
-class TestHand(unittest.TestCase):
-    def test_high_card(self):
-        hand = Hand(["6C", "KD", "9H", "7S", "3D"])
-        self.assertEqual(WinPatterns.order.index(HighCard), hand.score())                      
-
-    def test_pair(self):
-        hand = Hand(["6C", "KD", "6H", "7S", "3D"])
-        self.assertEqual(WinPatterns.order.index(Pair), hand.score())
-        
-    def test_two_pair(self):
-        hand = Hand(["6C", "KD", "6H", "3S", "3D"])
-        self.assertEqual(WinPatterns.order.index(TwoPair), hand.score())
-                
-    def test_three_of_a_kind(self):
-        hand = Hand(["6C", "KD", "3H", "3S", "3D"])
-        self.assertEqual(WinPatterns.order.index(ThreeOfAKind), hand.score())
-
-    def test_straight(self):
-        hand = Hand(["6H", "3S", "4H", "2C", "5H"])
-        self.assertEqual(WinPatterns.order.index(Straight), hand.score())
-
-    def test_flush(self):
-        hand = Hand(["TH", "7H", "2H", "KH", "3H"])
-        self.assertEqual(WinPatterns.order.index(Flush), hand.score())
-        
-    def test_full_house(self):
-        hand = Hand(["5H", "5S", "7D", "7C", "7S"])
-        self.assertEqual(WinPatterns.order.index(FullHouse), hand.score())
-    
-    def test_four_of_a_kind(self):
-        hand = Hand(["JH", "7H", "7D", "7C", "7S"])
-        self.assertEqual(WinPatterns.order.index(FourOfAKind), hand.score())
-    
-    def test_straight_flush(self):
-        hand = Hand(["JH", "8H", "TH", "9H", "7H"])
-        self.assertEqual(WinPatterns.order.index(StraightFlush), hand.score())    
-
-    def test_royal_flush(self):
-        hand = Hand(["JH", "KH", "TH", "AH", "QH"])
-        self.assertEqual(WinPatterns.order.index(RoyalFlush), hand.score())
+'''
+Created on Jun 4, 2016
+
+@author: Daniel
+'''
+import unittest
+
+from poker.Deck import Card, Hand, Deck
+from poker import WinPatterns
+from poker.WinPatterns import HighCard, Pair, TwoPair, ThreeOfAKind, Straight, Flush, FullHouse, FourOfAKind, StraightFlush, RoyalFlush
+
+class TestCard(unittest.TestCase):
+    def test_card(self):
+        card = Card("AS")
+        self.assertEqual("A", card.rank)
+        self.assertEqual("S", card.suit)
+    
+    def test_ace_high(self):
+        low_card = Card("2S")
+        high_card = Card("AS")
+        self.assertLess(low_card, high_card)
+        
+    def test_draw(self):
+        ace_1 = Card("AS")
+        ace_2 = Card("AH")
+        self.assertFalse(ace_1 < ace_2)
+        self.assertFalse(ace_2 < ace_1)
+        
+    def test_ace_beats_queen(self):
+        queen = Card("QH")
+        ace = Card("AH")
+        self.assertLess(queen, ace)
+        
+    def test_ten_beats_nine(self):
+        ten = Card("TH")
+        nine = Card("9H")
+        self.assertLess(nine, ten)
+
+        
+class TestHand(unittest.TestCase):
+    def test_high_card(self):
+        hand = Hand(["6C", "KD", "9H", "7S", "3D"])
+        self.assertEqual(WinPatterns.order.index(HighCard), hand.score())                      
+
+    def test_pair(self):
+        hand = Hand(["6C", "KD", "6H", "7S", "3D"])
+        self.assertEqual(WinPatterns.order.index(Pair), hand.score())
+        
+    def test_two_pair(self):
+        hand = Hand(["6C", "KD", "6H", "3S", "3D"])
+        self.assertEqual(WinPatterns.order.index(TwoPair), hand.score())
+                
+    def test_three_of_a_kind(self):
+        hand = Hand(["6C", "KD", "3H", "3S", "3D"])
+        self.assertEqual(WinPatterns.order.index(ThreeOfAKind), hand.score())
+
+    def test_straight(self):
+        hand = Hand(["6H", "3S", "4H", "2C", "5H"])
+        self.assertEqual(WinPatterns.order.index(Straight), hand.score())
+
+    def test_flush(self):
+        hand = Hand(["TH", "7H", "2H", "KH", "3H"])
+        self.assertEqual(WinPatterns.order.index(Flush), hand.score())
+        
+    def test_full_house(self):
+        hand = Hand(["5H", "5S", "7D", "7C", "7S"])
+        self.assertEqual(WinPatterns.order.index(FullHouse), hand.score())
+    
+    def test_four_of_a_kind(self):
+        hand = Hand(["JH", "7H", "7D", "7C", "7S"])
+        self.assertEqual(WinPatterns.order.index(FourOfAKind), hand.score())
+    
+    def test_straight_flush(self):
+        hand = Hand(["JH", "8H", "TH", "9H", "7H"])
+        self.assertEqual(WinPatterns.order.index(StraightFlush), hand.score())    
+
+    def test_royal_flush(self):
+        hand = Hand(["JH", "KH", "TH", "AH", "QH"])
+        self.assertEqual(WinPatterns.order.index(RoyalFlush), hand.score())
+
+
+class TestInternedCard(unittest.TestCase):
+    def test_one_instance_per_card(self):
+        self.assertIs(Card("AS"), Card("AS"))
+        self.assertEqual(52, len(Card.interned))
+
+    def test_integer_rank_and_suit(self):
+        card = Card("TH")
+        self.assertEqual(8, card.value)
+        self.assertEqual(2, card.suit_value)
+        self.assertEqual(34, card.code)
+        self.assertIs(card, Card.by_code[34])
+
+    def test_cards_are_immutable(self):
+        with self.assertRaises(AttributeError):
+            Card("AS").rank = "K"
+
+    def test_joker(self):
+        self.assertIs(Card.joker, Card("XX"))
+        self.assertIs(Card.joker, Card.by_code[52])
+        self.assertEqual("AS", Hand(["AS", "XX", "KD", "QC", "JH"]).cards[1].name)
+
+    def test_equal_only_to_the_same_card(self):
+        self.assertEqual(3, len({Card("AS"), Card("AH"), Card("KS"), Card("AS")}))
+        self.assertNotEqual(Card("AS"), Card("AH"))
+        self.assertEqual({Card("AS"): 1}.get(Card("AS")), 1)
+
+    def test_unknown_card(self):
+        with self.assertRaises(ValueError):
+            Card("1X")
+
+    def test_pickles_to_same_instance(self):
+        import pickle
+        self.assertIs(Card("QD"), pickle.loads(pickle.dumps(Card("QD"))))
+
+
+class TestDeck(unittest.TestCase):
+    def test_full_deck(self):
+        deck = Deck()
+        self.assertEqual(52, len(deck))
+        self.assertEqual(list(range(52)), list(deck.codes))
+
+    def test_joker_deck(self):
+        deck = Deck(jokers=1)
+        self.assertEqual(53, len(deck))
+        self.assertEqual(Card.joker.code, deck.codes[-1])
+
+    def test_dead_cards_are_removed(self):
+        deck = Deck(dead=["AS", "2C"])
+        deck.remove(["KH"])
+        self.assertEqual(49, len(deck))
+        for card in ("AS", "2C", "KH"):
+            self.assertNotIn(Card(card).code, deck.codes)
+
+    def test_seeded_shuffle_is_reproducible(self):
+        first, second = Deck(seed=4), Deck(seed=4)
+        first.shuffle()
+        second.shuffle()
+        self.assertEqual(first.codes, second.codes)
+        self.assertNotEqual(list(range(52)), list(first.codes))
+
+    def test_deal_takes_cards_from_deck(self):
+        deck = Deck(seed=5)
+        deck.shuffle()
+        hands = deck.deal_hands(4, 5)
+        self.assertEqual(20, len(hands))
+        self.assertEqual(32, len(deck))
+        self.assertFalse(set(hands) & set(deck.codes))
+
+    def test_cannot_overdeal(self):
+        with self.assertRaises(ValueError):
+            Deck(dead=["AS"]).deal(52)
+
+    def test_deals_are_independent_hands(self):
+        deck = Deck(dead=["AS"], seed=6)
+        dealt = deck.deals(100, 7)
+        self.assertEqual(700, len(dealt))
+        self.assertEqual(51, len(deck))
+        for i in range(100):
+            row = dealt[i * 7:(i + 1) * 7]
+            self.assertEqual(7, len(set(row)))
+            self.assertNotIn(Card("AS").code, row)
+
+    def test_seeded_deals_repeat(self):
+        self.assertEqual(Deck(seed=4).deals(50, 5), Deck(seed=4).deals(50, 5))
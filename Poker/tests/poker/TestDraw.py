@@ -0,0 +1,90 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import math
+import random
+import unittest
+from itertools import combinations
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from poker import Draw
+from poker import Evaluator
+from poker.Deck import Card
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestSolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.solver = Draw.Solver()
+
+    def brute_force(self, codes, hold, dead=()):
+        kept = [code for position, code in enumerate(codes) if hold >> position & 1]
+        left = [code for code in range(52) if code not in codes and code not in dead]
+        draws = list(combinations(left, 5 - len(kept)))
+        total = sum(self.solver.paytable.pay(Evaluator.lookup.lookup_codes(kept + list(drawn)),
+                                             Evaluator.lookup) for drawn in draws)
+        return total / len(draws)
+
+    def test_matches_enumeration(self):
+        deal = random.Random(21)
+        for codes in ([Card(name).code for name in ("AS", "KS", "QS", "7S", "2D")],
+                      deal.sample(range(52), 5)):
+            evs = self.solver.evs(codes)
+            self.assertEqual(32, len(evs))
+            for hold in range(32):
+                if bin(hold).count('1') >= 3:
+                    self.assertAlmostEqual(self.brute_force(codes, hold), evs[hold], msg=hold)
+
+    def test_matches_enumeration_of_a_short_deck(self):
+        # With 30 dead cards every hold, down to drawing five, is quick to enumerate.
+        deal = random.Random(8)
+        for names in (("AS", "KS", "QS", "7S", "2D"), ("JH", "JD", "5C", "8S", "TH")):
+            codes = [Card(name).code for name in names]
+            dead = deal.sample([code for code in range(52) if code not in codes], 30)
+            evs = self.solver.evs(codes, dead)
+            for hold in range(32):
+                self.assertAlmostEqual(self.brute_force(codes, hold, dead), evs[hold], msg=hold)
+
+    def test_pat_royal_flush(self):
+        kept, ev = self.solver.solve(["AS", "KS", "QS", "JS", "TS"])
+        self.assertEqual(5, len(kept))
+        self.assertEqual(800, ev)
+
+    def test_draws_to_four_card_royal(self):
+        kept, ev = self.solver.solve(["AS", "KS", "QS", "JS", "2D"])
+        self.assertEqual(["AS", "KS", "QS", "JS"], [card.name for card in kept])
+        self.assertAlmostEqual((800 + 6 * 8 + 4 * 3 + 1 * 12) / 47, ev)
+
+    def test_low_pair_pays_nothing(self):
+        codes = [Card(name).code for name in ("5S", "5H", "9D", "KC", "2D")]
+        self.assertEqual(0, self.solver.evs(codes)[31])
+
+    def test_discard_everything(self):
+        codes = [Card(name).code for name in ("2C", "7D", "9H", "4S", "3D")]
+        # 551,286 units paid over all C(47, 5) draws, found by scoring each of them.
+        self.assertAlmostEqual(551286 / math.comb(47, 5), self.solver.evs(codes)[0])
+
+    def test_rejects_repeated_cards(self):
+        with self.assertRaises(ValueError):
+            self.solver.evs([0, 0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.solver.evs([0, 1, 2, 3, 4], dead=[4])
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestStrategy(unittest.TestCase):
+    def test_subset_of_classes(self):
+        hands = {(0, 4, 8, 12, 17): 12, (48, 49, 50, 51, 44): 4}
+        table, average = Draw.strategy(hands=hands, workers=2, chunk_size=1)
+        self.assertEqual(set(hands), set(table))
+        hold, ev = table[(48, 49, 50, 51, 44)]
+        self.assertEqual(25, ev)
+        self.assertAlmostEqual((table[(0, 4, 8, 12, 17)][1] * 12 + 25 * 4) / 16, average)
@@ -0,0 +1,120 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import unittest
+from fractions import Fraction
+from itertools import combinations
+from unittest import mock
+
+from poker import Canonical
+from poker import Equity
+
+
+class TestSpot(unittest.TestCase):
+    def test_rejects_repeated_card(self):
+        with self.assertRaises(ValueError):
+            Equity.Spot([["AS", "AH"], ["AS", "KD"]], hole_size=2, board_size=5)
+
+    def test_rejects_too_many_known_cards(self):
+        with self.assertRaises(ValueError):
+            Equity.Spot([["AS", "AH", "2C"], ["KS", "KD"]], hole_size=2, board_size=5)
+
+    def test_split_pot(self):
+        spot = Equity.Spot([["2C", "3D"], ["2H", "3S"]], board=["AS", "KS", "QD", "JH", "TC"],
+                           hole_size=2, board_size=5)
+        self.assertEqual([0, 1], spot.winners([]))
+
+
+class TestMonteCarlo(unittest.TestCase):
+    def test_known_hands_always_win(self):
+        spot = Equity.Spot([["AS", "AH", "AD", "AC", "2C"], ["KS", "KH", "KD", "QC", "2D"]])
+        result = Equity.monte_carlo(spot, samples=10, seed=1)
+        self.assertEqual(1.0, result.win(0))
+        self.assertEqual(1.0, result.loss(1))
+
+    def test_seed_is_reproducible(self):
+        spot = Equity.Spot([["AS", "AH"], ["KS", "KH"]], hole_size=2, board_size=5)
+        first = Equity.monte_carlo(spot, samples=300, seed=7)
+        second = Equity.monte_carlo(spot, samples=300, seed=7)
+        self.assertEqual(first.wins, second.wins)
+        self.assertEqual(first.ties, second.ties)
+
+    def test_aces_against_kings(self):
+        spot = Equity.Spot([["AS", "AH"], ["KS", "KH"]], hole_size=2, board_size=5)
+        result = Equity.monte_carlo(spot, samples=2000, seed=2016)
+        low, high = result.confidence_interval(0, z=4)
+        self.assertLess(low, 0.82)
+        self.assertGreater(high, 0.82)
+        self.assertAlmostEqual(1.0, result.equity(0) + result.equity(1))
+
+    def test_workers_share_the_budget(self):
+        spot = Equity.Spot([["AS", "AH", "7C"], ["KS", "KH", "7D"]])
+        result = Equity.monte_carlo(spot, samples=501, seed=3, workers=2)
+        self.assertEqual(501, result.deals)
+
+    def test_time_budget(self):
+        spot = Equity.Spot([["AS", "AH", "7C"], ["KS", "KH", "7D"]])
+        result = Equity.monte_carlo(spot, samples=None, seconds=0.05, seed=3)
+        self.assertGreater(result.deals, 0)
+
+    def test_needs_a_budget(self):
+        spot = Equity.Spot([["AS", "AH", "7C"], ["KS", "KH", "7D"]])
+        with self.assertRaises(ValueError):
+            Equity.monte_carlo(spot, samples=None)
+
+
+class TestExact(unittest.TestCase):
+    def test_unrank_is_lexicographic(self):
+        expected = [list(combination) for combination in combinations(range(7), 3)]
+        self.assertEqual(expected, [Equity.unrank(index, 7, 3) for index in range(len(expected))])
+
+    def test_reports_fractions(self):
+        spot = Equity.Spot([["AS", "AH"], ["KS", "KH"]], board=["2C", "7D", "9C"],
+                           hole_size=2, board_size=5)
+        result = Equity.exact(spot)
+        self.assertEqual(990, result.deals)
+        self.assertEqual(Fraction(907, 990), result.equity(0))
+        self.assertEqual(1, result.equity(0) + result.equity(1))
+
+    def test_suit_symmetry_matches_full_enumeration(self):
+        spot = Equity.Spot([["AS", "AH", "2S", "3H"], ["KS", "KH", "4S", "5H"]])
+        enumeration = Equity.Enumeration(spot)
+        self.assertEqual(2, len(enumeration.free))
+        symmetric = Equity.exact(spot)
+        enumeration.free = []
+        full = Equity.enumerate_range((enumeration, 0, enumeration.outer))
+        self.assertEqual(full.deals, symmetric.deals)
+        self.assertEqual(full.wins, symmetric.wins)
+        self.assertEqual(full.shares, symmetric.shares)
+
+    def test_only_orbit_representatives_are_scored(self):
+        spot = Equity.Spot([["AS", "KS"], ["QS", "JS"]], board=["TS", "9S"],
+                           hole_size=2, board_size=5)
+        enumeration = Equity.Enumeration(spot)
+        full = Equity.Enumeration(spot)
+        full.free = []
+        with mock.patch.object(spot, 'winners', wraps=spot.winners) as winners:
+            symmetric = Equity.enumerate_range((enumeration, 0, enumeration.outer))
+            scored = winners.call_count
+            unreduced = Equity.enumerate_range((full, 0, full.outer))
+        self.assertEqual(15180, unreduced.deals)
+        self.assertLess(scored, 15180 // 4)
+        self.assertEqual(unreduced.deals, symmetric.deals)
+        self.assertEqual(unreduced.shares, symmetric.shares)
+
+    def test_workers_agree(self):
+        spot = Equity.Spot([["AS", "AH", "2S", "3H"], ["KS", "KH", "4S", "5H"]])
+        self.assertEqual(Equity.exact(spot).shares, Equity.exact(spot, workers=2).shares)
+
+    def test_cache_enumerates_isomorphic_spots_once(self):
+        cache = Canonical.StrengthCache()
+        spot = Equity.Spot([["AS", "AH"], ["KS", "KH"]], board=["2C", "7D", "9C"],
+                           hole_size=2, board_size=5)
+        renamed = Equity.Spot([["AD", "AC"], ["KD", "KC"]], board=["2H", "7S", "9H"],
+                              hole_size=2, board_size=5)
+        first = Equity.exact(spot, cache=cache)
+        self.assertIs(first, Equity.exact(renamed, cache=cache))
+        self.assertEqual(Fraction(907, 990), first.equity(0))
+        self.assertEqual({"hits": 1, "misses": 1}, {key: cache.info()[key] for key in ("hits", "misses")})
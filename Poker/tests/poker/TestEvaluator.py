@@ -0,0 +1,240 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import random
+import unittest
+from itertools import combinations, product
+
+from poker.Deck import Card, Hand
+from poker import Evaluator
+from poker import WinPatterns
+from poker.WinPatterns import HighCard
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "CDHS"]
+
+
+class TestLookupEvaluator(unittest.TestCase):
+    def test_royal_flush(self):
+        hand = Hand(["JH", "KH", "TH", "AH", "QH"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.RoyalFlush), Evaluator.lookup.score(hand))
+
+    def test_full_house(self):
+        hand = Hand(["5H", "5S", "7D", "7C", "7S"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.FullHouse), Evaluator.lookup.score(hand))
+
+    def test_ace_low_is_not_a_straight(self):
+        hand = Hand(["AH", "2S", "3D", "4C", "5S"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.HighCard), Evaluator.lookup.score(hand))
+
+    def test_repeated_cards_fall_back_to_reference(self):
+        hand = Hand(["5H", "5H", "8H", "9H", "KH"])
+        self.assertEqual(Evaluator.reference.score(hand), Evaluator.lookup.score(hand))
+
+    def test_six_and_seven_cards_score_their_best_five(self):
+        deal = random.Random(2016)
+        hands = [["AS", "KS", "QS", "JS", "9S", "2D", "3C"], ["AS", "KS", "QS", "JS", "TS", "2D", "3C"],
+                 ["AD", "KD", "QD", "JD", "TD", "9D"]]
+        hands += [deal.sample(DECK, size) for size in (6, 7) for _ in range(200)]
+        for names in hands:
+            best = max(Hand(five).strength() for five in combinations(names, 5))
+            self.assertEqual(best, Evaluator.lookup.strength(Hand(names)), names)
+        self.assertEqual(1, Hand(["AS", "KS", "QS", "JS", "TS", "2D", "3C"]).rank())
+
+    def test_matches_reference_on_random_hands(self):
+        deal = random.Random(2016)
+        for _ in range(2000):
+            hand = Hand(deal.sample(DECK, 5))
+            self.assertEqual(Evaluator.reference.score(hand), Evaluator.lookup.score(hand), str(hand))
+
+    def test_matches_reference_on_every_flush(self):
+        Evaluator.lookup.build()
+        for mask, strength in enumerate(Evaluator.lookup.flushes):
+            if strength is not None:
+                hand = Hand([rank + "S" for i, rank in enumerate("23456789TJQKA") if mask >> i & 1])
+                self.assertEqual(Evaluator.reference.strength(hand), strength)
+
+
+class TestHandEvaluator(unittest.TestCase):
+    def tearDown(self):
+        Hand.evaluator = None
+
+    def test_reference_is_selectable(self):
+        Hand.evaluator = Evaluator.reference
+        hand = Hand(["6C", "KD", "6H", "3S", "3D"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.TwoPair), hand.score())
+
+    def test_win_pattern_matches_score(self):
+        hand = Hand(["JH", "7H", "7D", "7C", "7S"])
+        self.assertIsInstance(hand.win_pattern(), WinPatterns.FourOfAKind)
+
+
+class TestStrength(unittest.TestCase):
+    def test_category_is_in_high_bits(self):
+        hand = Hand(["6C", "KD", "9H", "7S", "3D"])
+        self.assertEqual(WinPatterns.order.index(HighCard), Evaluator.score_of(hand.strength()))
+
+    def test_kickers_break_ties_within_category(self):
+        pair_with_ace = Hand(["7S", "7H", "AD", "3C", "2D"])
+        pair_with_king = Hand(["7C", "7D", "KD", "QC", "JD"])
+        self.assertGreater(pair_with_ace.strength(), pair_with_king.strength())
+
+    def test_higher_pair_outranks_in_two_pair(self):
+        kings_and_twos = Hand(["KS", "KH", "2D", "2C", "3D"])
+        sixes_and_fives = Hand(["6C", "6D", "5D", "5C", "AD"])
+        self.assertTrue(kings_and_twos.beats(sixes_and_fives))
+
+    def test_same_ranks_have_same_strength(self):
+        hand_1 = Hand(["AS", "AH", "9D", "9C", "3D"])
+        hand_2 = Hand(["AD", "AC", "9S", "9H", "3S"])
+        self.assertEqual(hand_1.strength(), hand_2.strength())
+        self.assertFalse(hand_1.beats(hand_2))
+
+    def test_matches_reference_on_random_hands(self):
+        deal = random.Random(2017)
+        for _ in range(1000):
+            hand = Hand(deal.sample(DECK, 5))
+            self.assertEqual(Evaluator.reference.strength(hand), Evaluator.lookup.strength(hand), str(hand))
+
+
+class TestBestOfSeven(unittest.TestCase):
+    def codes(self, names):
+        return [Card(name).code for name in names]
+
+    def test_flush_beats_straight_on_board(self):
+        codes = self.codes(["2H", "7H", "9H", "JH", "KH", "TC", "QD"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.Flush),
+                         Evaluator.score_of(Evaluator.lookup.lookup_best_codes(codes)))
+
+    def test_full_house_beats_flush(self):
+        codes = self.codes(["2H", "7H", "9H", "JH", "JC", "JD", "9C"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.FullHouse),
+                         Evaluator.score_of(Evaluator.lookup.lookup_best_codes(codes)))
+
+    def test_repeated_card_is_not_covered(self):
+        codes = self.codes(["2H", "2H", "9H", "JH", "JC", "JD", "9C"])
+        self.assertIsNone(Evaluator.lookup.lookup_best_codes(codes))
+
+    def test_matches_best_subset(self):
+        deal = random.Random(2020)
+        for size in (6, 7):
+            for _ in range(500):
+                codes = deal.sample(range(52), size)
+                expected = max(Evaluator.lookup.lookup_codes(five) for five in combinations(codes, 5))
+                self.assertEqual(expected, Evaluator.lookup.strength_of_codes(codes), codes)
+
+
+class TestRules(unittest.TestCase):
+    def strength(self, rules, names):
+        return Evaluator.LookupEvaluator(rules).strength(Hand(names))
+
+    def score(self, rules, names):
+        evaluator = Evaluator.LookupEvaluator(rules)
+        return evaluator.score_of(evaluator.strength(Hand(names)))
+
+    def test_ace_low_straight(self):
+        wheel = ["AH", "2S", "3D", "4C", "5S"]
+        self.assertEqual(WinPatterns.order.index(WinPatterns.Straight), self.score(Evaluator.ACE_LOW, wheel))
+        self.assertLess(self.strength(Evaluator.ACE_LOW, wheel),
+                        self.strength(Evaluator.ACE_LOW, ["2H", "3S", "4D", "5C", "6S"]))
+        self.assertEqual(WinPatterns.order.index(WinPatterns.StraightFlush),
+                         self.score(Evaluator.ACE_LOW, ["AH", "2H", "3H", "4H", "5H"]))
+
+    def test_short_deck_flush_beats_full_house(self):
+        flush = self.strength(Evaluator.SHORT_DECK, ["6H", "8H", "9H", "JH", "KH"])
+        full_house = self.strength(Evaluator.SHORT_DECK, ["AS", "AH", "AD", "KC", "KD"])
+        self.assertGreater(flush, full_house)
+        self.assertEqual(WinPatterns.order.index(WinPatterns.FullHouse),
+                         Evaluator.SHORT_DECK.score_of(full_house))
+        self.assertEqual(WinPatterns.order.index(WinPatterns.Straight),
+                         self.score(Evaluator.SHORT_DECK, ["AH", "6S", "7D", "8C", "9S"]))
+        self.assertEqual(36, len(Evaluator.SHORT_DECK.codes))
+
+    def test_short_deck_rejects_low_cards(self):
+        with self.assertRaises(ValueError):
+            self.strength(Evaluator.SHORT_DECK, ["2H", "8H", "9H", "JH", "KH"])
+
+    def test_ace_to_five(self):
+        wheel = self.strength(Evaluator.ACE_TO_FIVE, ["AH", "2S", "3D", "4C", "5H"])
+        six_four = self.strength(Evaluator.ACE_TO_FIVE, ["AH", "2S", "3D", "4C", "6S"])
+        pair = self.strength(Evaluator.ACE_TO_FIVE, ["2H", "2S", "3D", "4C", "5S"])
+        king_high = self.strength(Evaluator.ACE_TO_FIVE, ["KH", "QS", "JD", "9C", "8S"])
+        self.assertGreater(wheel, six_four)
+        self.assertGreater(king_high, pair)
+        self.assertEqual(WinPatterns.order.index(WinPatterns.HighCard),
+                         self.score(Evaluator.ACE_TO_FIVE, ["AH", "2H", "3H", "4H", "5H"]))
+
+    def test_tables_match_rules(self):
+        deal = random.Random(2018)
+        for rules in (Evaluator.ACE_LOW, Evaluator.SHORT_DECK, Evaluator.ACE_TO_FIVE):
+            evaluator = Evaluator.LookupEvaluator(rules)
+            for _ in range(300):
+                codes = deal.sample(rules.codes, 7)
+                expected = max(rules.strength([code >> 2 for code in five],
+                                              len(set(code & 3 for code in five)) == 1)
+                               for five in combinations(codes, 5))
+                self.assertEqual(expected, evaluator.strength_of_codes(codes), (rules, codes))
+
+    def test_hand_scores_with_its_evaluator(self):
+        try:
+            Hand.evaluator = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+            self.assertIsInstance(Hand(["6H", "8H", "9H", "JH", "KH"]).win_pattern(), WinPatterns.Flush)
+        finally:
+            Hand.evaluator = None
+
+
+class TestWildCards(unittest.TestCase):
+    def strength(self, evaluator, names):
+        return evaluator.strength(Hand(names))
+
+    def test_joker_makes_five_of_a_kind(self):
+        five_aces = self.strength(Evaluator.joker_poker, ["XX", "AS", "AH", "AD", "AC"])
+        royal = self.strength(Evaluator.joker_poker, ["AS", "KS", "QS", "JS", "TS"])
+        self.assertIs(WinPatterns.FiveOfAKind, Evaluator.joker_poker.pattern_of(five_aces))
+        self.assertGreater(five_aces, royal)
+
+    def test_joker_completes_royal_flush(self):
+        strength = self.strength(Evaluator.joker_poker, ["XX", "AS", "KS", "QS", "JS"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.RoyalFlush),
+                         Evaluator.joker_poker.score_of(strength))
+
+    def test_natural_hands_keep_their_strength(self):
+        names = ["9S", "9H", "9D", "9C", "7C"]
+        self.assertEqual(Evaluator.lookup.strength(Hand(names)),
+                         self.strength(Evaluator.joker_poker, names))
+
+    def test_deuces_wild(self):
+        self.assertEqual(Evaluator.lookup.strength(Hand(["9S", "9H", "9D", "9C", "7C"])),
+                         self.strength(Evaluator.deuces_wild, ["2H", "2S", "2D", "7C", "9S"]))
+        self.assertIs(WinPatterns.FiveOfAKind, Evaluator.deuces_wild.pattern_of(
+            self.strength(Evaluator.deuces_wild, ["2H", "2S", "2D", "7C", "7S"])))
+
+    def test_without_five_of_a_kind(self):
+        evaluator = Evaluator.WildEvaluator(Evaluator.STANDARD)
+        strength = self.strength(evaluator, ["XX", "AS", "AH", "AD", "AC"])
+        self.assertEqual(WinPatterns.order.index(WinPatterns.FourOfAKind), evaluator.score_of(strength))
+
+    def test_joker_plays_low_in_lowball(self):
+        evaluator = Evaluator.WildEvaluator(Evaluator.ACE_TO_FIVE)
+        self.assertEqual(self.strength(evaluator, ["AH", "2S", "3D", "4C", "6S"]),
+                         self.strength(evaluator, ["XX", "2S", "3D", "4C", "6S"]))
+
+    def test_standard_evaluator_rejects_joker(self):
+        with self.assertRaises(ValueError):
+            Evaluator.lookup.strength(Hand(["XX", "AS", "AH", "AD", "AC"]))
+
+    def test_matches_every_substitution(self):
+        deal = random.Random(2019)
+        rules = Evaluator.FIVE_OF_A_KIND
+        for evaluator, wild_values in ((Evaluator.joker_poker, ()), (Evaluator.deuces_wild, (0,))):
+            for _ in range(60):
+                codes = deal.sample(range(53), 5)
+                naturals = [code for code in codes if code < 52 and code >> 2 not in wild_values]
+                wilds = len(codes) - len(naturals)
+                if wilds > 2:
+                    continue
+                expected = max(rules.strength([code >> 2 for code in naturals + list(fill)],
+                                              len(set(code & 3 for code in naturals + list(fill))) == 1)
+                               for fill in product(range(52), repeat=wilds))
+                self.assertEqual(expected, evaluator.strength_of_codes(codes), codes)
@@ -0,0 +1,97 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import io
+import os
+import tempfile
+import unittest
+
+from poker import Cli
+from poker import HandFile
+from poker import Parallel
+from poker.Deck import Card
+
+GAMES = ["5H 5C 6S 7S KD 2C 3S 8S 8D TD\n",
+         "5D 8C 9S JS AC 2C 5C 7D 8S QH\n",
+         "\n",
+         "2S 3C 4D 5H 6S 2H 3D 4C 5S 6D\n"]
+
+
+class TestHandFile(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pkh")
+        os.close(handle)
+        HandFile.convert(GAMES, self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_one_byte_per_card(self):
+        self.assertEqual(HandFile.HEADER.size + 30, os.path.getsize(self.path))
+        self.assertTrue(HandFile.is_hand_file(self.path))
+
+    def test_records_are_card_codes(self):
+        with HandFile.HandFile(self.path) as hand_file:
+            self.assertEqual(3, len(hand_file))
+            self.assertEqual([Card(name).code for name in GAMES[1].split()], hand_file[1].tolist())
+            self.assertEqual(3, len(list(hand_file)))
+
+    def test_array_view(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        with HandFile.HandFile(self.path) as hand_file:
+            codes = hand_file.array()
+            self.assertEqual((3, 10), codes.shape)
+            self.assertEqual(Card("2S").code, codes[2, 0])
+        self.assertEqual(Card("2S").code, codes[2, 0])
+
+    def test_records_outlive_the_file(self):
+        with HandFile.HandFile(self.path) as hand_file:
+            first = hand_file[0]
+        self.assertEqual([Card(name).code for name in GAMES[0].split()], first.tolist())
+
+    def test_plays_like_text(self):
+        text, binary = io.StringIO(), io.StringIO()
+        Cli.run(GAMES, text)
+        with HandFile.HandFile(self.path) as hand_file:
+            Cli.report(Cli.games_in_records(hand_file), binary)
+        self.assertEqual(text.getvalue(), binary.getvalue())
+
+    def test_parallel_matches_text(self):
+        text, binary = io.StringIO(), io.StringIO()
+        Cli.run(GAMES, text)
+        Parallel.run(self.path, binary, workers=2, shard_size=10)
+        self.assertEqual(text.getvalue(), binary.getvalue())
+
+    def test_rejects_text_file(self):
+        with open(self.path, 'w') as f:
+            f.writelines(GAMES)
+        self.assertFalse(HandFile.is_hand_file(self.path))
+        with self.assertRaises(ValueError):
+            HandFile.HandFile(self.path)
+
+    def test_convert_refuses_jokers(self):
+        with self.assertRaisesRegex(ValueError, "line 2: .*joker"):
+            HandFile.convert(GAMES[:1] + ["XX 8C 9S JS AC 2C 5C 7D 8S QH\n"], self.path)
+
+    def test_bad_codes_are_reported(self):
+        for code in (Card.joker.code, 200):
+            with open(self.path, 'r+b') as f:
+                f.seek(-20, os.SEEK_END)
+                f.write(bytes([code]))
+            with self.assertRaisesRegex(SystemExit, "poker: record 2: not a card code: {}".format(code)):
+                Cli.main([self.path])
+            with self.assertRaisesRegex(ValueError, "^record 2: not a card code"):
+                Parallel.run(self.path, io.StringIO(), workers=2, shard_size=10)
+
+    def test_missing_file_is_reported(self):
+        with self.assertRaisesRegex(SystemExit, "poker: .*No such file"):
+            Cli.main([self.path + ".missing"])
+
+    def test_convert_reports_bad_line(self):
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            HandFile.convert(GAMES[:1] + ["5D 8C\n"], self.path)
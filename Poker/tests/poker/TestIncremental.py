@@ -0,0 +1,79 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import random
+import unittest
+
+from poker import Evaluator
+from poker import WinPatterns
+from poker.Deck import Card
+from poker.Incremental import HandState
+
+
+class TestHandState(unittest.TestCase):
+    def test_streets(self):
+        state = HandState()
+        self.assertIsNone(state.strength())
+        state.add("7S")
+        self.assertIs(WinPatterns.HighCard, state.pattern())
+        state.add("7H")
+        self.assertIs(WinPatterns.Pair, state.pattern())
+        for card in ("7D", "KS", "KH"):
+            state.add(card)
+        self.assertIs(WinPatterns.FullHouse, state.pattern())
+        state.remove("KH")
+        self.assertIs(WinPatterns.ThreeOfAKind, state.pattern())
+        self.assertEqual(4, len(state))
+
+    def test_partial_hands_rank_like_stud_boards(self):
+        trips = HandState(["2S", "2H", "2D"])
+        aces = HandState(["AS", "AH", "KD", "QC"])
+        self.assertGreater(trips.strength(), aces.strength())
+        self.assertGreater(aces.strength(), HandState(["AS", "AH", "KD"]).strength())
+
+    def test_seven_card_flush(self):
+        state = HandState(["2H", "7H", "9H", "JH", "KH", "TC", "QD"])
+        self.assertIs(WinPatterns.Flush, state.pattern())
+
+    def test_matches_evaluator_while_dealing(self):
+        deal = random.Random(2020)
+        state = HandState()
+        held = []
+        for _ in range(3000):
+            if len(held) == 7 or (held and deal.random() < 0.4):
+                code = held.pop(deal.randrange(len(held)))
+                state.remove_code(code)
+            else:
+                code = deal.choice([code for code in range(52) if code not in held])
+                held.append(code)
+                state.add_code(code)
+            self.assertEqual(sorted(held), state.codes())
+            if len(held) >= 5:
+                self.assertEqual(Evaluator.lookup.strength_of_codes(held), state.strength(), held)
+
+    def test_copy_is_independent(self):
+        state = HandState(["AS", "KS"])
+        branch = state.copy()
+        branch.add("AH")
+        self.assertEqual(2, len(state))
+        self.assertIs(WinPatterns.HighCard, state.pattern())
+        self.assertIs(WinPatterns.Pair, branch.pattern())
+
+    def test_rejects_bad_changes(self):
+        state = HandState(["AS"])
+        with self.assertRaises(ValueError):
+            state.add("AS")
+        with self.assertRaises(ValueError):
+            state.remove("KS")
+        with self.assertRaises(ValueError):
+            state.add(Card.joker)
+        for card in ("2C", "3C", "4C", "5C", "6C", "7C"):
+            state.add(card)
+        with self.assertRaises(ValueError):
+            state.add("8C")
+
+    def test_rules_variant(self):
+        state = HandState(["AH", "2S", "3D", "4C", "5S"], Evaluator.LookupEvaluator(Evaluator.ACE_LOW))
+        self.assertIs(WinPatterns.Straight, state.pattern())
@@ -0,0 +1,91 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import io
+import json
+import unittest
+
+from poker import Evaluator
+from poker import Instrumentation
+from poker.Deck import Hand
+from poker.Poker import OneDeckTwoPlayerGame
+from poker.WinPatterns import Pair
+
+
+class TestInstrumentation(unittest.TestCase):
+    def tearDown(self):
+        Instrumentation.disable()
+        Hand.evaluator = None
+
+    def test_counts_criterion_checks_with_reference_evaluator(self):
+        Hand.evaluator = Evaluator.reference
+        with Instrumentation.recording() as stats:
+            Hand(["6C", "KD", "9H", "7S", "3D"]).score()
+        self.assertEqual(1, stats.criterion["HighCard"][0])
+        self.assertEqual(1, stats.criterion["FourOfAKind"][0])
+        self.assertEqual(2, stats.criterion["Pair"][0])  # once more from FullHouse
+        self.assertEqual(1, stats.categories["HighCard"])
+
+    def test_counts_categories_once_per_hand(self):
+        with Instrumentation.recording() as stats:
+            hand_1 = Hand(["6C", "KD", "6H", "7S", "3D"])
+            hand_2 = Hand(["5D", "8C", "9S", "JS", "AC"])
+            for _ in range(3):
+                OneDeckTwoPlayerGame(hand_1, hand_2).player_one_wins()
+        self.assertEqual(1, stats.categories["Pair"])
+        self.assertEqual(1, stats.categories["HighCard"])
+
+    def test_counts_categories_under_each_rules(self):
+        variants = [(Evaluator.LookupEvaluator(Evaluator.ACE_LOW), ["AS", "2H", "3D", "4C", "5S"],
+                     "Straight"),
+                    (Evaluator.LookupEvaluator(Evaluator.SHORT_DECK), ["AS", "KS", "9S", "7S", "6S"],
+                     "Flush"),
+                    (Evaluator.LookupEvaluator(Evaluator.ACE_TO_FIVE), ["7S", "5H", "4D", "3C", "2S"],
+                     "HighCard"),
+                    (Evaluator.joker_poker, ["XX", "AS", "AH", "AD", "AC"], "FiveOfAKind")]
+        for evaluator, cards, category in variants:
+            Hand.evaluator = evaluator
+            with Instrumentation.recording() as stats:
+                Hand(cards).strength()
+            self.assertEqual({category: 1}, {name: count for name, count
+                                             in stats.categories.items() if count}, category)
+
+    def test_times_the_evaluator_in_use(self):
+        with Instrumentation.recording() as stats:
+            Hand(["2C", "3S", "8S", "8D", "TD"]).strength()
+            Hand(["2C", "3S", "8S", "8D", "TD", "AH", "KC"]).strength()
+            Evaluator.joker_poker.strength_of_codes([52, 0, 4, 8, 12])
+        calls = {name: calls for name, (calls, _) in stats.evaluations.items() if calls}
+        self.assertEqual({"LookupEvaluator.strength": 2, "LookupEvaluator.strength_of_codes": 1,
+                          "WildEvaluator.strength_of_codes": 1}, calls)
+        self.assertEqual(0, sum(checks for checks, _ in stats.criterion.values()))
+
+    def test_times_the_reference_evaluator(self):
+        Hand.evaluator = Evaluator.reference
+        with Instrumentation.recording() as stats:
+            Hand(["2C", "3S", "8S", "8D", "TD"]).strength()
+        self.assertEqual(1, stats.evaluations["ReferenceEvaluator.strength"][0])
+
+    def test_disable_restores_methods(self):
+        criterion = Pair.criterion
+        strength = Hand.strength
+        strength_of_codes = Evaluator.LookupEvaluator.strength_of_codes
+        Instrumentation.enable()
+        self.assertIsNot(criterion, Pair.criterion)
+        self.assertIsNot(strength_of_codes, Evaluator.LookupEvaluator.strength_of_codes)
+        Instrumentation.disable()
+        self.assertIs(criterion, Pair.criterion)
+        self.assertIs(strength, Hand.strength)
+        self.assertIs(strength_of_codes, Evaluator.LookupEvaluator.strength_of_codes)
+
+    def test_dump_json(self):
+        with Instrumentation.recording() as stats:
+            Hand(["5H", "5S", "7D", "7C", "7S"]).score()
+        out = io.StringIO()
+        stats.dump(out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(1, report["categories"]["FullHouse"])
+        self.assertEqual(1, report["evaluations"]["LookupEvaluator.strength"]["calls"])
+        self.assertIn("FullHouse", str(stats))
@@ -0,0 +1,74 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from poker import Cli
+from poker import Parallel
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "CDHS"]
+
+
+class TestParallel(unittest.TestCase):
+    def setUp(self):
+        deal = random.Random(2019)
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, 'w') as f:
+            for _ in range(500):
+                f.write(' '.join(deal.sample(DECK, 10)) + '\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_shards_cover_file_on_line_boundaries(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        bounds = Parallel.shards(self.path, 1000)
+        self.assertEqual(0, bounds[0][0])
+        self.assertEqual(len(data), bounds[-1][1])
+        for (_, stop), (start, _) in zip(bounds, bounds[1:]):
+            self.assertEqual(stop, start)
+            self.assertEqual(b'\n', data[stop - 1:stop])
+
+    def test_matches_serial_output(self):
+        serial = io.StringIO()
+        with open(self.path) as f:
+            Cli.run(f, serial)
+        parallel = io.StringIO()
+        Parallel.run(self.path, parallel, workers=2, shard_size=1000)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+    def test_matches_serial_summary(self):
+        serial = io.StringIO()
+        with open(self.path) as f:
+            Cli.run(f, serial, summary=True)
+        parallel = io.StringIO()
+        Parallel.run(self.path, parallel, summary=True, workers=2, shard_size=1000, ordered=False)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+    def test_shared_tables_match_serial_output(self):
+        serial = io.StringIO()
+        with open(self.path) as f:
+            Cli.run(f, serial)
+        parallel = io.StringIO()
+        Parallel.run(self.path, parallel, workers=2, shard_size=1000, shared=True)
+        self.assertEqual(serial.getvalue(), parallel.getvalue())
+
+    def test_errors_name_the_line_in_the_file(self):
+        with open(self.path, 'a') as f:
+            f.write("AS KS\n")
+        with self.assertRaisesRegex(ValueError, "^line 501: expected 10 cards"):
+            Parallel.run(self.path, io.StringIO(), workers=2, shard_size=1000)
+
+    def test_first_lines(self):
+        bounds = Parallel.shards(self.path, 1000)
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        self.assertEqual([data[:start].count(b'\n') + 1 for start, _ in bounds],
+                         Parallel.first_lines(self.path, bounds))
@@ -0,0 +1,97 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from poker import Cli
+from poker import Evaluator
+from poker import HandFile
+from poker import Pipeline
+from poker import WinPatterns
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "CDHS"]
+
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        deal = random.Random(2022)
+        self.lines = [' '.join(deal.sample(DECK, 10)) + '\n' for _ in range(400)]
+        self.lines.insert(7, '\n')
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, 'w') as f:
+            f.writelines(self.lines)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_matches_cli_summary(self):
+        totals = Pipeline.run(self.path)
+        out = io.StringIO()
+        summary = Cli.run(self.lines, out, summary=True)
+        self.assertEqual(400, totals.games)
+        self.assertEqual(out.getvalue(), '\n'.join(totals.lines()) + '\n')
+        self.assertEqual(summary.to_dict(), totals.to_dict())
+        self.assertEqual(summary.outcomes[1] + summary.outcomes[-1], sum(totals.margins))
+
+    def test_stages_compose(self):
+        parsed = list(Pipeline.parse(Pipeline.read(self.path)))
+        self.assertEqual(400, len(parsed))
+        self.assertEqual([Cli.codes_of(self.lines[0].split()[:5]),
+                          Cli.codes_of(self.lines[0].split()[5:])], list(parsed[0]))
+        self.assertEqual(list(Pipeline.games(self.path)), list(Pipeline.evaluate(parsed)))
+
+    def test_evaluator_can_be_swapped(self):
+        game = (Cli.codes_of(["AS", "2H", "3D", "4C", "5S"]), Cli.codes_of(["KS", "KH", "3C", "4D", "9S"]))
+        ace_low = Evaluator.LookupEvaluator(Evaluator.ACE_LOW)
+        self.assertEqual({1: 0, -1: 1, 0: 0},
+                         Pipeline.aggregate(Pipeline.evaluate([game])).outcomes)
+        self.assertEqual({1: 1, -1: 0, 0: 0},
+                         Pipeline.aggregate(Pipeline.evaluate([game], ace_low)).outcomes)
+
+    def test_shards_merge_to_the_whole(self):
+        whole = Pipeline.run(self.path)
+        sharded = Pipeline.run(self.path, workers=2, shard_size=1000)
+        self.assertEqual(whole.to_dict(), sharded.to_dict())
+
+    def test_binary_file(self):
+        handle, binary = tempfile.mkstemp(suffix=".pkh")
+        os.close(handle)
+        try:
+            HandFile.convert(self.lines, binary)
+            self.assertEqual(Pipeline.run(self.path).to_dict(),
+                             Pipeline.run(binary, workers=2, shard_size=500).to_dict())
+            self.assertEqual(Pipeline.run(self.path).to_dict(), Pipeline.run(binary).to_dict())
+        finally:
+            os.remove(binary)
+
+    def test_byte_range(self):
+        first = len(self.lines[0].encode())
+        self.assertEqual(self.lines[1:3], list(Pipeline.read(self.path, first, first * 3)))
+
+    def test_summaries_add(self):
+        first = Pipeline.aggregate(Cli.games_in_lines(self.lines[:100]))
+        second = Pipeline.aggregate(Cli.games_in_lines(self.lines[100:]))
+        self.assertEqual(Pipeline.run(self.path).to_dict(), (first + second).to_dict())
+
+    def test_margin(self):
+        games = ["AS AH AD AC 2C 3S 4D 7H 9C JS", "2H 2D 5S 6C 8D 3H 3D 5H 6S 8C", "AS KS QS JS TS AH KH QH JH TH"]
+        totals = Pipeline.aggregate(Cli.games_in_lines(games))
+        four, high_card = (WinPatterns.order.index(pattern)
+                           for pattern in (WinPatterns.FourOfAKind, WinPatterns.HighCard))
+        self.assertEqual(1, totals.margins[high_card - four])
+        self.assertEqual(1, totals.margins[0])
+        self.assertEqual({1: 1, -1: 1, 0: 1}, totals.outcomes)
+
+    def test_bad_record(self):
+        with open(self.path, 'w') as f:
+            f.writelines(self.lines[:300] + ["AS KS\n"] + self.lines[300:])
+        with self.assertRaisesRegex(ValueError, "line 301: expected 10 cards"):
+            Pipeline.run(self.path)
+        with self.assertRaisesRegex(ValueError, "line 301: expected 10 cards"):
+            Pipeline.run(self.path, workers=2, shard_size=1000)
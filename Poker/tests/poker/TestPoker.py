@@ -5,8 +5,10 @@ Created on Jun 3, 2016
 '''
 
 import unittest
+from unittest import mock
 
-from poker.Poker import OneDeckTwoPlayerGame
+from poker import Evaluator
+from poker.Poker import OneDeckTwoPlayerGame, Showdown
 from poker.Deck import Hand
 
 
@@ -93,7 +95,6 @@ class TestTie(unittest.TestCase):
          
         self.assertTrue(game.player_one_wins())
     
-    @unittest.skip("Worry about multideck games later...")
     def test_player_wins_with_higher_pair_in_full_house(self):
         hand_1 = Hand(["4C", "4D", "4S", "2H", "2D"])
         hand_2 = Hand(["4C", "4D", "4S", "9S", "9D"])
@@ -121,22 +122,31 @@ class TestTie(unittest.TestCase):
 
 class TestDraw(unittest.TestCase):
     """Players have effectively the same hand."""
-    @unittest.skip("TODO: Draw conditions")
     def test_players_have_same_straight(self):
-        pass
+        hand_1 = Hand(["2S", "3C", "4D", "5H", "6S"])
+        hand_2 = Hand(["2H", "3D", "4C", "5S", "6D"])
+        
+        game = OneDeckTwoPlayerGame(hand_1, hand_2)
+        
+        self.assertTrue(game.is_draw())
+        self.assertFalse(game.player_one_wins())
+        self.assertFalse(game.player_two_wins())
     
-    @unittest.skip("TODO Multideck draw condition")
     def test_players_have_same_full_house(self):
         hand_1 = Hand(["4C", "4D", "4S", "2H", "2D"])
         hand_2 = Hand(["4C", "4D", "4S", "2S", "2C"])
         
         game = OneDeckTwoPlayerGame(hand_1, hand_2)
         
-        print(game)
+        self.assertTrue(game.is_draw())
     
-    @unittest.skip("TODO: Draw conditions")
     def test_players_have_royal_flush(self):
-        pass
+        hand_1 = Hand(["AD", "KD", "QD", "JD", "TD"])
+        hand_2 = Hand(["AS", "KS", "QS", "JS", "TS"])
+        
+        game = OneDeckTwoPlayerGame(hand_1, hand_2)
+        
+        self.assertTrue(game.is_draw())
 
 
 class TestLastKickerWins(unittest.TestCase):
@@ -165,7 +175,6 @@ class TestLastKickerWins(unittest.TestCase):
         
         self.assertTrue(game.player_one_wins())
     
-    @unittest.skip("Worry about multideck games later...")
     def test_three_of_a_kind_wins_on_last_kcker(self):
         hand_1 = Hand(["2S", "5H", "7H", "7C", "7D"])
         hand_2 = Hand(["3H", "5S", "7H", "7C", "7D"])        
@@ -182,7 +191,6 @@ class TestLastKickerWins(unittest.TestCase):
 
         self.assertTrue(game.player_one_wins())
     
-    @unittest.skip("Worry about multideck games later...")
     def test_four_of_a_kind_wins_on_last_kicker(self):
         hand_1 = Hand(["KH", "KS", "KC", "KD", "QH"])
         hand_2 = Hand(["KH", "KS", "KC", "KD", "2H"])
@@ -190,4 +198,52 @@ class TestLastKickerWins(unittest.TestCase):
         game = OneDeckTwoPlayerGame(hand_1, hand_2)
         
         self.assertTrue(game.player_one_wins())
-        
\ No newline at end of file
+
+
+class TestShowdown(unittest.TestCase):
+    """Several players show their hands at once."""
+    def test_single_winner(self):
+        hands = [Hand(["5D", "8C", "9S", "JS", "AC"]),
+                 Hand(["2C", "3S", "8S", "8D", "TD"]),
+                 Hand(["2S", "3C", "4D", "5H", "6S"])]
+        
+        showdown = Showdown(hands)
+        
+        self.assertEqual([2], showdown.winners())
+        self.assertFalse(showdown.is_split())
+        
+    def test_three_way_split_pot(self):
+        hands = [Hand(["2S", "3C", "4D", "5H", "6S"]),
+                 Hand(["2H", "3D", "4C", "5S", "6D"]),
+                 Hand(["2C", "3H", "4S", "5D", "6C"]),
+                 Hand(["KH", "KS", "KC", "QD", "2D"])]
+        
+        showdown = Showdown(hands)
+        
+        self.assertEqual([0, 1, 2], showdown.winners())
+        self.assertTrue(showdown.is_split())
+        
+    def test_ranking_groups_ties(self):
+        hands = [Hand(["5D", "8C", "9S", "JS", "AC"]),
+                 Hand(["2C", "3S", "8S", "8D", "TD"]),
+                 Hand(["5H", "8D", "9C", "JH", "AS"]),
+                 Hand(["KH", "KS", "KC", "QD", "2D"])]
+        
+        showdown = Showdown(hands)
+        
+        self.assertEqual([[3], [1], [0, 2]], showdown.ranking())
+        
+    def test_each_hand_scored_once(self):
+        hands = [Hand(["5D", "8C", "9S", "JS", "AC"]), Hand(["2C", "3S", "8S", "8D", "TD"])]
+        evaluator = mock.Mock(wraps=Evaluator.lookup)
+        for hand in hands:
+            hand.evaluator = evaluator
+        
+        showdown = Showdown(hands)
+        showdown.winners()
+        showdown.is_split()
+        showdown.ranking()
+        
+        self.assertEqual(2, evaluator.strength.call_count)
+        self.assertEqual([hand.strength() for hand in hands], showdown.strengths)
+        self.assertEqual(2, evaluator.strength.call_count)
@@ -0,0 +1,124 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import os
+import tempfile
+import unittest
+from itertools import combinations
+from unittest import mock
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from poker import Ranges
+from poker import Equity
+
+BOARD = ["2C", "7D", "9H", "JS", "3C"]
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestRangeNotation(unittest.TestCase):
+    def test_combo_counts(self):
+        for text, count in (("AA", 6), ("AKs", 4), ("AKo", 12), ("AK", 16), ("AsKh", 1)):
+            self.assertEqual(count, len(Ranges.Range(text)), text)
+
+    def test_plus_and_dash(self):
+        self.assertEqual(["QQ", "KK", "AA"], Ranges.expand("QQ+"))
+        self.assertEqual(["ATs", "AJs", "AQs", "AKs"], Ranges.expand("ATs+"))
+        self.assertEqual(["A5s", "A4s", "A3s", "A2s"], Ranges.expand("A5s-A2s"))
+        self.assertEqual(["99", "88", "77"], Ranges.expand("77-99"))
+
+    def test_labels_are_normalised(self):
+        self.assertEqual(["AKs", "ASKH"], Ranges.Range("kas, AsKh, AKs").labels)
+
+    def test_bad_tokens(self):
+        for text in ("AX", "AAs", "A5s-K2s", "AsAs"):
+            with self.assertRaises(ValueError, msg=text):
+                Ranges.Range(text)
+
+    def test_starting_hands(self):
+        self.assertEqual(169, len(Ranges.STARTING_HANDS))
+        self.assertEqual(1326, len(Ranges.Range.all()))
+
+    def test_dead_cards_remove_combos(self):
+        self.assertEqual(3, len(Ranges.Range("AA", dead=["AS"])))
+        self.assertEqual(["KK"], Ranges.Range("AsAh, KK").without(["AH"]).labels)
+        self.assertEqual(1, len(Ranges.Range("AA", dead=["AS"]).without(["AH"])))
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestMatrix(unittest.TestCase):
+    def test_complete_board(self):
+        result = Ranges.matrix("AA, 33", "KK", board=BOARD)
+        self.assertTrue(result.exact)
+        self.assertEqual(1.0, result["AA", "KK"])
+        self.assertEqual(1.0, result["33", "KK"])
+        self.assertEqual(18, result.pairs[1, 0])
+
+    def test_conflicting_combos_are_skipped(self):
+        result = Ranges.matrix("AA", "AA", board=BOARD)
+        self.assertEqual(0.5, result["AA", "AA"])
+        self.assertEqual(6, result.pairs[0, 0])
+
+    def test_matches_exact_equity(self):
+        board = ["2C", "7D", "9H", "JS"]
+        result = Ranges.matrix("AsKs", "QhQd", board=board)
+        spot = Equity.Spot([["AS", "KS"], ["QH", "QD"]], board=board, hole_size=2, board_size=5)
+        self.assertEqual(48, result.boards)
+        self.assertAlmostEqual(float(Equity.exact(spot).equity(0)), result["ASKS", "QHQD"])
+
+    def test_cell_weighs_combo_pairs(self):
+        board = ["2C", "7D", "9H"]
+        result = Ranges.matrix("AKs", "QQ", board=board, samples=None)
+        spot_equities = []
+        for first, second in Ranges.Range("AKs").combos["AKs"]:
+            for third, fourth in Ranges.Range("QQ").combos["QQ"]:
+                hands = [[Ranges.Deck.Card.by_code[code].name for code in hand]
+                         for hand in ((first, second), (third, fourth))]
+                spot = Equity.Spot(hands, board=board, hole_size=2, board_size=5)
+                spot_equities.append(Equity.exact(spot).equity(0))
+        self.assertAlmostEqual(float(sum(spot_equities) / len(spot_equities)), result["AKs", "QQ"])
+
+    def test_sampled_matrix_is_reproducible_across_workers(self):
+        one = Ranges.matrix("AA, KK, AKs", "QQ+, 72o", samples=40, seed=5)
+        two = Ranges.matrix("AA, KK, AKs", "QQ+, 72o", samples=40, seed=5, workers=2)
+        self.assertFalse(one.exact)
+        numpy.testing.assert_array_equal(one.wins, two.wins)
+        numpy.testing.assert_array_equal(one.deals, two.deals)
+        self.assertGreater(one["AA", "72o"], 0.75)
+
+    def test_boards_are_tallied_in_blocks(self):
+        whole = Ranges.matrix("AA, KK, AKs", "QQ+, T9s", BOARD[:3], samples=None)
+        with mock.patch.object(Ranges, 'BLOCK', 7):
+            blocks = Ranges.matrix("AA, KK, AKs", "QQ+, T9s", BOARD[:3], samples=None, workers=2)
+        self.assertEqual(1176, blocks.boards)
+        for tallied in ('wins', 'ties', 'deals'):
+            numpy.testing.assert_array_equal(getattr(whole, tallied), getattr(blocks, tallied))
+
+    def test_completions_slice_without_listing(self):
+        boards = Ranges.Completions(range(8), 3)
+        self.assertEqual(56, len(boards))
+        self.assertEqual(list(combinations(range(8), 3))[10:20], list(boards[10:20]))
+        self.assertEqual(list(combinations(range(8), 3))[12:15], list(boards[10:20][2:5]))
+
+    def test_cache(self):
+        directory = tempfile.mkdtemp()
+        first = Ranges.matrix("AA, KK", "QQ", samples=20, seed=1, cache=directory)
+        [name] = os.listdir(directory)
+        second = Ranges.matrix("AA, KK", "QQ", samples=20, seed=1, cache=directory)
+        numpy.testing.assert_array_equal(first.equity(), second.equity())
+        self.assertEqual(first.rows, second.rows)
+        Ranges.matrix("AA, KK", "QQ", samples=20, seed=2, cache=directory)
+        self.assertEqual(2, len(os.listdir(directory)))
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+    def test_empty_range(self):
+        with self.assertRaises(ValueError):
+            Ranges.matrix("AsAh", "KK", board=["AS", "2C", "3D"])
@@ -0,0 +1,96 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import random
+import unittest
+from math import comb
+
+from poker import Evaluator
+from poker import RankIndex
+from poker import WinPatterns
+from poker.Deck import Hand
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "CDHS"]
+
+
+class TestRankIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = RankIndex.of()
+
+    def test_classes_cover_every_hand(self):
+        self.assertEqual(7462, len(self.index))
+        self.assertEqual(comb(52, 5), self.index.total)
+        self.assertEqual(comb(52, 5), self.index.between(1, len(self.index)))
+
+    def test_hands_per_category(self):
+        hands = {}
+        for rank in range(1, len(self.index) + 1):
+            pattern = Evaluator.lookup.pattern_of(self.index.strength(rank))
+            hands[pattern] = hands.get(pattern, 0) + self.index.count(rank)
+        # No wheel: five to an ace is a high card, or a flush when suited.
+        self.assertEqual({WinPatterns.RoyalFlush: 4, WinPatterns.StraightFlush: 32,
+                          WinPatterns.FourOfAKind: 624, WinPatterns.FullHouse: 3744,
+                          WinPatterns.Flush: 5112, WinPatterns.Straight: 9180,
+                          WinPatterns.ThreeOfAKind: 54912, WinPatterns.TwoPair: 123552,
+                          WinPatterns.Pair: 1098240, WinPatterns.HighCard: 1303560}, hands)
+
+    def test_best_and_worst(self):
+        self.assertEqual(1, Hand(["AS", "KS", "QS", "JS", "TS"]).rank())
+        self.assertEqual(2, Hand(["KH", "QH", "JH", "TH", "9H"]).rank())
+        worst = Hand(["7C", "5D", "4H", "3S", "2C"])
+        self.assertEqual(7462, worst.rank())
+        self.assertEqual(0.0, worst.percentile())
+        self.assertEqual(4, self.index.better(Hand(["KH", "QH", "JH", "TH", "9H"]).strength()))
+
+    def test_representatives_invert_rank(self):
+        for rank in range(1, len(self.index) + 1):
+            hand = self.index.hand(rank)
+            self.assertEqual(5, len(set(card.code for card in hand.cards)))
+            self.assertEqual(rank, hand.rank())
+
+    def test_counts_agree_with_strengths(self):
+        deal = random.Random(25)
+        hands = [Hand(deal.sample(DECK, 5)) for _ in range(200)]
+        hands.sort(key=Hand.strength)
+        for lower, higher in zip(hands, hands[1:]):
+            self.assertGreaterEqual(lower.rank(), higher.rank())
+            self.assertLessEqual(lower.percentile(), higher.percentile())
+        for hand in hands:
+            strength = hand.strength()
+            self.assertEqual(self.index.total, self.index.better(strength)
+                             + self.index.count(hand.rank()) + self.index.worse(strength))
+            self.assertEqual(self.index.better(strength), self.index.between(1, hand.rank()) -
+                             self.index.count(hand.rank()))
+
+    def test_seven_cards_rank_as_best_five(self):
+        self.assertEqual(Hand(["9H", "9C", "9D", "4S", "4C"]).rank(),
+                         self.index.rank_of(["9H", "9C", "9D", "4S", "4C", "2H", "3D"]))
+
+    def test_bad_queries(self):
+        with self.assertRaises(ValueError):
+            self.index.hand(0)
+        with self.assertRaises(ValueError):
+            self.index.strength(7463)
+        with self.assertRaises(ValueError):
+            self.index.rank(1)
+        with self.assertRaises(ValueError):
+            RankIndex.of(Evaluator.reference)
+
+
+class TestVariantIndexes(unittest.TestCase):
+    def test_short_deck(self):
+        index = RankIndex.of(Evaluator.LookupEvaluator(Evaluator.SHORT_DECK))
+        self.assertEqual(comb(36, 5), index.total)
+        # Flushes beat full houses in a short deck.
+        self.assertLess(index.rank_of(["AS", "JS", "9S", "8S", "6S"]),
+                        index.rank_of(["AS", "AH", "AD", "KS", "KH"]))
+
+    def test_lowball_merges_flushes_with_high_cards(self):
+        index = RankIndex.of(Evaluator.LookupEvaluator(Evaluator.ACE_TO_FIVE))
+        self.assertEqual(comb(52, 5), index.total)
+        self.assertEqual(1024, index.count(1))
+        self.assertEqual(["5", "4", "3", "2", "A"],
+                         sorted((card.rank for card in index.hand(1).cards),
+                                key="A2345".index, reverse=True))
@@ -0,0 +1,91 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import asyncio
+import os
+import tempfile
+import unittest
+
+from poker import Service
+from poker import WinPatterns
+
+ROYAL = ["AD", "KD", "QD", "JD", "TD"]
+PAIR = ["2C", "3S", "8S", "8D", "TD"]
+STRAIGHT = ["2S", "3C", "4D", "5H", "6S"]
+SAME_STRAIGHT = ["2H", "3D", "4C", "5S", "6D"]
+
+
+class TestService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = await Service.Server(workers=1).start()
+        host, port = self.server.address[:2]
+        self.client = await Service.Client(host, port, size=2).connect()
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_evaluate(self):
+        results = await self.client.evaluate([ROYAL, PAIR])
+        self.assertEqual([WinPatterns.order.index(WinPatterns.RoyalFlush),
+                          WinPatterns.order.index(WinPatterns.Pair)], [score for _, score in results])
+
+    async def test_showdown_with_split_pot(self):
+        results = await self.client.showdown([[PAIR, STRAIGHT], [STRAIGHT, PAIR, SAME_STRAIGHT]])
+        self.assertEqual([[1], [0, 2]], results)
+
+    async def test_pipelined_requests(self):
+        replies = await asyncio.gather(*(self.client.showdown([[PAIR, ROYAL]]) for _ in range(50)))
+        self.assertEqual([[[1]]] * 50, replies)
+        self.assertEqual(50, len(self.client.latencies))
+        self.assertIsNotNone(self.client.percentiles()["p99"])
+
+    async def test_error_reply(self):
+        with self.assertRaisesRegex(ValueError, "not a card"):
+            await self.client.evaluate([["ZZ", "KD", "QD", "JD", "TD"]])
+        with self.assertRaisesRegex(ValueError, "unknown op"):
+            await self.client.request("shuffle")
+
+    async def test_short_hand_is_an_error(self):
+        with self.assertRaisesRegex(ValueError, "5 to 7 cards"):
+            await self.client.evaluate([["AS", "KS", "QS"]])
+        with self.assertRaisesRegex(ValueError, "5 to 7 cards"):
+            await self.client.showdown([[ROYAL, ["AS"]]])
+        self.assertEqual([[0]], await self.client.showdown([[ROYAL, PAIR]]))
+
+    async def test_non_object_frame_is_an_error(self):
+        host, port = self.server.address[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(Service.frame(["evaluate"]))
+            reply = await Service.read_frame(reader)
+        finally:
+            writer.close()
+        self.assertIsNone(reply["id"])
+        self.assertIn("JSON object", reply["error"])
+
+    async def test_server_stats(self):
+        await self.client.evaluate([ROYAL])
+        stats = await self.client.stats()
+        self.assertGreaterEqual(stats["requests"], 1)
+        self.assertEqual(2, stats["connections"])
+        self.assertIn("p50", stats)
+
+
+class TestUnixSocket(unittest.IsolatedAsyncioTestCase):
+    async def test_round_trip(self):
+        path = os.path.join(tempfile.mkdtemp(), "poker.sock")
+        server = await Service.Server(workers=1).start(path=path)
+        try:
+            async with Service.Client(path=path, size=1) as client:
+                self.assertEqual([[0]], await client.showdown([[ROYAL, PAIR]]))
+        finally:
+            await server.close()
+            os.remove(path)
+
+
+class TestPercentiles(unittest.TestCase):
+    def test_nearest_rank(self):
+        self.assertEqual({"p50": 51, "p90": 91, "p99": 100}, Service.percentiles(range(1, 101)))
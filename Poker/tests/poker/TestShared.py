@@ -0,0 +1,94 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import random
+import unittest
+
+from poker import Cli
+from poker import Evaluator
+from poker import Shared
+from poker.Deck import Card, Hand
+
+
+def deals(count, size, seed=2024):
+    deal = random.Random(seed)
+    return [deal.sample(range(52), size) for _ in range(count)]
+
+
+class TestSharedTables(unittest.TestCase):
+    def setUp(self):
+        self.tables = Shared.SharedTables()
+
+    def tearDown(self):
+        self.tables.close()
+        self.tables.unlink()
+
+    def test_attached_evaluator_matches_own_tables(self):
+        attached = Shared.SharedTables(self.tables.name)
+        evaluator = attached.install(Evaluator.LookupEvaluator())
+        try:
+            self.assertIsInstance(evaluator.best_products, Shared.TableCache.ProductView)
+            for size in (5, 6, 7):
+                for codes in deals(300, size):
+                    self.assertEqual(Evaluator.lookup.strength_of_codes(codes),
+                                     evaluator.strength_of_codes(codes), codes)
+        finally:
+            attached.close()
+        self.assertIsNone(evaluator.products)
+        self.assertFalse(attached.owner)
+
+    def test_other_rules_are_refused(self):
+        with self.assertRaises(ValueError):
+            self.tables.install(Evaluator.LookupEvaluator(Evaluator.ACE_LOW))
+
+    def test_unlinked_blocks_cannot_be_attached(self):
+        with Shared.SharedTables() as tables:
+            name = tables.name
+        with self.assertRaises(FileNotFoundError):
+            Shared.SharedTables(name)
+
+
+class TestSharedStrengthCache(unittest.TestCase):
+    def test_filled_by_one_read_by_another(self):
+        with Shared.SharedStrengthCache() as cache:
+            attached = Shared.SharedStrengthCache(cache.name)
+            try:
+                hands = deals(200, 5)
+                for codes in hands:
+                    self.assertEqual(Evaluator.lookup.strength_of_codes(codes),
+                                     cache.strength_of_codes(codes))
+                for codes in hands:
+                    attached.strength_of_codes(codes[::-1])
+                self.assertEqual({"hits": 200, "misses": 0}, attached.info())
+            finally:
+                attached.close()
+
+    def test_hand_cache(self):
+        with Shared.SharedStrengthCache() as cache:
+            Hand.cache = cache
+            try:
+                hand = Hand(["JH", "7H", "7D", "7C", "7S"])
+                self.assertEqual(Evaluator.lookup.strength(hand), hand.strength())
+                self.assertEqual(1, cache.info()["misses"])
+                six = Hand(["JH", "7H", "7D", "7C", "7S", "2C"])
+                self.assertEqual(Evaluator.lookup.strength(six), six.strength())
+                self.assertEqual(1, cache.info()["misses"])
+            finally:
+                Hand.cache = None
+
+    def test_colex_ranks_span_the_cache(self):
+        # The lowest five codes rank first and the highest five last.
+        self.assertEqual(0, sum(Shared.BINOMIALS[k][k - 1] for k in range(1, 6)))
+        self.assertEqual(Shared.HANDS - 1, sum(Shared.BINOMIALS[k][46 + k] for k in range(1, 6)))
+
+
+class TestPool(unittest.TestCase):
+    def test_workers_use_shared_blocks(self):
+        hands = [[Card.by_code[code].name for code in codes] for codes in deals(50, 5)]
+        with Shared.pool(2, cache=True) as pool:
+            strengths = pool.map(Cli.strength_of, hands)
+            names = pool.apply(Shared.names)
+        self.assertEqual([Cli.strength_of(hand) for hand in hands], strengths)
+        self.assertEqual(2, len(names))
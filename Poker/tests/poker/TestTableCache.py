@@ -0,0 +1,153 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from poker.Deck import Card
+from poker import Evaluator
+from poker import TableCache
+
+TABLES = {'flushes': [None] * 8191 + [7], 'products': {2 ** 40 * 3: 5, 6: 1}}
+
+
+class TestTableFile(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "tables.bin")
+        TableCache.write(self.path, "test", TABLES)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_round_trip(self):
+        with TableCache.TableFile(self.path, "test") as tables:
+            self.assertEqual(TABLES['flushes'], tables.table('flushes'))
+            self.assertEqual(TABLES['products'], tables.table('products'))
+
+    def test_sections_are_views_of_the_mapping(self):
+        with TableCache.TableFile(self.path) as tables:
+            flushes = tables.view('flushes')
+            products = tables.view('products')
+            self.assertEqual([None, 7], [flushes[0], flushes[8191]])
+            self.assertEqual(8192, len(flushes))
+            self.assertEqual((5, 1, None), (products[2 ** 40 * 3], products.get(6), products.get(7)))
+            self.assertNotIn(30, products)
+            self.assertEqual(2, len(products))
+            self.assertEqual(TABLES['products'], dict(products.items()))
+            with self.assertRaises(KeyError):
+                products[10]
+            flushes.release()
+            products.release()
+
+    def test_collisions_are_probed(self):
+        table = {product: product % 1000 for product in range(7, 7 * 400, 7)}
+        tables = TableCache.Tables(TableCache.pack("test", {'products': table}), "image")
+        products = tables.view('products')
+        self.assertEqual(table, {product: products[product] for product in table})
+        self.assertEqual(table, tables.table('products'))
+        products.release()
+
+    def test_damage_is_detected(self):
+        with open(self.path, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 1]))
+        with self.assertRaises(ValueError):
+            TableCache.TableFile(self.path)
+
+    def test_truncation_is_detected(self):
+        with open(self.path, 'r+b') as f:
+            f.truncate(os.path.getsize(self.path) - 8)
+        with self.assertRaises(ValueError):
+            TableCache.TableFile(self.path)
+
+    def test_other_keys_are_refused(self):
+        with self.assertRaises(ValueError):
+            TableCache.TableFile(self.path, "other")
+
+
+class TestEvaluatorCache(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        environment = mock.patch.dict(os.environ, POKER_TABLES=self.folder)
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def test_built_once_then_loaded(self):
+        built = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        built.build()
+        self.assertIsNone(built.best_products)
+        self.assertEqual(1, len(os.listdir(self.folder)))
+        built.build_best()
+        self.assertEqual(1, len(os.listdir(self.folder)))
+        loaded = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        loaded.build()
+        self.assertIsNone(loaded.best_products)
+        loaded.build_best()
+        for name in built.FIVE_CARD_TABLES:
+            self.assertEqual(getattr(built, name), getattr(loaded, name), name)
+        self.assertEqual(built.best_flushes, list(loaded.best_flushes))
+        self.assertEqual(built.best_products, dict(loaded.best_products.items()))
+
+    def test_best_tables_are_read_in_place(self):
+        built = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        built.build_best()
+        loaded = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        loaded.build_best()
+        self.assertIsInstance(loaded.best_flushes, TableCache.MaskView)
+        self.assertIsInstance(loaded.best_products, TableCache.ProductView)
+        codes = [Card(name).code for name in ["AS", "KS", "QS", "JS", "TS", "9H", "6C"]]
+        self.assertEqual(built.strength_of_codes(codes), loaded.strength_of_codes(codes))
+        image = TableCache.pack("test", {name: getattr(loaded, name) for name in loaded.BEST_TABLES})
+        tables = TableCache.Tables(image, "image")
+        self.assertEqual(built.best_flushes, tables.table('best_flushes'))
+        self.assertEqual(built.best_products, tables.table('best_products'))
+
+    def test_missing_best_tables_are_built(self):
+        Evaluator.LookupEvaluator(Evaluator.SHORT_DECK).build()
+        evaluator = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        self.assertIsNone(TableCache.mapped(evaluator.table_key(), evaluator.BEST_TABLES))
+        evaluator.build_best()
+        self.assertIsInstance(evaluator.best_products, dict)
+
+    def test_damaged_cache_is_rebuilt(self):
+        Evaluator.LookupEvaluator(Evaluator.SHORT_DECK).build()
+        path = os.path.join(self.folder, os.listdir(self.folder)[0])
+        with open(path, 'r+b') as f:
+            f.truncate(100)
+        evaluator = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        evaluator.build()
+        with TableCache.TableFile(path, evaluator.table_key()) as tables:
+            self.assertEqual(evaluator.products, tables.table('products'))
+
+    def test_rules_have_separate_files(self):
+        self.assertNotEqual(Evaluator.LookupEvaluator(Evaluator.STANDARD).table_key(),
+                            Evaluator.LookupEvaluator(Evaluator.ACE_LOW).table_key())
+        self.assertNotEqual(Evaluator.joker_poker.table_key(), Evaluator.deuces_wild.table_key())
+
+    def test_off_when_empty(self):
+        os.environ['POKER_TABLES'] = ''
+        evaluator = Evaluator.LookupEvaluator(Evaluator.SHORT_DECK)
+        evaluator.build()
+        self.assertIsNone(evaluator.best_products)
+        self.assertEqual([], os.listdir(self.folder))
+
+
+class TestImport(unittest.TestCase):
+    def test_importing_poker_builds_nothing(self):
+        script = ("import poker.Poker, poker.Evaluator as E; "
+                  "print(E.lookup.products is None, E.joker_poker.products is None)")
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+                                check=True).stdout
+        self.assertEqual("True True", output.strip())
@@ -0,0 +1,10 @@
+'''
+Created on Oct 18, 2026
+
+@author: Daniel
+'''
+import os
+
+# Tests build evaluator tables in memory rather than in the user's table
+# cache; TestTableCache points the cache at a folder of its own.
+os.environ.setdefault('POKER_TABLES', '')